@@ -38,6 +38,9 @@ Example:
     ```
 """
 
+from opendart_fss.batching import MicroBatcher
+from opendart_fss.bulk import BulkExecutor
+from opendart_fss.cache import MemoryCache, ResponseCache
 from opendart_fss.client import OpenDartClient
 from opendart_fss.constants import (
     CorpClass,
@@ -46,15 +49,24 @@ from opendart_fss.constants import (
     ReportCode,
     StatusCode,
 )
+from opendart_fss.decoding import DecodeOptions
 from opendart_fss.exceptions import (
     APIError,
     AuthenticationError,
+    DownloadTooLargeError,
+    NoAvailableKeyError,
     NotFoundError,
     OpenDartError,
+    QuotaExceededError,
     RateLimitError,
     ServerError,
     ValidationError,
 )
+from opendart_fss.key_pool import APIKeyPool
+from opendart_fss.quota import Priority, QuotaManager
+from opendart_fss.rate_limiter import RateLimiter
+from opendart_fss.retry import RetryPolicy
+from opendart_fss.stats import ClientStats
 
 try:
     from opendart_fss._version import __version__
@@ -63,6 +75,18 @@ except ImportError:
 __all__ = [
     # Client
     "OpenDartClient",
+    "APIKeyPool",
+    "BulkExecutor",
+    "MicroBatcher",
+    "DecodeOptions",
+    "RateLimiter",
+    "QuotaManager",
+    "Priority",
+    "RetryPolicy",
+    "ClientStats",
+    # Cache
+    "ResponseCache",
+    "MemoryCache",
     # Constants
     "StatusCode",
     "ReportCode",
@@ -77,4 +101,7 @@ __all__ = [
     "ValidationError",
     "NotFoundError",
     "ServerError",
+    "DownloadTooLargeError",
+    "NoAvailableKeyError",
+    "QuotaExceededError",
 ]
@@ -1,19 +1,44 @@
-"""OpenDART API 클래스."""
+"""OpenDART API 클래스.
+
+각 API 모듈은 모델 정의를 함께 불러오므로 처음 사용할 때 지연 로드합니다.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from opendart_fss.api.base import BaseAPI
-from opendart_fss.api.disclosure import DisclosureAPI
-from opendart_fss.api.financial import FinancialAPI
-from opendart_fss.api.major_event import MajorEventAPI
-from opendart_fss.api.registration import RegistrationAPI
-from opendart_fss.api.report import ReportAPI
-from opendart_fss.api.shareholder import ShareholderAPI
+
+if TYPE_CHECKING:
+    from opendart_fss.api.disclosure import DisclosureAPI
+    from opendart_fss.api.financial import FinancialAPI
+    from opendart_fss.api.major_event import MajorEventAPI
+    from opendart_fss.api.registration import RegistrationAPI
+    from opendart_fss.api.report import ReportAPI
+    from opendart_fss.api.shareholder import ShareholderAPI
+
+_MODULES = {
+    "DisclosureAPI": "disclosure",
+    "ReportAPI": "report",
+    "FinancialAPI": "financial",
+    "ShareholderAPI": "shareholder",
+    "MajorEventAPI": "major_event",
+    "RegistrationAPI": "registration",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
 
 __all__ = [
     "BaseAPI",
     "DisclosureAPI",
-    "ReportAPI",
     "FinancialAPI",
-    "ShareholderAPI",
     "MajorEventAPI",
     "RegistrationAPI",
+    "ReportAPI",
+    "ShareholderAPI",
 ]
@@ -1,17 +1,75 @@
 """API 기본 클래스."""
 
-from typing import TYPE_CHECKING
+import asyncio
+import os
+import re
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, BinaryIO, cast
 
 import httpx
 import msgspec
 
+from opendart_fss.cache.base import cache_key
 from opendart_fss.constants import BASE_URL
-from opendart_fss.exceptions import raise_for_status
+from opendart_fss.decoding import (
+    DecodeOptions,
+    decode_type,
+    decoder_for,
+    intern_items,
+)
+from opendart_fss.exceptions import (
+    DownloadTooLargeError,
+    NoAvailableKeyError,
+    QuotaExceededError,
+    raise_for_status,
+)
+from opendart_fss.models.base import BaseResponse
 
 if TYPE_CHECKING:
     from opendart_fss.client import OpenDartClient
 
 
+def _normalize_params(params: dict) -> tuple[tuple[str, str], ...]:
+    """인증키를 제외한 파라미터를 정렬된 튜플로 정규화."""
+    return tuple(sorted((k, str(v)) for k, v in params.items() if k != "crtfc_key"))
+
+
+_XML_STATUS = re.compile(rb"<status>\s*(\d{3})\s*</status>")
+_XML_MESSAGE = re.compile(rb"<message>(.*?)</message>", re.DOTALL)
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _raise_for_error_body(chunk: bytes) -> None:
+    """파일 대신 반환된 오류 응답(XML/JSON)이면 예외 발생."""
+    if chunk.startswith(b"PK"):  # ZIP
+        return
+    head = chunk.lstrip()
+    if head.startswith(b"{"):
+        try:
+            result = decoder_for(BaseResponse).decode(head)
+        except msgspec.DecodeError:
+            return
+        raise_for_status(result.status, result.message)
+    elif match := _XML_STATUS.search(chunk):
+        message = _XML_MESSAGE.search(chunk)
+        raise_for_status(
+            match.group(1).decode(),
+            message.group(1).decode(errors="replace") if message else None,
+        )
+
+
+class _Inflight:
+    """진행 중인 요청과 대기자 수."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
 class BaseAPI:
     """API 기본 클래스."""
 
@@ -22,9 +80,71 @@ class BaseAPI:
     def _http(self) -> httpx.AsyncClient:
         return self._client._http
 
-    @property
-    def _api_key(self) -> str:
-        return self._client.api_key
+    def _build_params(self, params: dict | None) -> dict:
+        """요청 파라미터 생성 (None 값 제외, 인증키는 전송 시 추가)."""
+        if not params:
+            return {}
+        return {k: v for k, v in params.items() if v is not None}
+
+    async def _resolve_corp_code(self, corp_code: str) -> str:
+        """`resolve_corp_codes`가 켜져 있으면 종목코드·회사명을 고유번호로 변환."""
+        if not self._client.resolve_corp_codes:
+            return corp_code
+        return await self._client.corp_codes.resolve(corp_code)
+
+    async def _with_retry[R](self, send: Callable[[dict], Awaitable[R]]) -> R:
+        """클라이언트 재시도 정책에 따라 `send`를 실행.
+
+        `send`는 인증키 파라미터(`{"crtfc_key": ...}`)를 받습니다. 키 풀을 쓰는
+        경우 한도 초과나 인증 오류를 받은 키는 제외하고 다른 키로 바로 다시
+        보내며, 이는 재시도 횟수에 포함되지 않습니다. 할당량 관리자가 거절한
+        키도 같은 방식으로 다른 키로 바꾸며, 모든 키가 거절되면
+        `QuotaExceededError`가 발생합니다.
+        """
+        client = self._client
+        policy = client.retry_policy
+        stats = client.stats
+        attempt = 0
+        rejected: set[str] = set()  # 이번 요청에서 할당량이 거절된 키
+        quota_error: QuotaExceededError | None = None
+        while True:
+            try:
+                api_key = await client._acquire_key(rejected)
+            except NoAvailableKeyError:
+                if quota_error is None:
+                    raise
+                raise quota_error from None
+            if client.quota is not None:
+                try:
+                    await client.quota.acquire(api_key)
+                except QuotaExceededError as exc:
+                    if client.key_pool is None:
+                        raise
+                    client.key_pool.report_error(api_key, exc)
+                    rejected.add(api_key)
+                    quota_error = exc
+                    continue
+            await client._rate_limiter_for(api_key).acquire()
+            stats.requests += 1
+            try:
+                return await send({"crtfc_key": api_key})
+            except Exception as exc:
+                pool = client.key_pool
+                if (
+                    pool is not None
+                    and pool.report_error(api_key, exc)
+                    and pool.available_keys()
+                ):
+                    stats.record_retry(exc, 0.0)
+                    continue
+
+                attempt += 1
+                if not policy.should_retry(exc, attempt):
+                    stats.failures += 1
+                    raise
+                delay = policy.compute_delay(attempt)
+                stats.record_retry(exc, delay)
+                await asyncio.sleep(delay)
 
     async def _request[T: msgspec.Struct](
         self,
@@ -33,22 +153,96 @@ class BaseAPI:
         response_type: type[T],
         *,
         params: dict | None = None,
+        options: DecodeOptions | None = None,
     ) -> T:
-        """API 요청 수행."""
+        """API 요청 수행.
+
+        클라이언트에 캐시가 설정되어 있으면 캐시를 먼저 조회하고, 요청 병합이
+        켜져 있으면 동일한 엔드포인트와 파라미터로 진행 중인 요청에 합류해
+        같은 디코딩 결과를 공유합니다. `options`를 생략하면 클라이언트의
+        디코딩 옵션을 사용합니다. `corp_code` 파라미터는 캐시·병합 키를 만들기
+        전에 고유번호로 변환하므로 종목코드와 고유번호 요청이 결과를 공유합니다.
+        """
         url = f"{BASE_URL}{endpoint}"
-        request_params = {"crtfc_key": self._api_key}
-        if params:
-            request_params.update({k: v for k, v in params.items() if v is not None})
+        request_params = self._build_params(params)
+        if "corp_code" in request_params:
+            request_params["corp_code"] = await self._resolve_corp_code(
+                request_params["corp_code"]
+            )
+        options = options or self._client.decode_options
+        target = decode_type(response_type, options)
+        decoder = decoder_for(response_type, options)
+
+        cache = self._client.cache
+        key: str | None = None
+        ttl: float | None = None
+        if cache is not None:
+            ttl = cache.ttl_for(endpoint, request_params)
+            if ttl != 0:
+                variant = target.__name__ if target is not response_type else None
+                key = cache_key(endpoint, request_params, variant)
+                cached = await cache.get(key, target)
+                if cached is not None:
+                    self._client.stats.cache_hits += 1
+                    if options.intern:
+                        _intern_result(cached)
+                    # 옵션을 반영한 타입(target)은 raw 목록 등 T와 다른 구조일 수 있음
+                    return cast(T, cached)
+                self._client.stats.cache_misses += 1
+
+        async def send(auth: dict) -> T:
+            response = await self._http.request(
+                method, url, params={**auth, **request_params}
+            )
+            response.raise_for_status()
+
+            result = decoder.decode(response.content)
+
+            if hasattr(result, "status"):
+                raise_for_status(result.status, getattr(result, "message", None))
 
-        response = await self._http.request(method, url, params=request_params)
-        response.raise_for_status()
+            if options.intern:
+                _intern_result(result)
 
-        result = msgspec.json.decode(response.content, type=response_type)
+            if cache is not None and key is not None:
+                await cache.set(key, result, response.content, ttl)
 
-        if hasattr(result, "status"):
-            raise_for_status(result.status, getattr(result, "message", None))
+            return result
 
-        return result
+        if not self._client.coalesce_requests:
+            return await self._with_retry(send)
+
+        inflight_key = (
+            method,
+            endpoint,
+            target,
+            _normalize_params(request_params),
+        )
+        inflight = self._client._inflight
+        entry = inflight.get(inflight_key)
+        if entry is None:
+            entry = _Inflight(asyncio.ensure_future(self._with_retry(send)))
+            inflight[inflight_key] = entry
+
+            def _done(t: asyncio.Future) -> None:
+                if inflight.get(inflight_key) is entry:
+                    del inflight[inflight_key]
+                if not t.cancelled():
+                    t.exception()  # 모든 대기자가 취소된 경우 경고 방지
+
+            entry.task.add_done_callback(_done)
+        else:
+            self._client.stats.coalesced += 1
+
+        # 한 호출자의 취소가 다른 대기자의 요청을 취소하지 않도록 보호하고,
+        # 마지막 대기자가 취소되면 요청도 취소
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.task)
+        finally:
+            entry.waiters -= 1
+            if not entry.waiters:
+                entry.task.cancel()
 
     async def _get[T: msgspec.Struct](
         self,
@@ -56,17 +250,145 @@ class BaseAPI:
         response_type: type[T],
         *,
         params: dict | None = None,
+        options: DecodeOptions | None = None,
     ) -> T:
         """GET 요청."""
-        return await self._request("GET", endpoint, response_type, params=params)
+        return await self._request(
+            "GET", endpoint, response_type, params=params, options=options
+        )
 
-    async def _download(self, endpoint: str, *, params: dict | None = None) -> bytes:
-        """파일 다운로드 (ZIP, XML 등)."""
+    def _decoded_options(self, *required: str) -> DecodeOptions:
+        """여러 응답을 합치는 메서드용 옵션.
+
+        raw 모드에서도 항목을 디코딩하며, 필드를 선택한 경우 `required`
+        필드를 함께 디코딩합니다.
+        """
+        return self._client.decode_options.require(*required)
+
+    async def _stream(
+        self,
+        endpoint: str,
+        *,
+        params: dict | None = None,
+        max_size: int | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """파일을 청크 단위로 스트리밍 다운로드.
+
+        첫 청크를 받기 전까지의 실패만 재시도합니다. `max_size`를 생략하면
+        클라이언트의 `max_download_size`를 사용합니다.
+
+        Raises:
+            DownloadTooLargeError: 다운로드 크기가 제한을 넘은 경우
+        """
         url = f"{BASE_URL}{endpoint}"
-        request_params = {"crtfc_key": self._api_key}
-        if params:
-            request_params.update({k: v for k, v in params.items() if v is not None})
+        request_params = self._build_params(params)
+        limit = self._client.max_download_size if max_size is None else max_size
+
+        async def open_stream(
+            auth: dict,
+        ) -> tuple[httpx.Response, AsyncIterator[bytes], bytes]:
+            request = self._http.build_request(
+                "GET", url, params={**auth, **request_params}
+            )
+            response = await self._http.send(request, stream=True)
+            try:
+                response.raise_for_status()
+                length = response.headers.get("content-length")
+                if limit is not None and length and int(length) > limit:
+                    raise DownloadTooLargeError(limit)
+                chunks = response.aiter_bytes(chunk_size)
+                first = await anext(chunks, b"")
+                _raise_for_error_body(first)
+            except BaseException:
+                await response.aclose()
+                raise
+            return response, chunks, first
+
+        response, chunks, chunk = await self._with_retry(open_stream)
+        try:
+            total = 0
+            while chunk:
+                total += len(chunk)
+                if limit is not None and total > limit:
+                    raise DownloadTooLargeError(limit)
+                yield chunk
+                chunk = await anext(chunks, b"")
+        finally:
+            await response.aclose()
+
+    async def _save(
+        self,
+        endpoint: str,
+        dest: str | os.PathLike[str] | BinaryIO,
+        *,
+        params: dict | None = None,
+        max_size: int | None = None,
+    ) -> int:
+        """파일을 경로 또는 파일 객체에 스트리밍 저장.
+
+        경로에 저장할 때는 임시 파일에 받은 뒤 완료 시 교체하므로 실패해도
+        불완전한 파일이 남지 않습니다. 파일 열기와 쓰기는 이벤트 루프를 막지
+        않도록 별도 스레드에서 실행합니다.
+
+        Returns:
+            저장한 바이트 수
+        """
+        stream = self._stream(endpoint, params=params, max_size=max_size)
+        if not isinstance(dest, (str, os.PathLike)):
+            return await _write_chunks(stream, dest)
+
+        path = os.fspath(dest)
+        directory, name = os.path.split(os.path.abspath(path))
+        # 같은 경로에 동시에 저장해도 임시 파일이 겹치지 않도록 고유한 이름 사용
+        fd, part = await asyncio.to_thread(
+            tempfile.mkstemp, prefix=f".{name}.", suffix=".part", dir=directory
+        )
+        try:
+            fp = await asyncio.to_thread(os.fdopen, fd, "wb")
+            try:
+                written = await _write_chunks(stream, fp)
+            finally:
+                await asyncio.to_thread(fp.close)
+            await asyncio.to_thread(os.replace, part, path)
+        except BaseException:
+            await asyncio.to_thread(_remove_part, part)
+            raise
+        return written
+
+    async def _download(
+        self,
+        endpoint: str,
+        *,
+        params: dict | None = None,
+        max_size: int | None = None,
+    ) -> bytes:
+        """파일 다운로드 (ZIP, XML 등)."""
+        return b"".join(
+            [
+                chunk
+                async for chunk in self._stream(
+                    endpoint, params=params, max_size=max_size
+                )
+            ]
+        )
+
+
+def _intern_result(result: msgspec.Struct) -> None:
+    items = getattr(result, "items", None)
+    if isinstance(items, list):
+        intern_items(items)
+
+
+def _remove_part(part: str) -> None:
+    """남은 임시 파일 삭제."""
+    if os.path.exists(part):
+        os.remove(part)
+
 
-        response = await self._http.get(url, params=request_params)
-        response.raise_for_status()
-        return response.content
+async def _write_chunks(stream: AsyncIterator[bytes], fp: BinaryIO) -> int:
+    written = 0
+    async for chunk in stream:
+        await asyncio.to_thread(fp.write, chunk)
+        written += len(chunk)
+    return written
@@ -1,6 +1,27 @@
 """DS001 공시정보 API."""
 
+import asyncio
+import calendar
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import BinaryIO
+
 from opendart_fss.api.base import BaseAPI
+from opendart_fss.bulk import DEFAULT_CONCURRENCY
+from opendart_fss.cache.base import cache_key
+from opendart_fss.corp_codes import (
+    CorpCodeDiff,
+    CorpCodeIndex,
+    MappedCorpCodeIndex,
+    iter_corp_codes,
+    refresh_index,
+    write_index,
+)
+from opendart_fss.exceptions import NotFoundError
 from opendart_fss.models.disclosure import (
     Company,
     CompanyResponse,
@@ -8,6 +29,36 @@ from opendart_fss.models.disclosure import (
     DisclosureListResponse,
 )
 
+# 공시검색 페이지당 최대 건수
+MAX_PAGE_COUNT = 100
+
+# 고유번호 없이 공시검색할 때 허용되는 최대 기간 (개월)
+MAX_SEARCH_MONTHS = 3
+
+
+def _date_windows(bgn_de: str, end_de: str, months: int) -> list[tuple[str, str]]:
+    """기간을 `months`개월 이하의 구간으로 분할 (YYYYMMDD)."""
+    start = datetime.strptime(bgn_de, "%Y%m%d").date()
+    end = datetime.strptime(end_de, "%Y%m%d").date()
+    windows = []
+    while start <= end:
+        index = start.month - 1 + months
+        year, month = start.year + index // 12, index % 12 + 1
+        day = min(start.day, calendar.monthrange(year, month)[1])
+        stop = min(end, date(year, month, day) - timedelta(days=1))
+        windows.append((start.strftime("%Y%m%d"), stop.strftime("%Y%m%d")))
+        start = stop + timedelta(days=1)
+    return windows
+
+
+def _is_fresh(path: str | os.PathLike[str], max_age: float | None) -> bool:
+    """인덱스 파일이 있고 `max_age`초보다 오래되지 않았는지 여부."""
+    try:
+        modified = os.path.getmtime(path)
+    except FileNotFoundError:
+        return False
+    return max_age is None or time.time() - modified < max_age
+
 
 class DisclosureAPI(BaseAPI):
     """공시정보 API (DS001)."""
@@ -64,9 +115,249 @@ class DisclosureAPI(BaseAPI):
         )
         return response.items
 
+    async def iter_search(
+        self,
+        *,
+        corp_code: str | None = None,
+        bgn_de: str | None = None,
+        end_de: str | None = None,
+        last_reprt_at: str | None = None,
+        pblntf_ty: str | None = None,
+        pblntf_detail_ty: str | None = None,
+        corp_cls: str | None = None,
+        sort: str | None = None,
+        sort_mth: str | None = None,
+        page_count: int = MAX_PAGE_COUNT,
+        concurrency: int = 1,
+    ) -> AsyncIterator[Disclosure]:
+        """공시검색 결과 전체를 페이지 단위로 조회하며 반환.
+
+        첫 페이지의 `total_page`를 보고 남은 페이지를 최대 `concurrency`개씩
+        미리 요청하며, 결과는 원래 정렬 순서대로 반환합니다. 기본값(1)이면
+        한 번에 한 페이지만 메모리에 유지합니다. 검색 결과가 없으면 아무것도
+        반환하지 않습니다.
+
+        Args:
+            corp_code: 고유번호 (8자리)
+            bgn_de: 시작일 (YYYYMMDD)
+            end_de: 종료일 (YYYYMMDD)
+            last_reprt_at: 최종보고서만 검색여부 (Y/N)
+            pblntf_ty: 공시유형 (A~J)
+            pblntf_detail_ty: 공시상세유형
+            corp_cls: 법인구분 (Y/K/N/E)
+            sort: 정렬 기준 (date/crp/rpt)
+            sort_mth: 정렬 방법 (asc/desc)
+            page_count: 페이지당 건수 (최대 100)
+            concurrency: 동시에 요청할 페이지 수
+
+        Yields:
+            공시
+
+        Raises:
+            ValueError: `concurrency`가 1보다 작은 경우
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        params: dict = {
+            "corp_code": corp_code,
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "last_reprt_at": last_reprt_at,
+            "pblntf_ty": pblntf_ty,
+            "pblntf_detail_ty": pblntf_detail_ty,
+            "corp_cls": corp_cls,
+            "sort": sort,
+            "sort_mth": sort_mth,
+            "page_count": page_count,
+        }
+        try:
+            first = await self._search_page({**params, "page_no": 1})
+        except NotFoundError:
+            return
+        for item in first.items:
+            yield item
+        if not first.items:
+            return
+
+        pages = iter(range(2, (first.total_page or 1) + 1))
+        window: deque[asyncio.Task[DisclosureListResponse]] = deque()
+
+        def fill() -> None:
+            for page_no in islice(pages, concurrency - len(window)):
+                window.append(
+                    asyncio.ensure_future(
+                        self._search_page({**params, "page_no": page_no})
+                    )
+                )
+
+        try:
+            fill()
+            while window:
+                response = await window.popleft()
+                for item in response.items:
+                    yield item
+                fill()
+        finally:
+            for task in window:
+                if not task.cancel() and not task.cancelled():
+                    task.exception()  # 이미 실패한 페이지의 경고 방지
+
+    async def search_all(
+        self,
+        *,
+        corp_code: str | None = None,
+        bgn_de: str | None = None,
+        end_de: str | None = None,
+        last_reprt_at: str | None = None,
+        pblntf_ty: str | None = None,
+        pblntf_detail_ty: str | None = None,
+        corp_cls: str | None = None,
+        sort: str | None = None,
+        sort_mth: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[Disclosure]:
+        """공시검색 결과 전체를 여러 페이지 동시 요청으로 조회.
+
+        첫 페이지로 전체 페이지 수를 확인한 뒤 나머지 페이지를 동시에
+        요청합니다. 요청은 클라이언트의 Rate Limiter를 따릅니다.
+
+        Args:
+            corp_code: 고유번호 (8자리)
+            bgn_de: 시작일 (YYYYMMDD)
+            end_de: 종료일 (YYYYMMDD)
+            last_reprt_at: 최종보고서만 검색여부 (Y/N)
+            pblntf_ty: 공시유형 (A~J)
+            pblntf_detail_ty: 공시상세유형
+            corp_cls: 법인구분 (Y/K/N/E)
+            sort: 정렬 기준 (date/crp/rpt)
+            sort_mth: 정렬 방법 (asc/desc)
+            concurrency: 동시에 요청할 페이지 수
+
+        Returns:
+            원래 정렬 순서의 공시 목록
+        """
+        return [
+            item
+            async for item in self.iter_search(
+                corp_code=corp_code,
+                bgn_de=bgn_de,
+                end_de=end_de,
+                last_reprt_at=last_reprt_at,
+                pblntf_ty=pblntf_ty,
+                pblntf_detail_ty=pblntf_detail_ty,
+                corp_cls=corp_cls,
+                sort=sort,
+                sort_mth=sort_mth,
+                concurrency=concurrency,
+            )
+        ]
+
+    async def search_range(
+        self,
+        bgn_de: str,
+        end_de: str,
+        *,
+        corp_code: str | None = None,
+        last_reprt_at: str | None = None,
+        pblntf_ty: str | None = None,
+        pblntf_detail_ty: str | None = None,
+        corp_cls: str | None = None,
+        sort_mth: str | None = None,
+        window_months: int = MAX_SEARCH_MONTHS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[Disclosure]:
+        """긴 기간의 공시검색.
+
+        `corp_code` 없이 검색하면 OpenDART가 기간을 3개월로 제한하므로 기간을
+        `window_months` 단위로 나눕니다. 모든 구간의 첫 페이지를 동시에 요청해
+        전체 페이지 수를 확인한 뒤 나머지 페이지를 최대 `concurrency`개씩
+        요청하며, 결과는 접수일자 순서(`sort_mth`, 기본 내림차순)로 합치고
+        접수번호 기준으로 중복을 제거합니다.
+
+        Args:
+            bgn_de: 시작일 (YYYYMMDD)
+            end_de: 종료일 (YYYYMMDD)
+            corp_code: 고유번호 (8자리, 지정하면 기간을 나누지 않음)
+            last_reprt_at: 최종보고서만 검색여부 (Y/N)
+            pblntf_ty: 공시유형 (A~J)
+            pblntf_detail_ty: 공시상세유형
+            corp_cls: 법인구분 (Y/K/N/E)
+            sort_mth: 정렬 방법 (asc/desc)
+            window_months: 구간 길이 (개월)
+            concurrency: 동시 요청 수
+
+        Returns:
+            공시 목록
+        """
+        windows = (
+            _date_windows(bgn_de, end_de, window_months)
+            if corp_code is None
+            else [(bgn_de, end_de)]
+        )
+        if sort_mth != "asc":
+            windows.reverse()
+        params = {
+            "corp_code": corp_code,
+            "last_reprt_at": last_reprt_at,
+            "pblntf_ty": pblntf_ty,
+            "pblntf_detail_ty": pblntf_detail_ty,
+            "corp_cls": corp_cls,
+            "sort": "date",
+            "sort_mth": sort_mth,
+            "page_count": MAX_PAGE_COUNT,
+        }
+
+        async def fetch(window: int, page_no: int) -> DisclosureListResponse | None:
+            start, end = windows[window]
+            try:
+                return await self._search_page(
+                    {**params, "bgn_de": start, "end_de": end, "page_no": page_no}
+                )
+            except NotFoundError:
+                return None
+
+        pages: dict[tuple[int, int], list[Disclosure]] = {}
+        remaining: list[tuple[int, int]] = []
+
+        async def run(calls: list[tuple[int, int]]) -> None:
+            async for call, result in self._client.bulk.map(
+                fetch, calls, concurrency=concurrency
+            ):
+                if isinstance(result, Exception):
+                    raise result
+                pages[call] = result.items if result is not None else []
+                if result is not None and call[1] == 1:
+                    remaining.extend(
+                        (call[0], page_no)
+                        for page_no in range(2, (result.total_page or 1) + 1)
+                    )
+
+        await run([(window, 1) for window in range(len(windows))])
+        await run(remaining)
+
+        seen: set[str | None] = set()
+        results: list[Disclosure] = []
+        for call in sorted(pages):
+            for item in pages[call]:
+                if item.rcept_no is None or item.rcept_no not in seen:
+                    seen.add(item.rcept_no)
+                    results.append(item)
+        return results
+
+    async def _search_page(self, params: dict) -> DisclosureListResponse:
+        """여러 페이지를 조회하는 메서드용 공시검색 한 페이지 조회."""
+        return await self._get(
+            "/api/list.json",
+            DisclosureListResponse,
+            params=params,
+            options=self._decoded_options("rcept_no"),
+        )
+
     async def get_company(self, corp_code: str) -> Company:
         """기업개황 조회.
 
+        종목명(`stock_name`)은 `client.corp_codes` 회사명 검색 대상에 추가됩니다.
+
         Args:
             corp_code: 고유번호 (8자리)
 
@@ -78,7 +369,10 @@ class DisclosureAPI(BaseAPI):
             CompanyResponse,
             params={"corp_code": corp_code},
         )
-        return response.to_company()
+        company = response.to_company()
+        if company.stock_name:
+            self._client.corp_codes.add_name(company.corp_code, company.stock_name)
+        return company
 
     async def download_document(self, rcept_no: str) -> bytes:
         """공시서류 원본 다운로드.
@@ -94,6 +388,51 @@ class DisclosureAPI(BaseAPI):
             params={"rcept_no": rcept_no},
         )
 
+    def stream_document(
+        self,
+        rcept_no: str,
+        *,
+        max_size: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """공시서류 원본 스트리밍 다운로드.
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            ZIP 파일 바이트 청크 비동기 이터레이터
+        """
+        return self._stream(
+            "/api/document.xml",
+            params={"rcept_no": rcept_no},
+            max_size=max_size,
+        )
+
+    async def save_document(
+        self,
+        rcept_no: str,
+        dest: str | os.PathLike[str] | BinaryIO,
+        *,
+        max_size: int | None = None,
+    ) -> int:
+        """공시서류 원본을 파일로 저장.
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+            dest: 저장 경로 또는 바이너리 파일 객체
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            저장한 바이트 수
+        """
+        return await self._save(
+            "/api/document.xml",
+            dest,
+            params={"rcept_no": rcept_no},
+            max_size=max_size,
+        )
+
     async def download_corp_codes(self) -> bytes:
         """고유번호 전체 다운로드.
 
@@ -101,3 +440,110 @@ class DisclosureAPI(BaseAPI):
             ZIP 파일 바이트 (CORPCODE.xml 포함)
         """
         return await self._download("/api/corpCode.xml")
+
+    async def save_corp_codes(
+        self,
+        dest: str | os.PathLike[str] | BinaryIO,
+        *,
+        max_size: int | None = None,
+    ) -> int:
+        """고유번호 전체 ZIP을 파일로 저장.
+
+        Args:
+            dest: 저장 경로 또는 바이너리 파일 객체
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            저장한 바이트 수
+        """
+        return await self._save("/api/corpCode.xml", dest, max_size=max_size)
+
+    async def load_corp_codes(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        max_age: float | None = None,
+        max_size: int | None = None,
+    ) -> CorpCodeIndex | MappedCorpCodeIndex:
+        """고유번호 전체를 다운로드해 인덱스 생성.
+
+        ZIP 안의 CORPCODE.xml은 항목 단위로 스트리밍 파싱하며, 파싱은 이벤트
+        루프를 막지 않도록 별도 스레드에서 실행합니다.
+
+        `path`를 지정하면 인덱스 파일을 메모리 매핑해 반환합니다. 파일이 있고
+        `max_age`보다 오래되지 않았으면 다운로드하지 않으며, 새로 받은 경우
+        파일을 원자적으로 교체합니다.
+
+        Args:
+            path: 인덱스 파일 경로 (생략 시 메모리 인덱스 반환)
+            max_age: 인덱스 파일을 그대로 사용할 최대 경과 시간 (초, 생략 시
+                파일이 있으면 항상 사용)
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            고유번호·종목코드로 조회할 수 있는 인덱스
+
+        Example:
+            ```python
+            index = await client.disclosure.load_corp_codes()
+            corp_code = index.get_by_stock_code("005930").corp_code
+
+            # 하루 동안 파일을 재사용하고 여러 프로세스가 공유
+            index = await client.disclosure.load_corp_codes(
+                "corp_codes.idx", max_age=86400
+            )
+            ```
+        """
+        if path is not None and _is_fresh(path, max_age):
+            return MappedCorpCodeIndex(path)
+        data = await self._download("/api/corpCode.xml", max_size=max_size)
+        if path is None:
+            return await asyncio.to_thread(CorpCodeIndex.from_zip, data)
+        await asyncio.to_thread(write_index, iter_corp_codes(data), path)
+        return MappedCorpCodeIndex(path)
+
+    async def refresh_corp_codes(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_size: int | None = None,
+    ) -> CorpCodeDiff:
+        """고유번호 전체를 다시 받아 인덱스 파일과 비교하고 갱신.
+
+        추가·변경·삭제된 항목을 계산해 변경분이 있을 때만 파일을 원자적으로
+        교체하고, 클라이언트 캐시에서 변경·삭제된 회사의 기업개황 응답을
+        삭제합니다. `client.corp_codes`가 같은 파일을 사용하면 새 파일을 다시
+        매핑합니다. 반환된 변경분으로 바뀐 회사만 다시 조회할 수 있습니다.
+
+        Args:
+            path: 인덱스 파일 경로 (없으면 새로 생성)
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            저장되어 있던 인덱스 대비 변경분
+
+        Example:
+            ```python
+            diff = await client.disclosure.refresh_corp_codes("corp_codes.idx")
+            async for corp_code, company in client.bulk.map(
+                client.disclosure.get_company, diff.changed_codes
+            ):
+                ...
+            ```
+        """
+        data = await self._download("/api/corpCode.xml", max_size=max_size)
+        diff = await asyncio.to_thread(refresh_index, data, path)
+        corp_codes = self._client.corp_codes
+        if (
+            diff
+            and corp_codes.path is not None
+            and os.path.abspath(corp_codes.path) == os.path.abspath(path)
+        ):
+            corp_codes.reopen()
+        cache = self._client.cache
+        if cache is not None:
+            for corp_code in diff.stale_codes:
+                await cache.delete(
+                    cache_key("/api/company.json", {"corp_code": corp_code})
+                )
+        return diff
@@ -1,6 +1,13 @@
 """DS003 정기보고서 재무정보 API."""
 
+import os
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, BinaryIO
+
 from opendart_fss.api.base import BaseAPI
+from opendart_fss.constants import STATUS_MESSAGES, StatusCode
+from opendart_fss.decoding import DecodeOptions
+from opendart_fss.exceptions import NotFoundError, raise_for_status
 from opendart_fss.models.financial import (
     FinancialAccount,
     FinancialAccountListResponse,
@@ -10,6 +17,9 @@ from opendart_fss.models.financial import (
     XbrlTaxonomyListResponse,
 )
 
+# 다중회사 API 한 번에 조회할 수 있는 최대 고유번호 수
+MAX_CORP_CODES = 100
+
 
 class FinancialAPI(BaseAPI):
     """정기보고서 재무정보 API (DS003)."""
@@ -32,6 +42,18 @@ class FinancialAPI(BaseAPI):
         Returns:
             주요계정 목록
         """
+        if self._client.batcher is not None:
+            return await self._load_batched(
+                "/api/fnlttMultiAcnt.json",
+                FinancialAccountListResponse,
+                corp_code,
+                params={
+                    "bsns_year": bsns_year,
+                    "reprt_code": reprt_code,
+                    "fs_div": fs_div,
+                },
+            )
+
         response = await self._get(
             "/api/fnlttSinglAcnt.json",
             FinancialAccountListResponse,
@@ -46,15 +68,17 @@ class FinancialAPI(BaseAPI):
 
     async def get_multi_account(
         self,
-        corp_code: str,
+        corp_code: str | Iterable[str],
         bsns_year: str,
         reprt_code: str,
         fs_div: str = "CFS",
     ) -> list[FinancialAccount]:
         """다중회사 주요계정 조회.
 
+        100개를 넘는 고유번호는 100개씩 나눠 동시에 요청한 뒤 합칩니다.
+
         Args:
-            corp_code: 고유번호 (쉼표로 구분, 최대 100개)
+            corp_code: 고유번호 목록 (또는 쉼표로 구분한 문자열)
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011~11014)
             fs_div: 개별/연결 구분 (CFS/OFS)
@@ -62,17 +86,16 @@ class FinancialAPI(BaseAPI):
         Returns:
             주요계정 목록
         """
-        response = await self._get(
+        return await self._get_multi(
             "/api/fnlttMultiAcnt.json",
             FinancialAccountListResponse,
+            corp_code,
             params={
-                "corp_code": corp_code,
                 "bsns_year": bsns_year,
                 "reprt_code": reprt_code,
                 "fs_div": fs_div,
             },
         )
-        return response.items
 
     async def get_full_statements(
         self,
@@ -126,6 +149,61 @@ class FinancialAPI(BaseAPI):
             },
         )
 
+    def stream_xbrl(
+        self,
+        rcept_no: str,
+        reprt_code: str,
+        *,
+        max_size: int | None = None,
+    ) -> AsyncIterator[bytes]:
+        """XBRL 원본파일 스트리밍 다운로드.
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+            reprt_code: 보고서 코드 (11011~11014)
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            ZIP 파일 바이트 청크 비동기 이터레이터
+        """
+        return self._stream(
+            "/api/fnlttXbrl.xml",
+            params={
+                "rcept_no": rcept_no,
+                "reprt_code": reprt_code,
+            },
+            max_size=max_size,
+        )
+
+    async def save_xbrl(
+        self,
+        rcept_no: str,
+        reprt_code: str,
+        dest: str | os.PathLike[str] | BinaryIO,
+        *,
+        max_size: int | None = None,
+    ) -> int:
+        """XBRL 원본파일을 파일로 저장.
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+            reprt_code: 보고서 코드 (11011~11014)
+            dest: 저장 경로 또는 바이너리 파일 객체
+            max_size: 최대 크기 (바이트, 생략 시 클라이언트 설정)
+
+        Returns:
+            저장한 바이트 수
+        """
+        return await self._save(
+            "/api/fnlttXbrl.xml",
+            dest,
+            params={
+                "rcept_no": rcept_no,
+                "reprt_code": reprt_code,
+            },
+            max_size=max_size,
+        )
+
     async def get_xbrl_taxonomy(
         self,
         sj_div: str,
@@ -147,15 +225,17 @@ class FinancialAPI(BaseAPI):
 
     async def get_indicators(
         self,
-        corp_code: str,
+        corp_code: str | Iterable[str],
         bsns_year: str,
         reprt_code: str,
         idx_cl_code: str | None = None,
     ) -> list[FinancialIndicator]:
         """다중회사 재무지표 조회.
 
+        100개를 넘는 고유번호는 100개씩 나눠 동시에 요청한 뒤 합칩니다.
+
         Args:
-            corp_code: 고유번호 (쉼표로 구분, 최대 100개)
+            corp_code: 고유번호 목록 (또는 쉼표로 구분한 문자열)
             bsns_year: 사업연도 (YYYY)
             reprt_code: 보고서 코드 (11011~11014)
             idx_cl_code: 지표분류코드 (선택)
@@ -163,17 +243,16 @@ class FinancialAPI(BaseAPI):
         Returns:
             재무지표 목록
         """
-        response = await self._get(
+        return await self._get_multi(
             "/api/fnlttCmpnyIndx.json",
             FinancialIndicatorListResponse,
+            corp_code,
             params={
-                "corp_code": corp_code,
                 "bsns_year": bsns_year,
                 "reprt_code": reprt_code,
                 "idx_cl_code": idx_cl_code,
             },
         )
-        return response.items
 
     async def get_single_indicators(
         self,
@@ -193,6 +272,18 @@ class FinancialAPI(BaseAPI):
         Returns:
             재무지표 목록
         """
+        if self._client.batcher is not None:
+            return await self._load_batched(
+                "/api/fnlttCmpnyIndx.json",
+                FinancialIndicatorListResponse,
+                corp_code,
+                params={
+                    "bsns_year": bsns_year,
+                    "reprt_code": reprt_code,
+                    "idx_cl_code": idx_cl_code,
+                },
+            )
+
         response = await self._get(
             "/api/fnlttSinglIndx.json",
             FinancialIndicatorListResponse,
@@ -204,3 +295,122 @@ class FinancialAPI(BaseAPI):
             },
         )
         return response.items
+
+    async def _get_multi(
+        self,
+        endpoint: str,
+        response_type: type[
+            FinancialAccountListResponse | FinancialIndicatorListResponse
+        ],
+        corp_code: str | Iterable[str],
+        *,
+        params: dict,
+        options: DecodeOptions | None = None,
+    ) -> list[Any]:
+        """다중회사 API를 고유번호 100개 단위로 나눠 동시에 요청.
+
+        여러 묶음으로 나뉜 경우 데이터가 없는 묶음(`NotFoundError`)은
+        건너뛰며, 모든 묶음에 데이터가 없을 때만 예외가 발생합니다. 결과를
+        합쳐야 하므로 이때는 raw 모드에서도 항목을 디코딩합니다.
+
+        Raises:
+            ValueError: 고유번호가 하나도 없는 경우 (요청을 보내지 않음)
+        """
+        codes = _split_corp_codes(corp_code)
+        if not codes:
+            raise ValueError("corp_code requires at least one corp code.")
+        if self._client.resolve_corp_codes:
+            # 종목코드와 고유번호로 같은 회사를 지정한 경우도 한 번만 요청
+            resolved = await self._resolve_corp_code(",".join(codes))
+            codes = list(dict.fromkeys(resolved.split(",")))
+        chunks = [
+            ",".join(codes[i : i + MAX_CORP_CODES])
+            for i in range(0, len(codes), MAX_CORP_CODES)
+        ]
+        if len(chunks) <= 1:
+            response = await self._get(
+                endpoint,
+                response_type,
+                params={"corp_code": chunks[0], **params},
+                options=options,
+            )
+            return response.items
+
+        if options is None:
+            options = self._decoded_options()
+
+        async def fetch(chunk: str) -> list[Any]:
+            response = await self._get(
+                endpoint,
+                response_type,
+                params={"corp_code": chunk, **params},
+                options=options,
+            )
+            return response.items
+
+        results: dict[str, list[Any]] = {}
+        not_found: NotFoundError | None = None
+        async for chunk, result in self._client.bulk.map(
+            fetch, chunks, concurrency=len(chunks)
+        ):
+            if isinstance(result, NotFoundError):
+                not_found = result
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                results[chunk] = result
+        if not results and not_found is not None:
+            raise not_found
+        return [item for chunk in chunks for item in results.get(chunk, ())]
+
+    async def _load_batched(
+        self,
+        endpoint: str,
+        response_type: type[
+            FinancialAccountListResponse | FinancialIndicatorListResponse
+        ],
+        corp_code: str,
+        *,
+        params: dict,
+    ) -> list[Any]:
+        """단일회사 요청을 클라이언트 묶음 처리기로 보내 다중회사 API로 조회.
+
+        결과가 없으면 단일회사 API와 같이 `NotFoundError`가 발생합니다.
+        """
+        batcher = self._client.batcher
+        assert batcher is not None
+        # 응답 항목을 고유번호로 나누므로 묶기 전에 변환
+        corp_code = await self._resolve_corp_code(corp_code)
+
+        options = self._decoded_options("corp_code")
+
+        async def loader(codes: list[str]) -> dict[str, list[Any]]:
+            results: dict[str, list[Any]] = {code: [] for code in codes}
+            try:
+                items = await self._get_multi(
+                    endpoint,
+                    response_type,
+                    codes,
+                    params=params,
+                    options=options,
+                )
+            except NotFoundError:
+                return results
+            for item in items:
+                if item.corp_code in results:
+                    results[item.corp_code].append(item)
+            return results
+
+        # with_options() 뷰는 묶음 처리기를 공유하므로 디코딩 옵션별로 묶음
+        key = (endpoint, tuple(sorted(params.items())), options)
+        items = await batcher.load(key, corp_code, loader)
+        if not items:
+            raise_for_status(StatusCode.NO_DATA, STATUS_MESSAGES[StatusCode.NO_DATA])
+        return items
+
+
+def _split_corp_codes(corp_code: str | Iterable[str]) -> list[str]:
+    """고유번호 목록 정규화 (쉼표 구분 문자열 허용, 순서 유지 중복 제거)."""
+    if isinstance(corp_code, str):
+        corp_code = corp_code.split(",")
+    return list(dict.fromkeys(code.strip() for code in corp_code if code.strip()))
@@ -0,0 +1,115 @@
+"""단일회사 요청의 다중회사 요청 묶음 처리."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+
+DEFAULT_WINDOW = 0.01  # 10ms
+
+# 다중회사 API 한 번에 조회할 수 있는 최대 고유번호 수
+DEFAULT_MAX_SIZE = 100
+
+type BatchLoader[R] = Callable[[list[str]], Awaitable[Mapping[str, R]]]
+
+
+class _Batch:
+    __slots__ = ("futures", "handle", "loader")
+
+    def __init__(self, loader: BatchLoader) -> None:
+        self.loader = loader
+        self.futures: dict[str, list[asyncio.Future]] = {}
+        self.handle: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher:
+    """짧은 시간 동안 모인 단일회사 요청을 다중회사 요청으로 묶어 전송.
+
+    `get_single_account`/`get_single_indicators` 호출을 `window`초 동안
+    모았다가 최대 `max_size`개 고유번호의 `fnlttMultiAcnt.json`/
+    `fnlttCmpnyIndx.json` 요청 하나로 보내고, 응답을 고유번호별로 나눠 각
+    호출자에게 돌려줍니다. 호출 코드는 바뀌지 않으며 요청 수가 최대
+    `max_size`분의 1로 줄어드는 대신 응답이 최대 `window`초 늦어집니다.
+
+    Example:
+        ```python
+        client = OpenDartClient(batcher=MicroBatcher(window=0.01))
+
+        # 동시에 들어온 호출이 하나의 다중회사 요청으로 전송됨
+        results = await asyncio.gather(
+            *(
+                client.financial.get_single_account(code, "2024", "11011")
+                for code in corp_codes
+            )
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """묶음 처리기 초기화.
+
+        Args:
+            window: 요청을 모으는 시간 (초)
+            max_size: 한 묶음의 최대 고유번호 수
+        """
+        self.window = window
+        self.max_size = max_size
+        self._batches: dict[Hashable, _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load[R](self, key: Hashable, corp_code: str, loader: BatchLoader[R]) -> R:
+        """`key`가 같은 요청과 묶어 `corp_code`의 결과 조회.
+
+        Args:
+            key: 묶음 기준 (엔드포인트와 고유번호를 제외한 파라미터)
+            corp_code: 고유번호
+            loader: 고유번호 목록을 받아 고유번호별 결과를 반환하는 함수.
+                결과에 없는 고유번호는 `KeyError`로 전달됩니다.
+
+        Returns:
+            `corp_code`의 결과
+        """
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(loader)
+            batch.handle = asyncio.get_running_loop().call_later(
+                self.window, self._flush, key
+            )
+
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        batch.futures.setdefault(corp_code, []).append(future)
+        if len(batch.futures) >= self.max_size:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: Hashable) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        try:
+            results = await batch.loader(list(batch.futures))
+        except Exception as exc:  # noqa: BLE001
+            # 묶음 요청의 오류는 묶인 모든 호출자에게 전달
+            for futures in batch.futures.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        for corp_code, futures in batch.futures.items():
+            for future in futures:
+                if future.done():  # 호출자가 취소한 경우
+                    continue
+                if corp_code in results:
+                    future.set_result(results[corp_code])
+                else:
+                    future.set_exception(KeyError(corp_code))
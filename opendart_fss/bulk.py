@@ -0,0 +1,112 @@
+"""여러 요청의 동시 실행."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from opendart_fss.client import OpenDartClient
+
+DEFAULT_CONCURRENCY = 10
+
+_DONE = object()
+
+
+async def _call[T](method: Callable[..., Awaitable[T]], params: Any) -> T:
+    if isinstance(params, Mapping):
+        return await method(**params)
+    if isinstance(params, tuple):
+        return await method(*params)
+    return await method(params)
+
+
+class BulkExecutor:
+    """API 메서드를 여러 파라미터로 동시에 호출.
+
+    Example:
+        ```python
+        params = [
+            {"corp_code": code, "bsns_year": "2024", "reprt_code": "11011"}
+            for code in corp_codes
+        ]
+        async for p, result in client.bulk.map(client.report.get_dividends, params):
+            if isinstance(result, Exception):
+                print(p["corp_code"], "실패:", result)
+            else:
+                print(p["corp_code"], len(result))
+        ```
+    """
+
+    def __init__(
+        self, client: OpenDartClient, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> None:
+        """실행기 초기화.
+
+        Args:
+            client: OpenDART 클라이언트
+            concurrency: 기본 동시 실행 수
+        """
+        self._client = client
+        self.concurrency = concurrency
+
+    async def map[P, T](
+        self,
+        method: Callable[..., Awaitable[T]],
+        params: Iterable[P],
+        *,
+        concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[P, T | Exception]]:
+        """`params`의 각 항목으로 `method`를 호출하고 완료 순서대로 반환.
+
+        딕셔너리는 키워드 인자, 튜플은 위치 인자, 그 외 값은 첫 번째 인자로
+        전달합니다. 요청은 클라이언트의 Rate Limiter, 재시도 정책, 할당량을
+        그대로 따르며, 실패한 호출은 예외 객체를 결과로 반환합니다.
+        반복을 중단하거나 취소하면 진행 중인 호출도 모두 취소됩니다.
+
+        Args:
+            method: 클라이언트 API 메서드 (예: `client.report.get_dividends`)
+            params: 호출별 인자 목록 (필요할 때 하나씩 읽음)
+            concurrency: 동시 실행 수 (생략 시 `self.concurrency`)
+
+        Yields:
+            (인자, 결과 또는 예외) 튜플
+        """
+        workers = self.concurrency if concurrency is None else concurrency
+        if workers < 1:
+            raise ValueError("concurrency must be at least 1.")
+
+        pending = iter(params)
+        # 진행 중인 호출과 아직 가져가지 않은 결과를 합쳐 `workers`개로 제한
+        slots = asyncio.Semaphore(workers)
+        results: asyncio.Queue[Any] = asyncio.Queue()
+
+        async def worker() -> None:
+            while True:
+                await slots.acquire()
+                item = next(pending, _DONE)
+                if item is _DONE:
+                    slots.release()
+                    return
+                try:
+                    outcome: T | Exception = await _call(method, item)
+                except Exception as exc:  # noqa: BLE001
+                    # 예외는 삼키지 않고 해당 항목의 결과로 전달
+                    outcome = exc
+                results.put_nowait((item, outcome))
+
+        async def run() -> None:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(workers):
+                    tg.create_task(worker())
+
+        runner = asyncio.create_task(run())
+        runner.add_done_callback(lambda _: results.put_nowait(_DONE))
+        try:
+            while (item := await results.get()) is not _DONE:
+                slots.release()
+                yield item
+            await runner  # 작업자 내부 오류 전파
+        finally:
+            # 반복 중단/취소 시 진행 중인 호출 취소
+            runner.cancel()
+            await asyncio.wait([runner])
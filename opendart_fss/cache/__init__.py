@@ -0,0 +1,36 @@
+"""OpenDART 응답 캐시.
+
+`SQLiteCache`는 sqlite3와 compression.zstd를 불러오므로 처음 사용할 때
+지연 로드합니다.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from opendart_fss.cache.base import (
+    ImmutableRule,
+    ResponseCache,
+    bsns_year_older_than,
+    cache_key,
+)
+from opendart_fss.cache.memory import MemoryCache
+
+if TYPE_CHECKING:
+    from opendart_fss.cache.sqlite import SQLiteCache
+
+
+def __getattr__(name: str) -> Any:
+    if name == "SQLiteCache":
+        from opendart_fss.cache.sqlite import SQLiteCache
+
+        return SQLiteCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ImmutableRule",
+    "MemoryCache",
+    "ResponseCache",
+    "SQLiteCache",
+    "bsns_year_older_than",
+    "cache_key",
+]
@@ -0,0 +1,117 @@
+"""응답 캐시 기본 클래스."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime
+from urllib.parse import urlencode
+
+import msgspec
+
+# 사실상 변하지 않는 엔드포인트의 기본 TTL (None = 만료 없음)
+DEFAULT_ENDPOINT_TTLS: dict[str, float | None] = {
+    "/api/xbrlTaxonomy.json": None,
+}
+
+
+type ImmutableRule = Callable[[str, Mapping[str, object]], bool]
+
+
+def bsns_year_older_than(years: int = 2) -> ImmutableRule:
+    """사업연도가 `years`년보다 오래된 요청을 불변으로 보는 규칙.
+
+    Example:
+        ```python
+        # 올해가 2026년이면 bsns_year <= 2023 응답은 만료되지 않음
+        cache = SQLiteCache("dart.db", immutable=[bsns_year_older_than(2)])
+        ```
+    """
+
+    def rule(endpoint: str, params: Mapping[str, object]) -> bool:
+        bsns_year = params.get("bsns_year")
+        if bsns_year is None:
+            return False
+        try:
+            return datetime.now().year - int(str(bsns_year)) > years
+        except ValueError:
+            return False
+
+    return rule
+
+
+def cache_key(
+    endpoint: str, params: Mapping[str, object], variant: str | None = None
+) -> str:
+    """엔드포인트와 파라미터로 캐시 키 생성 (인증키 제외).
+
+    `variant`는 디코딩 대상 타입 이름 등 같은 요청의 다른 디코딩 결과를
+    구분하는 값이며, raw·필드 선택 응답이 기본 응답을 덮어쓰지 않게 합니다.
+    """
+    items = sorted((k, str(v)) for k, v in params.items() if k != "crtfc_key")
+    key = f"{endpoint}?{urlencode(items)}"
+    return f"{key}#{variant}" if variant else key
+
+
+class ResponseCache(ABC):
+    """응답 캐시 기본 클래스.
+
+    TTL은 초 단위이며 None은 만료 없음, 0은 캐시하지 않음을 뜻합니다.
+    불변 규칙(`immutable`) 중 하나라도 참이면 엔드포인트 TTL과 관계없이
+    만료되지 않습니다. 하위 클래스는 `get`, `set`, `delete`, `clear`를 구현해야
+    생성할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float | None = 300.0,
+        endpoint_ttls: Mapping[str, float | None] | None = None,
+        immutable: Sequence[ImmutableRule] = (),
+    ) -> None:
+        """캐시 초기화.
+
+        Args:
+            ttl: 기본 TTL (초)
+            endpoint_ttls: 엔드포인트별 TTL (예: {"/api/company.json": 86400})
+            immutable: 만료되지 않는 요청을 판별하는 규칙 목록
+        """
+        self.ttl = ttl
+        self.endpoint_ttls = {**DEFAULT_ENDPOINT_TTLS, **(endpoint_ttls or {})}
+        self.immutable = list(immutable)
+
+    def ttl_for(self, endpoint: str, params: Mapping[str, object]) -> float | None:
+        """요청에 적용할 TTL."""
+        ttl = self.endpoint_ttls.get(endpoint, self.ttl)
+        if ttl != 0 and any(rule(endpoint, params) for rule in self.immutable):
+            return None
+        return ttl
+
+    @abstractmethod
+    async def get[T: msgspec.Struct](
+        self, key: str, response_type: type[T]
+    ) -> T | None:
+        """캐시된 응답 조회. 없거나 만료되었으면 None."""
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: msgspec.Struct,
+        content: bytes,
+        ttl: float | None,
+    ) -> None:
+        """응답 저장.
+
+        Args:
+            key: 캐시 키
+            value: 디코딩된 응답
+            content: 원본 응답 본문
+            ttl: TTL (초, None이면 만료 없음)
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """캐시 항목 삭제."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """모든 캐시 항목 삭제."""
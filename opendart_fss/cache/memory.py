@@ -0,0 +1,122 @@
+"""인메모리 TTL + LRU 응답 캐시."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+
+import msgspec
+
+from opendart_fss.cache.base import ImmutableRule, ResponseCache
+
+
+class _Entry:
+    __slots__ = ("expires_at", "size", "value")
+
+    def __init__(
+        self, value: msgspec.Struct, size: int, expires_at: float | None
+    ) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class MemoryCache(ResponseCache):
+    """인메모리 TTL + LRU 응답 캐시.
+
+    디코딩된 msgspec 구조체를 그대로 저장하므로 적중 시 디코딩 없이 반환합니다.
+    반환된 객체는 다른 호출자와 공유되므로 수정하지 않아야 합니다.
+    메모리 예산은 원본 응답 본문 크기 기준으로 계산합니다.
+
+    Example:
+        ```python
+        cache = MemoryCache(
+            max_entries=10_000,
+            max_bytes=256 * 1024 * 1024,
+            ttl=600,
+            endpoint_ttls={"/api/company.json": 86400},
+        )
+        client = OpenDartClient(cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: float | None = 300.0,
+        endpoint_ttls: Mapping[str, float | None] | None = None,
+        immutable: Sequence[ImmutableRule] = (),
+    ) -> None:
+        """캐시 초기화.
+
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 메모리 예산 (응답 본문 바이트 합계)
+            ttl: 기본 TTL (초)
+            endpoint_ttls: 엔드포인트별 TTL
+            immutable: 만료되지 않는 요청을 판별하는 규칙 목록
+        """
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls, immutable=immutable)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """저장된 응답 본문 크기 합계."""
+        return self._bytes
+
+    async def get[T: msgspec.Struct](
+        self, key: str, response_type: type[T]
+    ) -> T | None:
+        """캐시된 응답 조회."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        if type(entry.value) is not response_type:
+            return None
+        self._entries.move_to_end(key)
+        return entry.value
+
+    async def set(
+        self,
+        key: str,
+        value: msgspec.Struct,
+        content: bytes,
+        ttl: float | None,
+    ) -> None:
+        """응답 저장 후 한도를 넘으면 오래된 항목부터 제거."""
+        size = len(content)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = _Entry(value, size, expires_at)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    async def delete(self, key: str) -> None:
+        """캐시 항목 삭제."""
+        if key in self._entries:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        """모든 캐시 항목 삭제."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
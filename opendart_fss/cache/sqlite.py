@@ -0,0 +1,142 @@
+"""SQLite 기반 영속 응답 캐시."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from compression import zstd
+
+import msgspec
+
+from opendart_fss.cache.base import ImmutableRule, ResponseCache
+from opendart_fss.decoding import decoder_for
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    expires_at REAL
+)
+"""
+
+
+class SQLiteCache(ResponseCache):
+    """SQLite 기반 영속 응답 캐시.
+
+    원본 응답 본문을 zstd로 압축해 로컬 SQLite 파일에 저장하고, 적중 시
+    요청한 응답 타입으로 디코딩합니다. WAL 모드를 사용하므로 같은 호스트의
+    여러 프로세스가 하나의 파일을 동시에 사용할 수 있습니다.
+
+    Example:
+        ```python
+        from opendart_fss.cache import SQLiteCache, bsns_year_older_than
+
+        cache = SQLiteCache(
+            "~/.cache/opendart.db",
+            ttl=86400,
+            immutable=[bsns_year_older_than(2)],
+        )
+        client = OpenDartClient(cache=cache)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ttl: float | None = 86400.0,
+        endpoint_ttls: Mapping[str, float | None] | None = None,
+        immutable: Sequence[ImmutableRule] = (),
+        level: int = 3,
+        timeout: float = 30.0,
+    ) -> None:
+        """캐시 초기화.
+
+        Args:
+            path: SQLite 파일 경로
+            ttl: 기본 TTL (초)
+            endpoint_ttls: 엔드포인트별 TTL
+            immutable: 만료되지 않는 요청을 판별하는 규칙 목록
+            level: zstd 압축 레벨
+            timeout: 다른 프로세스가 잠금을 가진 경우 대기할 최대 시간 (초)
+        """
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls, immutable=immutable)
+        self.path = os.path.expanduser(os.fspath(path))
+        self.level = level
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=timeout,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    async def get[T: msgspec.Struct](
+        self, key: str, response_type: type[T]
+    ) -> T | None:
+        """캐시된 응답 조회."""
+        body = await asyncio.to_thread(self._get_body, key)
+        if body is None:
+            return None
+        return decoder_for(response_type).decode(zstd.decompress(body))
+
+    async def set(
+        self,
+        key: str,
+        value: msgspec.Struct,
+        content: bytes,
+        ttl: float | None,
+    ) -> None:
+        """압축한 응답 본문 저장."""
+        body = zstd.compress(content, level=self.level)
+        expires_at = None if ttl is None else time.time() + ttl
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT OR REPLACE INTO responses (key, body, expires_at) VALUES (?, ?, ?)",
+            (key, body, expires_at),
+        )
+
+    async def delete(self, key: str) -> None:
+        """캐시 항목 삭제."""
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM responses WHERE key = ?", (key,)
+        )
+
+    async def clear(self) -> None:
+        """모든 캐시 항목 삭제."""
+        await asyncio.to_thread(self._execute, "DELETE FROM responses", ())
+
+    async def purge_expired(self) -> None:
+        """만료된 항목 삭제."""
+        await asyncio.to_thread(
+            self._execute,
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료."""
+        with self._lock:
+            self._conn.close()
+
+    def _get_body(self, key: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        return body
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
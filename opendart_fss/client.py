@@ -1,18 +1,53 @@
 """OpenDART API 클라이언트."""
 
+import copy
 import os
+from collections.abc import Collection, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from dotenv import load_dotenv
 
-from opendart_fss.api.disclosure import DisclosureAPI
-from opendart_fss.api.financial import FinancialAPI
-from opendart_fss.api.major_event import MajorEventAPI
-from opendart_fss.api.registration import RegistrationAPI
-from opendart_fss.api.report import ReportAPI
-from opendart_fss.api.shareholder import ShareholderAPI
+from opendart_fss.batching import MicroBatcher
+from opendart_fss.cache.base import ResponseCache
+from opendart_fss.corp_codes.service import CorpCodes
+from opendart_fss.decoding import DEFAULT_OPTIONS, DecodeOptions
+from opendart_fss.key_pool import APIKeyPool
+from opendart_fss.quota import Priority, QuotaManager, priority
+from opendart_fss.rate_limiter import RateLimiter
+from opendart_fss.retry import RetryPolicy
+from opendart_fss.stats import ClientStats
 
-load_dotenv()
+if TYPE_CHECKING:
+    from opendart_fss.api.base import _Inflight
+    from opendart_fss.api.disclosure import DisclosureAPI
+    from opendart_fss.api.financial import FinancialAPI
+    from opendart_fss.api.major_event import MajorEventAPI
+    from opendart_fss.api.registration import RegistrationAPI
+    from opendart_fss.api.report import ReportAPI
+    from opendart_fss.api.shareholder import ShareholderAPI
+    from opendart_fss.bulk import BulkExecutor
+
+# 처음 접근할 때 만드는 API 모듈 속성 (`with_options()` 뷰는 새로 생성)
+_API_ATTRS = (
+    "disclosure",
+    "report",
+    "financial",
+    "shareholder",
+    "major_event",
+    "registration",
+    "bulk",
+)
+
+
+@cache
+def _load_dotenv() -> None:
+    """.env 파일을 환경변수로 로드 (프로세스당 한 번)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 class OpenDartClient:
@@ -46,38 +81,203 @@ class OpenDartClient:
 
     def __init__(
         self,
-        api_key: str | None = None,
+        api_key: str | Sequence[str] | APIKeyPool | None = None,
         *,
         timeout: float = 30.0,
         http_client: httpx.AsyncClient | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        coalesce_requests: bool = True,
+        cache: ResponseCache | None = None,
+        max_download_size: int | None = None,
+        quota: QuotaManager | None = None,
+        batcher: MicroBatcher | None = None,
+        decode_options: DecodeOptions | None = None,
+        corp_code_index: str | os.PathLike[str] | None = None,
+        resolve_corp_codes: bool = False,
     ) -> None:
         """클라이언트 초기화.
 
         Args:
-            api_key: OpenDART API 키. 생략 시 OPENDART_API_KEY 환경변수 사용
+            api_key: OpenDART API 키. 여러 키(목록 또는 APIKeyPool)를 주면 키별
+                사용량을 추적하며 순환 사용. 생략 시 OPENDART_API_KEY 환경변수 사용
+                (쉼표로 구분해 여러 키 지정 가능)
             timeout: HTTP 요청 타임아웃 (초)
             http_client: 커스텀 httpx.AsyncClient (선택)
+            rate_limiter: 모든 요청이 공유하는 Rate Limiter
+                (생략 시 분당 1,000건 제한, 여러 키를 쓰면 키마다 같은 한도 적용)
+            retry_policy: 일시적 오류 재시도 정책
+                (생략 시 800/900, 013, 네트워크 오류를 최대 3회 시도)
+            coalesce_requests: 동시에 진행 중인 동일 요청을 하나로 병합할지 여부.
+                병합된 호출자는 같은 응답 객체를 공유하므로 수정하지 않아야 합니다.
+            cache: JSON 응답 캐시 (예: MemoryCache, 생략 시 캐시하지 않음)
+            max_download_size: 파일 다운로드 최대 크기 (바이트, 생략 시 제한 없음)
+            quota: 일간/월간 할당량 관리자 (생략 시 집계하지 않음)
+            batcher: 단일회사 재무 요청을 다중회사 요청으로 묶는 처리기
+                (생략 시 묶지 않음)
+            decode_options: 응답 디코딩 옵션 (`with_options()`로 호출별 지정 가능)
+            corp_code_index: `corp_codes`가 사용할 고유번호 인덱스 파일 경로
+                (생략 시 `corp_codes.load()`가 메모리 인덱스 생성)
+            resolve_corp_codes: `corp_code` 파라미터에 종목코드(6자리)나 정확한
+                회사명을 주면 로컬 고유번호 인덱스로 고유번호로 변환할지 여부
+                (인덱스가 없으면 처음 필요할 때 한 번 다운로드)
 
         Raises:
             ValueError: API 키가 제공되지 않고 환경변수도 설정되지 않은 경우
         """
-        self.api_key = api_key or os.environ.get("OPENDART_API_KEY")
-        if not self.api_key:
+        if not api_key:
+            _load_dotenv()
+        keys = api_key or os.environ.get("OPENDART_API_KEY")
+        if not keys:
             raise ValueError(
                 "API key is required. "
                 "Provide api_key parameter or set OPENDART_API_KEY environment variable."
             )
+        if isinstance(keys, str) and "," in keys:
+            keys = [key.strip() for key in keys.split(",") if key.strip()]
+
+        self.key_pool: APIKeyPool | None
+        if isinstance(keys, str):
+            self.key_pool = None
+            self.api_key = keys
+        else:
+            self.key_pool = keys if isinstance(keys, APIKeyPool) else APIKeyPool(keys)
+            self.api_key = self.key_pool.keys[0]
+
         self._timeout = timeout
         self._external_client = http_client is not None
         self._http = http_client or httpx.AsyncClient(timeout=timeout)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self._rate_limiters = {self.api_key: self.rate_limiter}
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.stats = ClientStats()
+        self.coalesce_requests = coalesce_requests
+        self._inflight: dict[tuple, _Inflight] = {}
+        self.cache = cache
+        self.max_download_size = max_download_size
+        self.quota = quota
+        self.batcher = batcher
+        self.decode_options = decode_options or DEFAULT_OPTIONS
+        # with_options() 뷰와 공유하도록 미리 생성 (인덱스는 load() 시 로드)
+        self.corp_codes = CorpCodes(self, corp_code_index)
+        self.resolve_corp_codes = resolve_corp_codes
+
+    # API 모듈은 처음 접근할 때 불러와 생성 (모델 정의를 포함해 import 비용이 큼)
+
+    @cached_property
+    def disclosure(self) -> DisclosureAPI:
+        """공시정보 API (DS001)."""
+        from opendart_fss.api.disclosure import DisclosureAPI
+
+        return DisclosureAPI(self)
+
+    @cached_property
+    def report(self) -> ReportAPI:
+        """정기보고서 주요정보 API (DS002)."""
+        from opendart_fss.api.report import ReportAPI
+
+        return ReportAPI(self)
+
+    @cached_property
+    def financial(self) -> FinancialAPI:
+        """정기보고서 재무정보 API (DS003)."""
+        from opendart_fss.api.financial import FinancialAPI
+
+        return FinancialAPI(self)
+
+    @cached_property
+    def shareholder(self) -> ShareholderAPI:
+        """지분공시 종합정보 API (DS004)."""
+        from opendart_fss.api.shareholder import ShareholderAPI
+
+        return ShareholderAPI(self)
+
+    @cached_property
+    def major_event(self) -> MajorEventAPI:
+        """주요사항보고서 주요정보 API (DS005)."""
+        from opendart_fss.api.major_event import MajorEventAPI
+
+        return MajorEventAPI(self)
+
+    @cached_property
+    def registration(self) -> RegistrationAPI:
+        """증권신고서 주요정보 API (DS006)."""
+        from opendart_fss.api.registration import RegistrationAPI
 
-        # API 모듈 초기화
-        self.disclosure = DisclosureAPI(self)
-        self.report = ReportAPI(self)
-        self.financial = FinancialAPI(self)
-        self.shareholder = ShareholderAPI(self)
-        self.major_event = MajorEventAPI(self)
-        self.registration = RegistrationAPI(self)
+        return RegistrationAPI(self)
+
+    @cached_property
+    def bulk(self) -> BulkExecutor:
+        """동시 실행 도우미."""
+        from opendart_fss.bulk import BulkExecutor
+
+        return BulkExecutor(self)
+
+    def with_options(self, **changes: Any) -> OpenDartClient:
+        """디코딩 옵션만 바꾼 클라이언트 뷰.
+
+        HTTP 연결, Rate Limiter, 캐시, 통계 등 나머지 상태는 원래 클라이언트와
+        공유하므로 호출마다 만들어도 비용이 거의 없습니다.
+
+        Args:
+            **changes: 바꿀 `DecodeOptions` 필드
+
+        Example:
+            ```python
+            raw = client.with_options(raw=True)
+            body = await raw.financial.get_full_statements(...)
+            ```
+        """
+        view = copy.copy(self)
+        view.decode_options = replace(self.decode_options, **changes)
+        for name in _API_ATTRS:
+            view.__dict__.pop(name, None)
+        return view
+
+    @property
+    def raw(self) -> OpenDartClient:
+        """목록을 디코딩하지 않고 `msgspec.Raw`로 반환하는 클라이언트 뷰.
+
+        API 메서드의 반환 타입 힌트(`list[...]`)는 기본 디코딩 기준이므로, 이
+        뷰에서 받은 목록은 `msgspec.Raw`로 다뤄야 합니다.
+
+        Example:
+            ```python
+            items = await client.raw.report.get_dividends(...)
+            producer.send(topic, bytes(items))
+            ```
+        """
+        return self.with_options(raw=True)
+
+    @contextmanager
+    def priority(self, level: Priority) -> Iterator[None]:
+        """블록 안에서 보내는 요청의 할당량 우선순위 지정.
+
+        Example:
+            ```python
+            with client.priority(Priority.LOW):
+                await run_batch(client)
+            ```
+        """
+        with priority(level):
+            yield
+
+    async def _acquire_key(self, exclude: Collection[str] = ()) -> str:
+        """다음 요청에 사용할 API 키 (`exclude`는 키 풀에서만 적용)."""
+        if self.key_pool is None:
+            return self.api_key
+        return await self.key_pool.acquire(exclude)
+
+    def _rate_limiter_for(self, api_key: str) -> RateLimiter:
+        """API 키별 Rate Limiter (첫 키는 `rate_limiter`)."""
+        limiter = self._rate_limiters.get(api_key)
+        if limiter is None:
+            limiter = RateLimiter(
+                per_minute=self.rate_limiter.per_minute,
+                per_day=self.rate_limiter.per_day,
+            )
+            self._rate_limiters[api_key] = limiter
+        return limiter
 
     async def aclose(self) -> None:
         """HTTP 클라이언트 종료."""
@@ -1,9 +1,13 @@
 """OpenDART API 상수 정의."""
 
+from datetime import timedelta, timezone
 from enum import StrEnum
 
 BASE_URL = "https://opendart.fss.or.kr"
 
+# OpenDART 일일/월간 한도는 한국 표준시 기준으로 초기화
+KST = timezone(timedelta(hours=9), "KST")
+
 
 class StatusCode(StrEnum):
     """API 응답 상태 코드."""
@@ -0,0 +1,56 @@
+"""OpenDART 고유번호 (CORPCODE.xml) 파싱, 인덱스와 회사명 검색.
+
+인덱스 모듈은 모델 정의를 함께 불러오므로 처음 사용할 때 지연 로드합니다
+(`OpenDartClient.corp_codes`는 클라이언트 생성 시 만들어짐).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from opendart_fss.corp_codes.service import CorpCodes
+
+if TYPE_CHECKING:
+    from opendart_fss.corp_codes.diff import (
+        CorpCodeDiff,
+        diff_corp_codes,
+        refresh_index,
+    )
+    from opendart_fss.corp_codes.index import CorpCodeIndex
+    from opendart_fss.corp_codes.parser import iter_corp_codes
+    from opendart_fss.corp_codes.search import NameSearchIndex, chosung, normalize
+    from opendart_fss.corp_codes.store import MappedCorpCodeIndex, write_index
+
+_MODULES = {
+    "CorpCodeIndex": "index",
+    "MappedCorpCodeIndex": "store",
+    "CorpCodeDiff": "diff",
+    "diff_corp_codes": "diff",
+    "refresh_index": "diff",
+    "iter_corp_codes": "parser",
+    "write_index": "store",
+    "NameSearchIndex": "search",
+    "normalize": "search",
+    "chosung": "search",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
+
+__all__ = [
+    "CorpCodeDiff",
+    "CorpCodeIndex",
+    "CorpCodes",
+    "MappedCorpCodeIndex",
+    "NameSearchIndex",
+    "chosung",
+    "diff_corp_codes",
+    "iter_corp_codes",
+    "normalize",
+    "refresh_index",
+    "write_index",
+]
@@ -0,0 +1,91 @@
+"""고유번호 목록 변경분 계산 및 증분 갱신."""
+
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from opendart_fss.corp_codes.parser import iter_corp_codes
+from opendart_fss.corp_codes.store import MappedCorpCodeIndex, write_index
+from opendart_fss.models.disclosure import CorpCode
+
+
+@dataclass(frozen=True)
+class CorpCodeDiff:
+    """고유번호 목록 변경분.
+
+    - `added`: 새로 추가된 항목
+    - `changed`: 최종변경일 등 내용이 바뀐 항목 (새 값)
+    - `removed`: 삭제된 항목 (이전 값)
+    """
+
+    added: list[CorpCode] = field(default_factory=list)
+    changed: list[CorpCode] = field(default_factory=list)
+    removed: list[CorpCode] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def changed_codes(self) -> list[str]:
+        """내용이 바뀐 고유번호 (기업개황 등을 다시 조회할 대상)."""
+        return [corp.corp_code for corp in self.changed]
+
+    @property
+    def stale_codes(self) -> list[str]:
+        """캐시된 응답이 더 이상 유효하지 않은 고유번호 (변경·삭제)."""
+        return [corp.corp_code for corp in (*self.changed, *self.removed)]
+
+
+def diff_corp_codes(old: Iterable[CorpCode], new: Iterable[CorpCode]) -> CorpCodeDiff:
+    """두 고유번호 목록의 변경분.
+
+    같은 고유번호의 항목은 최종변경일(`modify_date`)을 포함한 전체 필드를
+    비교합니다.
+
+    Args:
+        old: 이전 목록 (인덱스 또는 `CorpCode` 목록)
+        new: 새 목록
+    """
+    remaining = {corp.corp_code: corp for corp in new}
+    changed: list[CorpCode] = []
+    removed: list[CorpCode] = []
+    for corp in old:
+        latest = remaining.pop(corp.corp_code, None)
+        if latest is None:
+            removed.append(corp)
+        elif latest != corp:
+            changed.append(latest)
+    return CorpCodeDiff(
+        added=list(remaining.values()), changed=changed, removed=removed
+    )
+
+
+def refresh_index(
+    source: bytes | str | os.PathLike[str] | BinaryIO,
+    path: str | os.PathLike[str],
+) -> CorpCodeDiff:
+    """새 고유번호 ZIP과 저장된 인덱스 파일을 비교해 파일 갱신.
+
+    변경분이 있으면 인덱스 파일을 원자적으로 교체하고, 없으면 수정 시각만
+    갱신합니다. 파일이 없으면 모든 항목이 추가된 것으로 봅니다.
+
+    Args:
+        source: 새로 받은 고유번호 ZIP (바이트, 경로 또는 파일 객체)
+        path: 인덱스 파일 경로
+
+    Returns:
+        저장된 인덱스 대비 변경분
+    """
+    latest = list(iter_corp_codes(source))
+    if os.path.exists(path):
+        with MappedCorpCodeIndex(path) as current:
+            diff = diff_corp_codes(current, latest)
+    else:
+        diff = CorpCodeDiff(added=latest)
+
+    if diff or not os.path.exists(path):
+        write_index(latest, path)
+    else:
+        os.utime(path)
+    return diff
@@ -0,0 +1,117 @@
+"""인메모리 고유번호 인덱스."""
+
+import os
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from functools import cached_property
+from typing import BinaryIO, Self
+
+from opendart_fss.corp_codes.diff import CorpCodeDiff
+from opendart_fss.corp_codes.parser import iter_corp_codes
+from opendart_fss.corp_codes.store import write_index
+from opendart_fss.models.disclosure import CorpCode
+
+
+def _modify_date(corp: CorpCode) -> str:
+    return corp.modify_date or ""
+
+
+class CorpCodeIndex:
+    """고유번호 인덱스.
+
+    고유번호·종목코드로 O(1) 조회하고 최종변경일 순으로 정렬된 목록을
+    제공합니다.
+
+    Example:
+        ```python
+        index = await client.disclosure.load_corp_codes()
+        samsung = index.get_by_stock_code("005930")
+        changed = index.modified_since("20240101")
+        ```
+    """
+
+    def __init__(self, corp_codes: Iterable[CorpCode] = ()) -> None:
+        """인덱스 초기화.
+
+        Args:
+            corp_codes: 고유번호 정보 (같은 고유번호는 나중 항목 사용)
+        """
+        self._by_corp_code: dict[str, CorpCode] = {
+            corp.corp_code: corp for corp in corp_codes
+        }
+        self._by_stock_code: dict[str, CorpCode] = {
+            corp.stock_code: corp
+            for corp in self._by_corp_code.values()
+            if corp.stock_code
+        }
+
+    @classmethod
+    def from_zip(cls, source: bytes | str | os.PathLike[str] | BinaryIO) -> Self:
+        """고유번호 ZIP(corpCode.xml 응답)을 스트리밍 파싱해 인덱스 생성."""
+        return cls(iter_corp_codes(source))
+
+    def save(self, path: str | os.PathLike[str]) -> int:
+        """메모리 매핑용 인덱스 파일로 저장 (`MappedCorpCodeIndex`로 열기).
+
+        Returns:
+            저장한 바이트 수
+        """
+        return write_index(self, path)
+
+    def apply(self, diff: CorpCodeDiff) -> None:
+        """변경분을 반영 (영향받는 항목만 갱신).
+
+        Example:
+            ```python
+            latest = await client.disclosure.load_corp_codes()
+            index.apply(diff_corp_codes(index, latest))
+            ```
+        """
+        for corp in diff.removed:
+            self._discard(corp.corp_code)
+        for corp in (*diff.added, *diff.changed):
+            self._discard(corp.corp_code)
+            self._by_corp_code[corp.corp_code] = corp
+            if corp.stock_code:
+                self._by_stock_code[corp.stock_code] = corp
+        # 최종변경일 정렬은 다음 조회 시 다시 생성
+        self.__dict__.pop("_sorted", None)
+
+    def _discard(self, corp_code: str) -> None:
+        corp = self._by_corp_code.pop(corp_code, None)
+        if (
+            corp is not None
+            and corp.stock_code
+            and self._by_stock_code.get(corp.stock_code) is corp
+        ):
+            del self._by_stock_code[corp.stock_code]
+
+    def __len__(self) -> int:
+        return len(self._by_corp_code)
+
+    def __iter__(self) -> Iterator[CorpCode]:
+        return iter(self._by_corp_code.values())
+
+    def __contains__(self, corp_code: object) -> bool:
+        return corp_code in self._by_corp_code
+
+    def get(self, corp_code: str) -> CorpCode | None:
+        """고유번호(8자리)로 조회."""
+        return self._by_corp_code.get(corp_code)
+
+    def get_by_stock_code(self, stock_code: str) -> CorpCode | None:
+        """종목코드(6자리)로 조회 (상장사만)."""
+        return self._by_stock_code.get(stock_code)
+
+    @cached_property
+    def _sorted(self) -> list[CorpCode]:
+        return sorted(self._by_corp_code.values(), key=_modify_date)
+
+    def sorted_by_modify_date(self) -> list[CorpCode]:
+        """최종변경일 오름차순 목록."""
+        return list(self._sorted)
+
+    def modified_since(self, date: str) -> list[CorpCode]:
+        """최종변경일이 `date`(YYYYMMDD) 이후인 항목 (오름차순)."""
+        start = bisect_left(self._sorted, date, key=_modify_date)
+        return self._sorted[start:]
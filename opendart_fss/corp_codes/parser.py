@@ -0,0 +1,82 @@
+"""CORPCODE.xml 스트리밍 파서."""
+
+import io
+import os
+import zipfile
+from collections.abc import Iterator
+from typing import IO, BinaryIO
+from xml.parsers import expat
+
+from opendart_fss.models.disclosure import CorpCode
+
+# 고유번호 항목 요소 이름
+_ENTRY_TAG = "list"
+
+# 읽어 들이는 항목 필드
+_FIELDS = frozenset({"corp_code", "corp_name", "stock_code", "modify_date"})
+
+# 압축 해제 후 파서에 넣는 청크 크기
+_CHUNK_SIZE = 64 * 1024
+
+
+def _open_xml(archive: zipfile.ZipFile) -> IO[bytes]:
+    """ZIP 안의 XML 파일 (CORPCODE.xml)."""
+    for name in archive.namelist():
+        if name.lower().endswith(".xml"):
+            return archive.open(name)
+    raise ValueError("ZIP archive does not contain CORPCODE.xml")
+
+
+def iter_corp_codes(
+    source: bytes | str | os.PathLike[str] | BinaryIO,
+) -> Iterator[CorpCode]:
+    """고유번호 ZIP(corpCode.xml 응답)에서 고유번호 정보를 순서대로 읽기.
+
+    ZIP 안의 XML을 청크 단위로 압축 해제해 파서에 넣고 완성된 항목부터
+    돌려주므로, 약 10만 건의 전체 XML이나 DOM을 메모리에 만들지 않습니다.
+
+    Args:
+        source: ZIP 바이트, 파일 경로 또는 바이너리 파일 객체
+
+    Raises:
+        ValueError: ZIP 안에 XML 파일이 없는 경우
+        xml.parsers.expat.ExpatError: XML 형식이 잘못된 경우
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+
+    ready: list[CorpCode] = []
+    fields: dict[str, str] = {}
+    text: list[str] = []
+
+    # 요소가 끝날 때마다 그 사이의 문자열을 모아 앞뒤 공백을 제거해 사용
+    def end(tag: str) -> None:
+        nonlocal fields
+        if tag in _FIELDS:
+            fields[tag] = "".join(text).strip()
+        elif tag == _ENTRY_TAG:
+            if fields.get("corp_code"):
+                ready.append(
+                    CorpCode(
+                        corp_code=fields["corp_code"],
+                        corp_name=fields.get("corp_name", ""),
+                        # 비상장사 종목코드는 공백 한 칸
+                        stock_code=fields.get("stock_code") or None,
+                        modify_date=fields.get("modify_date") or None,
+                    )
+                )
+            fields = {}
+        text.clear()
+
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = text.append
+
+    with zipfile.ZipFile(source) as archive, _open_xml(archive) as fp:
+        while chunk := fp.read(_CHUNK_SIZE):
+            parser.Parse(chunk, False)
+            yield from ready
+            ready.clear()
+        parser.Parse(b"", True)
+        yield from ready
@@ -0,0 +1,230 @@
+"""한글 회사명 검색 인덱스 (접두어, 초성, 오타 허용)."""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import chain, islice
+from math import ceil
+
+from opendart_fss.models.disclosure import CorpCode
+
+# 한글 음절 범위와 초성 (음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSUNG = 21 * 28
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_SET = frozenset(_CHOSUNG)
+
+# 접두어 범위의 상한 (어떤 문자보다 큰 코드 포인트)
+_MAX_CHAR = chr(0x10FFFF)
+
+# 검색에서 무시하는 법인 형태 표기와 기호
+_NOISE = re.compile(r"주식회사|유한회사|\(주\)|\(유\)|㈜|[^0-9a-z가-힣ㄱ-ㅎ]")
+
+# 오타 허용 검색의 최소 유사도 (앞뒤 경계를 포함한 바이그램 Dice 계수)
+MIN_SIMILARITY = 0.5
+
+
+def normalize(name: str) -> str:
+    """검색용 회사명 (소문자, 법인 형태 표기·공백·기호 제거)."""
+    return _NOISE.sub("", unicodedata.normalize("NFC", name).lower())
+
+
+def chosung(text: str) -> str:
+    """한글 음절을 초성으로 바꾼 문자열 (그 외 문자는 그대로)."""
+    return "".join(
+        _CHOSUNG[(ord(char) - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSUNG]
+        if _HANGUL_FIRST <= ord(char) <= _HANGUL_LAST
+        else char
+        for char in text
+    )
+
+
+def _bigrams(text: str) -> set[str]:
+    padded = f"^{text}$"
+    return {padded[i : i + 2] for i in range(len(padded) - 1)}
+
+
+def _matches_chosung(name: str, query: str) -> bool:
+    """`query`의 각 글자가 `name`의 같은 위치 글자 또는 그 초성과 일치하는지."""
+    return len(name) >= len(query) and all(
+        q == n or (q in _CHOSUNG_SET and chosung(n) == q)
+        for q, n in zip(query, name, strict=False)
+    )
+
+
+class NameSearchIndex:
+    """회사명 검색 인덱스.
+
+    정규화한 회사명의 정렬 목록(접두어), 초성 문자열의 정렬 목록(초성),
+    바이그램 역색인(오타 허용)으로 구성되며 네트워크 없이 검색합니다.
+    결과는 완전 일치, 접두어·초성 일치(상장사·짧은 이름 우선) 순이며, 일치하는
+    이름이 없을 때만 바이그램 유사도 순으로 오타를 허용해 찾습니다.
+
+    Example:
+        ```python
+        names = NameSearchIndex(index)
+        names.search("삼성전")      # 접두어
+        names.search("ㅅㅅㅈㅈ")    # 초성
+        names.search("삼성젼자")    # 오타 허용
+        ```
+    """
+
+    def __init__(self, corp_codes: Iterable[CorpCode] = ()) -> None:
+        """인덱스 생성.
+
+        Args:
+            corp_codes: 고유번호 정보 (`corp_name`으로 색인)
+        """
+        self._corps: list[CorpCode] = []
+        self._names: list[str] = []
+        self._lengths: list[int] = []
+        # 순위 키 (비상장사 여부, 이름 길이를 하나의 정수로)
+        self._order: list[int] = []
+        self._bigrams: dict[str, list[int]] = {}
+        for corp in corp_codes:
+            self._append(corp, corp.corp_name)
+        self._prefix = sorted((key, entry) for entry, key in enumerate(self._names))
+        self._chosung = sorted(
+            (chosung(key), entry) for entry, key in enumerate(self._names)
+        )
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _append(self, corp: CorpCode, name: str) -> int | None:
+        key = normalize(name)
+        if not key:
+            return None
+        entry = len(self._names)
+        self._corps.append(corp)
+        self._names.append(key)
+        self._lengths.append(len(key))
+        self._order.append((corp.stock_code is None) << 16 | min(len(key), 0xFFFF))
+        for gram in _bigrams(key):
+            self._bigrams.setdefault(gram, []).append(entry)
+        return entry
+
+    def add(self, corp: CorpCode, name: str) -> None:
+        """회사의 다른 이름(종목명 등)을 색인에 추가."""
+        if normalize(name) == normalize(corp.corp_name):
+            return
+        entry = self._append(corp, name)
+        if entry is not None:
+            key = self._names[entry]
+            insort(self._prefix, (key, entry))
+            insort(self._chosung, (chosung(key), entry))
+
+    @staticmethod
+    def _range(keys: list[tuple[str, int]], low: str, high: str) -> Iterator[int]:
+        """키가 `low` 이상 `high` 미만인 항목 (이름순)."""
+        start = bisect_left(keys, (low,))
+        end = bisect_left(keys, (high,), start)
+        return (entry for _, entry in keys[start:end])
+
+    def _starting_with(self, keys: list[tuple[str, int]], prefix: str) -> Iterator[int]:
+        """키가 `prefix`로 시작하는 항목 (이름순)."""
+        return self._range(keys, prefix, prefix + _MAX_CHAR)
+
+    def _rank(self, entries: Iterable[int], limit: int) -> list[int]:
+        """상장사, 짧은 이름 순으로 상위 `limit`개.
+
+        범위 전체에서 고르며, 순위가 같으면 `entries` 순서(이름순)를 유지합니다.
+        """
+        return heapq.nsmallest(limit, entries, key=self._order.__getitem__)
+
+    def _exact(self, query: str) -> list[int]:
+        """정규화한 이름이 `query`와 같은 항목 (이름순)."""
+        return list(self._range(self._prefix, query, query + "\0"))
+
+    def _prefixed(self, query: str, limit: int) -> list[int]:
+        """접두어 일치 (완전 일치 우선)."""
+        exact = self._exact(query)
+        # 완전 일치는 접두어 범위의 맨 앞에 모이므로 건너뛰고 순위 매김
+        rest = islice(self._starting_with(self._prefix, query), len(exact), None)
+        return exact + self._rank(rest, limit)
+
+    def _chosung_matched(self, query: str, limit: int) -> list[int]:
+        """초성 일치 (완성된 음절은 그대로 비교)."""
+        head = query[: next(i for i, c in enumerate(query) if c in _CHOSUNG_SET)]
+        if head:
+            # 앞쪽 완성 음절로 후보를 좁힌 뒤 나머지를 초성으로 비교
+            entries = self._starting_with(self._prefix, head)
+        else:
+            entries = self._starting_with(self._chosung, chosung(query))
+        if not _CHOSUNG_SET.issuperset(query):
+            # 순위를 매기기 전에 걸러 일치하는 항목이 빠지지 않게 함
+            names = self._names
+            entries = (e for e in entries if _matches_chosung(names[e], query))
+        return self._rank(entries, limit)
+
+    def _fuzzy(self, query: str, limit: int) -> list[int]:
+        """바이그램 Dice 계수가 `MIN_SIMILARITY` 이상인 항목 (유사도 순)."""
+        grams = _bigrams(query)
+        size = len(grams)
+        postings = sorted((self._bigrams.get(gram, []) for gram in grams), key=len)
+        # 유사도 기준을 넘으려면 공통 바이그램이 `need`개 이상이어야 하므로,
+        # 가장 드문 `size - need + 1`개 목록에 한 번도 없는 항목은 후보가 아님
+        need = ceil(MIN_SIMILARITY * size / (2 - MIN_SIMILARITY))
+        split = size - need + 1
+        counts = Counter(chain.from_iterable(postings[:split]))
+        for posting in postings[split:]:
+            counts.update(counts.keys() & posting)
+
+        # 공통 바이그램 수별로 기준을 넘을 수 있는 최대 이름 길이
+        longest = [2 * common / MIN_SIMILARITY - size - 1 for common in range(size + 1)]
+        lengths, order = self._lengths, self._order
+        scored = [
+            (-2 * common / (size + lengths[entry] + 1), order[entry], entry)
+            for entry, common in counts.items()
+            if common >= need and lengths[entry] <= longest[common]
+        ]
+        return [entry for *_, entry in heapq.nsmallest(limit, scored)]
+
+    def find(self, name: str) -> list[CorpCode]:
+        """정규화한 이름이 정확히 일치하는 회사 (상장사 우선, 같은 회사는 한 번만)."""
+        query = normalize(name)
+        if not query:
+            return []
+        exact = self._exact(query)
+        results: dict[str, CorpCode] = {}
+        for entry in self._rank(exact, len(exact)):
+            corp = self._corps[entry]
+            results.setdefault(corp.corp_code, corp)
+        return list(results.values())
+
+    def search(self, name: str, *, limit: int = 10) -> list[CorpCode]:
+        """회사명 검색.
+
+        Args:
+            name: 회사명 일부, 초성(예: "ㅅㅅㅈㅈ") 또는 오타가 섞인 회사명
+            limit: 최대 결과 수
+
+        Returns:
+            고유번호 정보 목록 (같은 회사는 한 번만)
+        """
+        query = normalize(name)
+        if not query or limit <= 0:
+            return []
+
+        # 같은 이름의 회사가 여럿일 수 있으므로 중복 제거 전 후보를 넉넉히 선택
+        has_chosung = not _CHOSUNG_SET.isdisjoint(query)
+        candidates = self._prefixed(query, limit * 2)
+        if has_chosung:
+            candidates += self._chosung_matched(query, limit * 2)
+
+        # 접두어·초성으로 찾지 못한 경우에만 오타 허용 검색 (초성이 섞인
+        # 검색어는 바이그램 유사도가 의미 없으므로 제외)
+        if not candidates and len(query) >= 2 and not has_chosung:
+            candidates = self._fuzzy(query, limit * 2)
+
+        results: dict[str, CorpCode] = {}
+        for entry in candidates:
+            corp = self._corps[entry]
+            results.setdefault(corp.corp_code, corp)
+            if len(results) >= limit:
+                break
+        return list(results.values())
@@ -0,0 +1,229 @@
+"""클라이언트의 로컬 고유번호 조회·회사명 검색 서비스."""
+
+import asyncio
+import os
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from opendart_fss.client import OpenDartClient
+    from opendart_fss.corp_codes.index import CorpCodeIndex
+    from opendart_fss.corp_codes.search import NameSearchIndex
+    from opendart_fss.corp_codes.store import MappedCorpCodeIndex
+    from opendart_fss.models.disclosure import CorpCode
+
+_CORP_CODE = re.compile(r"\d{8}")
+_STOCK_CODE = re.compile(r"[0-9A-Z]{6}")
+
+
+class CorpCodes:
+    """로컬 고유번호 인덱스 기반 조회·회사명 검색 (`client.corp_codes`).
+
+    `load()`로 한 번 받아 둔 인덱스(또는 인덱스 파일)만 사용하므로 조회와
+    검색은 네트워크 요청을 보내지 않습니다. `get_company()`로 조회한 회사의
+    종목명(`stock_name`)도 검색 대상에 추가됩니다.
+
+    Example:
+        ```python
+        client = OpenDartClient(corp_code_index="corp_codes.idx")
+        await client.corp_codes.load(max_age=86400)
+
+        client.corp_codes.search("삼성전")    # 접두어
+        client.corp_codes.search("ㅅㅅㅈㅈ")  # 초성
+        client.corp_codes.search("삼성젼자")  # 오타 허용
+        ```
+    """
+
+    def __init__(
+        self, client: OpenDartClient, path: str | os.PathLike[str] | None = None
+    ) -> None:
+        """서비스 초기화.
+
+        Args:
+            client: 인덱스를 다운로드할 클라이언트
+            path: 인덱스 파일 경로 (생략 시 메모리 인덱스 사용)
+        """
+        self._client = client
+        self.path = path
+        self._index: CorpCodeIndex | MappedCorpCodeIndex | None = None
+        self._names: NameSearchIndex | None = None
+        # 검색 색인을 만들기 전에 추가된 이름 (고유번호 -> 이름)
+        self._aliases: dict[str, set[str]] = {}
+        # resolve()가 인덱스·검색 색인을 한 번만 만들도록 보호
+        self._lock = asyncio.Lock()
+
+    async def load(
+        self, *, max_age: float | None = None, search: bool = True
+    ) -> CorpCodeIndex | MappedCorpCodeIndex:
+        """고유번호 인덱스 로드 (`DisclosureAPI.load_corp_codes()`).
+
+        Args:
+            max_age: 인덱스 파일을 그대로 사용할 최대 경과 시간 (초)
+            search: 회사명 검색 색인도 별도 스레드에서 미리 생성할지 여부
+                (생략하면 첫 `search()` 호출 시 생성)
+
+        Returns:
+            로드한 인덱스
+        """
+        index = await self._client.disclosure.load_corp_codes(
+            self.path, max_age=max_age
+        )
+        self.use(index)
+        if search:
+            await asyncio.to_thread(self._name_index)
+        return index
+
+    def use(self, index: CorpCodeIndex | MappedCorpCodeIndex) -> None:
+        """이미 만든 인덱스 사용 (검색 색인은 다음 검색 시 다시 생성)."""
+        self._index = index
+        self._names = None
+
+    def reopen(self) -> bool:
+        """인덱스 파일이 교체되었으면 다시 매핑하고 검색 색인을 새로 생성.
+
+        `DisclosureAPI.refresh_corp_codes()`가 같은 경로의 파일을 갱신하면
+        자동으로 호출됩니다.
+
+        Returns:
+            인덱스를 다시 읽는지 여부
+        """
+        if self.path is None or self._index is None:
+            return False
+        from opendart_fss.corp_codes.store import MappedCorpCodeIndex
+
+        if isinstance(self._index, MappedCorpCodeIndex):
+            if not self._index.reopen():
+                return False
+        else:
+            # 메모리 인덱스는 다음 조회 시 파일에서 다시 매핑
+            self._index = None
+        self._names = None
+        return True
+
+    @property
+    def loaded(self) -> bool:
+        """인덱스를 사용할 수 있는지 여부."""
+        return self._index is not None or (
+            self.path is not None and os.path.exists(self.path)
+        )
+
+    @property
+    def index(self) -> CorpCodeIndex | MappedCorpCodeIndex:
+        """고유번호 인덱스 (인덱스 파일이 있으면 처음 접근할 때 매핑).
+
+        Raises:
+            ValueError: 인덱스를 로드하지 않았고 인덱스 파일도 없는 경우
+        """
+        if self._index is None:
+            if self.path is None or not os.path.exists(self.path):
+                raise ValueError(
+                    "corp code index is not loaded; call corp_codes.load() first"
+                )
+            from opendart_fss.corp_codes.store import MappedCorpCodeIndex
+
+            self._index = MappedCorpCodeIndex(self.path)
+        return self._index
+
+    def get(self, corp_code: str) -> CorpCode | None:
+        """고유번호(8자리)로 조회."""
+        return self.index.get(corp_code)
+
+    def get_by_stock_code(self, stock_code: str) -> CorpCode | None:
+        """종목코드(6자리)로 조회 (상장사만)."""
+        return self.index.get_by_stock_code(stock_code)
+
+    def search(self, name: str, *, limit: int = 10) -> list[CorpCode]:
+        """회사명 검색 (접두어, 초성, 오타 허용).
+
+        Args:
+            name: 회사명 일부, 초성(예: "ㅅㅅㅈㅈ") 또는 오타가 섞인 회사명
+            limit: 최대 결과 수
+
+        Returns:
+            고유번호 정보 목록 (완전 일치, 상장사, 짧은 이름 우선)
+        """
+        return self._name_index().search(name, limit=limit)
+
+    def add_name(self, corp_code: str, name: str) -> None:
+        """회사의 다른 이름(종목명 등)을 검색 대상에 추가."""
+        aliases = self._aliases.setdefault(corp_code, set())
+        if name in aliases:
+            return
+        aliases.add(name)
+        if self._names is not None:
+            corp = self.get(corp_code)
+            if corp is not None:
+                self._names.add(corp, name)
+
+    def _name_index(self) -> NameSearchIndex:
+        if self._names is None:
+            from opendart_fss.corp_codes.search import NameSearchIndex
+
+            index = self.index
+            names = NameSearchIndex(index)
+            for corp_code, aliases in self._aliases.items():
+                corp = index.get(corp_code)
+                if corp is not None:
+                    for alias in aliases:
+                        names.add(corp, alias)
+            self._names = names
+        return self._names
+
+    async def resolve(self, value: str) -> str:
+        """고유번호, 종목코드(6자리) 또는 정확한 회사명을 고유번호로 변환.
+
+        쉼표로 구분한 여러 값은 각각 변환합니다. 모두 고유번호(8자리)이면
+        인덱스를 사용하지 않으며, 그 외에는 인덱스를 로드하지 않았고 인덱스
+        파일도 없을 때 한 번 `load()`합니다. 회사명은 검색과 같이 정규화해
+        비교하며, 같은 이름의 회사가 여럿이면 상장사가 하나일 때만 그 회사로
+        변환합니다.
+
+        Args:
+            value: 고유번호, 종목코드 또는 회사명 (쉼표로 구분 가능)
+
+        Returns:
+            고유번호 (여러 값이면 쉼표로 구분)
+
+        Raises:
+            ValueError: 종목코드나 회사명에 해당하는 회사가 없거나, 같은 이름의
+                회사가 여럿이라 하나로 정할 수 없는 경우
+        """
+        codes = [code.strip() for code in value.split(",")]
+        if all(_CORP_CODE.fullmatch(code) for code in codes):
+            return value
+        index = await self._loaded_index()
+        resolved = []
+        for code in codes:
+            if _CORP_CODE.fullmatch(code):
+                resolved.append(code)
+                continue
+            corp = None
+            if _STOCK_CODE.fullmatch(code):
+                corp = index.get_by_stock_code(code)
+            if corp is None:
+                corp = await self._find_by_name(code)
+            resolved.append(corp.corp_code)
+        return ",".join(resolved)
+
+    async def _loaded_index(self) -> CorpCodeIndex | MappedCorpCodeIndex:
+        if self._index is None and not self.loaded:
+            async with self._lock:
+                if self._index is None and not self.loaded:
+                    await self.load(search=False)
+        return self.index
+
+    async def _find_by_name(self, name: str) -> CorpCode:
+        if self._names is None:
+            async with self._lock:
+                if self._names is None:
+                    await asyncio.to_thread(self._name_index)
+        matches = self._name_index().find(name)
+        listed = [corp for corp in matches if corp.stock_code]
+        if len(matches) == 1 or len(listed) == 1:
+            return listed[0] if listed else matches[0]
+        if not matches:
+            raise ValueError(f"unknown corp_code, stock_code or company name: {name!r}")
+        raise ValueError(
+            f"ambiguous company name {name!r}: "
+            + ", ".join(corp.corp_code for corp in matches)
+        )
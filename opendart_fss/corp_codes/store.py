@@ -0,0 +1,330 @@
+"""메모리 매핑 고유번호 인덱스 파일.
+
+파일 형식 (리틀 엔디언, 모든 u32 배열은 4바이트 정렬):
+
+    header        32바이트 (magic, version, 항목 수 N, 상장사 수 M, 이름 힙 크기)
+    stock_order   M x u32    종목코드 순으로 정렬한 항목 번호
+    date_order    N x u32    최종변경일 순으로 정렬한 항목 번호
+    name_offsets  (N+1) x u32 이름 힙 내 오프셋
+    corp_codes    N x 8바이트 고유번호 (오름차순)
+    stock_codes   N x 6바이트 종목코드 (비상장사는 공백)
+    modify_dates  N x 8바이트 최종변경일 (없으면 공백)
+    name_heap     UTF-8 회사명
+
+항목은 고유번호 순으로 저장하므로 모든 조회는 파일을 읽어 들이지 않고
+매핑된 페이지에서 이진 탐색합니다. 여러 프로세스가 같은 파일을 열면 OS
+페이지 캐시의 한 사본을 공유합니다.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from operator import attrgetter
+from typing import Self
+
+from opendart_fss.models.disclosure import CorpCode
+
+MAGIC = b"ODCC"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHxxIII12x")
+_U32 = struct.Struct("<I")
+_SPAN = struct.Struct("<II")
+
+_CORP_CODE_WIDTH = 8
+_STOCK_CODE_WIDTH = 6
+_DATE_WIDTH = 8
+
+
+def _fixed(value: str | None, width: int, field: str) -> bytes:
+    """고정 폭 ASCII 값 (없으면 공백)."""
+    try:
+        encoded = (value or "").encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError(f"{field} must be ASCII: {value!r}") from None
+    if len(encoded) > width:
+        raise ValueError(f"{field} must be at most {width} characters: {value!r}")
+    return encoded.ljust(width)
+
+
+def write_index(corp_codes: Iterable[CorpCode], path: str | os.PathLike[str]) -> int:
+    """고유번호 인덱스 파일 저장.
+
+    같은 디렉터리의 임시 파일에 쓴 뒤 `os.replace`로 교체하므로, 이미 파일을
+    열어 둔 프로세스는 이전 내용을 계속 읽고 새로 여는 프로세스는 완성된 새
+    파일만 봅니다.
+
+    Args:
+        corp_codes: 고유번호 정보 (같은 고유번호는 나중 항목 사용)
+        path: 저장 경로
+
+    Returns:
+        저장한 바이트 수
+
+    Raises:
+        ValueError: 고유번호·종목코드·최종변경일이 ASCII가 아니거나 형식보다 긴
+            경우
+    """
+    records = sorted(
+        {corp.corp_code: corp for corp in corp_codes}.values(),
+        key=attrgetter("corp_code"),
+    )
+    count = len(records)
+    corp_column = b"".join(
+        _fixed(r.corp_code, _CORP_CODE_WIDTH, "corp_code") for r in records
+    )
+    stock_column = b"".join(
+        _fixed(r.stock_code, _STOCK_CODE_WIDTH, "stock_code") for r in records
+    )
+    date_column = b"".join(
+        _fixed(r.modify_date, _DATE_WIDTH, "modify_date") for r in records
+    )
+    stock_order = sorted(
+        (i for i, r in enumerate(records) if r.stock_code),
+        key=lambda i: records[i].stock_code or "",
+    )
+    date_order = sorted(range(count), key=lambda i: records[i].modify_date or "")
+
+    names = [r.corp_name.encode() for r in records]
+    offsets = [0]
+    for name in names:
+        offsets.append(offsets[-1] + len(name))
+
+    def u32_array(values: list[int]) -> bytes:
+        return struct.pack(f"<{len(values)}I", *values)
+
+    sections = [
+        _HEADER.pack(MAGIC, VERSION, count, len(stock_order), offsets[-1]),
+        u32_array(stock_order),
+        u32_array(date_order),
+        u32_array(offsets),
+        corp_column,
+        stock_column,
+        date_column,
+        *names,
+    ]
+
+    path = os.fspath(path)
+    directory, filename = os.path.split(os.path.abspath(path))
+    fd, part = tempfile.mkstemp(prefix=f".{filename}.", suffix=".part", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            for section in sections:
+                fp.write(section)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(part, path)
+    except BaseException:
+        if os.path.exists(part):
+            os.remove(part)
+        raise
+    return sum(len(section) for section in sections)
+
+
+class _Keys:
+    """`bisect`용 정렬 키 시퀀스."""
+
+    __slots__ = ("_key", "_length")
+
+    def __init__(self, key: Callable[[int], bytes], length: int) -> None:
+        self._key = key
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> bytes:
+        return self._key(index)
+
+
+class MappedCorpCodeIndex:
+    """메모리 매핑한 고유번호 인덱스 파일.
+
+    `CorpCodeIndex`와 같은 조회 메서드를 제공하며, 파일을 파싱하지 않으므로
+    여는 즉시 사용할 수 있습니다. 조회 결과 `CorpCode`는 호출할 때마다
+    만들어집니다.
+
+    Example:
+        ```python
+        index = await client.disclosure.load_corp_codes("corp_codes.idx")
+
+        # 다른 워커 프로세스
+        index = MappedCorpCodeIndex("corp_codes.idx")
+        index.get_by_stock_code("005930")
+        ```
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """인덱스 파일 열기.
+
+        Args:
+            path: `write_index()`로 저장한 파일 경로
+
+        Raises:
+            ValueError: 인덱스 파일 형식이 아닌 경우
+        """
+        self.path = os.fspath(path)
+        self._mm: mmap.mmap | None = None
+        self._open()
+
+    def _open(self) -> None:
+        with open(self.path, "rb") as fp:
+            stat = os.fstat(fp.fileno())
+            if stat.st_size < _HEADER.size:
+                raise ValueError(f"not a corp code index file: {self.path}")
+            mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, listed, heap_size = _HEADER.unpack_from(mm)
+        stock_order = _HEADER.size
+        date_order = stock_order + listed * 4
+        name_offsets = date_order + count * 4
+        corp_codes = name_offsets + (count + 1) * 4
+        stock_codes = corp_codes + count * _CORP_CODE_WIDTH
+        modify_dates = stock_codes + count * _STOCK_CODE_WIDTH
+        heap = modify_dates + count * _DATE_WIDTH
+        if magic != MAGIC or version != VERSION or len(mm) != heap + heap_size:
+            mm.close()
+            raise ValueError(f"not a corp code index file: {self.path}")
+
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = mm
+        self._stat = (stat.st_ino, stat.st_mtime_ns)
+        self._count = count
+        self._listed = listed
+        self._stock_order = stock_order
+        self._date_order = date_order
+        self._name_offsets = name_offsets
+        self._corp_codes = corp_codes
+        self._stock_codes = stock_codes
+        self._modify_dates = modify_dates
+        self._heap = heap
+
+    def reopen(self) -> bool:
+        """파일이 교체되었으면 새 파일을 다시 매핑.
+
+        Returns:
+            다시 매핑했는지 여부
+        """
+        stat = os.stat(self.path)
+        if (stat.st_ino, stat.st_mtime_ns) == self._stat:
+            return False
+        self._open()
+        return True
+
+    def close(self) -> None:
+        """매핑 해제."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def _map(self) -> mmap.mmap:
+        if self._mm is None:
+            raise ValueError("corp code index is closed")
+        return self._mm
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[CorpCode]:
+        # 전체 순회는 열 단위로 한 번에 읽어 항목별 조회 비용을 줄임
+        count, mm = self._count, self._map
+        corp_codes = mm[self._corp_codes : self._stock_codes].decode()
+        stock_codes = mm[self._stock_codes : self._modify_dates].decode()
+        modify_dates = mm[self._modify_dates : self._heap].decode()
+        offsets = struct.unpack_from(f"<{count + 1}I", mm, self._name_offsets)
+        heap = mm[self._heap :]
+        code, stock, date = _CORP_CODE_WIDTH, _STOCK_CODE_WIDTH, _DATE_WIDTH
+        for i in range(count):
+            stock_code = stock_codes[i * stock : (i + 1) * stock].strip()
+            modify_date = modify_dates[i * date : (i + 1) * date].strip()
+            yield CorpCode(
+                corp_code=corp_codes[i * code : (i + 1) * code],
+                corp_name=heap[offsets[i] : offsets[i + 1]].decode(),
+                stock_code=stock_code or None,
+                modify_date=modify_date or None,
+            )
+
+    def __contains__(self, corp_code: object) -> bool:
+        return isinstance(corp_code, str) and self._find(corp_code) is not None
+
+    def _field(self, base: int, width: int, index: int) -> bytes:
+        start = base + index * width
+        return self._map[start : start + width]
+
+    def _corp_code_at(self, index: int) -> bytes:
+        return self._field(self._corp_codes, _CORP_CODE_WIDTH, index)
+
+    def _stock_code_at(self, index: int) -> bytes:
+        return self._field(self._stock_codes, _STOCK_CODE_WIDTH, index)
+
+    def _modify_date_at(self, index: int) -> bytes:
+        return self._field(self._modify_dates, _DATE_WIDTH, index)
+
+    def _order_at(self, base: int, position: int) -> int:
+        return _U32.unpack_from(self._map, base + position * 4)[0]
+
+    def _record(self, index: int) -> CorpCode:
+        start, end = _SPAN.unpack_from(self._map, self._name_offsets + index * 4)
+        return CorpCode(
+            corp_code=self._corp_code_at(index).decode(),
+            corp_name=self._map[self._heap + start : self._heap + end].decode(),
+            stock_code=self._stock_code_at(index).decode().strip() or None,
+            modify_date=self._modify_date_at(index).decode().strip() or None,
+        )
+
+    def _find(self, corp_code: str) -> int | None:
+        if len(corp_code) != _CORP_CODE_WIDTH or not corp_code.isascii():
+            return None
+        key = corp_code.encode()
+        index = bisect_left(_Keys(self._corp_code_at, self._count), key)
+        if index < self._count and self._corp_code_at(index) == key:
+            return index
+        return None
+
+    def get(self, corp_code: str) -> CorpCode | None:
+        """고유번호(8자리)로 조회."""
+        index = self._find(corp_code)
+        return None if index is None else self._record(index)
+
+    def get_by_stock_code(self, stock_code: str) -> CorpCode | None:
+        """종목코드(6자리)로 조회 (상장사만)."""
+        if not stock_code.strip() or not stock_code.isascii():
+            return None
+        if len(stock_code) > _STOCK_CODE_WIDTH:
+            return None
+        key = stock_code.encode().ljust(_STOCK_CODE_WIDTH)
+
+        def stock_code_at(position: int) -> bytes:
+            return self._stock_code_at(self._order_at(self._stock_order, position))
+
+        position = bisect_left(_Keys(stock_code_at, self._listed), key)
+        if position < self._listed and stock_code_at(position) == key:
+            return self._record(self._order_at(self._stock_order, position))
+        return None
+
+    def sorted_by_modify_date(self) -> list[CorpCode]:
+        """최종변경일 오름차순 목록."""
+        return self.modified_since("")
+
+    def modified_since(self, date: str) -> list[CorpCode]:
+        """최종변경일이 `date`(YYYYMMDD) 이후인 항목 (오름차순)."""
+
+        def modify_date_at(position: int) -> bytes:
+            return self._modify_date_at(self._order_at(self._date_order, position))
+
+        start = bisect_left(_Keys(modify_date_at, self._count), date.encode())
+        return [
+            self._record(self._order_at(self._date_order, position))
+            for position in range(start, self._count)
+        ]
@@ -0,0 +1,276 @@
+"""응답 디코딩 옵션, 디코딩 타입 생성 및 디코더 캐시."""
+
+from dataclasses import dataclass, replace
+from functools import cache
+from typing import Any, Self, get_args
+
+import msgspec
+from msgspec.structs import FieldInfo
+
+# 목록 응답에서 항목 목록을 담는 필드 (JSON 키는 "list")
+ITEMS_FIELD = "items"
+
+_EMPTY_LIST = msgspec.Raw(b"[]")
+
+# 인턴 테이블 최대 크기 (가득 차면 새 문자열은 인턴하지 않음)
+DEFAULT_INTERN_SIZE = 65536
+
+# 값의 종류가 적어 여러 항목·회사에 걸쳐 반복되는 필드 (재무, 정기보고서).
+# 접수번호·회사명·비고처럼 값이 거의 반복되지 않는 필드는 테이블을 먼저 채워
+# 다른 필드가 인턴되지 못하게 하므로 제외
+INTERN_FIELDS = frozenset(
+    {
+        # 공통
+        "corp_code",
+        "corp_cls",
+        "stock_code",
+        "stlm_dt",
+        "bsns_year",
+        "reprt_code",
+        # 재무정보
+        "fs_div",
+        "fs_nm",
+        "sj_div",
+        "sj_nm",
+        "account_id",
+        "account_nm",
+        "thstrm_nm",
+        "frmtrm_nm",
+        "frmtrm_q_nm",
+        "bfefrmtrm_nm",
+        "currency",
+        "idx_cl_code",
+        "idx_cl_nm",
+        "idx_code",
+        "idx_nm",
+        # 정기보고서
+        "se",
+        "stock_knd",
+        "ofcps",
+        "sexdstn",
+        "adtor",
+        "fo_bbm",
+        "chrg_job",
+        "relate",
+        "acqs_mth1",
+        "acqs_mth2",
+        "acqs_mth3",
+    }
+)
+
+
+@dataclass(frozen=True)
+class DecodeOptions:
+    """응답 디코딩 옵션.
+
+    - `raw`: `status`/`message`만 검사하고 목록 응답의 `list`를 디코딩하지 않은
+      `msgspec.Raw`(원본 JSON 조각)로 반환합니다.
+    - `fields`: 목록 항목을 지정한 필드만 가진 구조체로 디코딩하고 나머지 키는
+      건너뜁니다. 모델에 없는 필드 이름은 무시합니다.
+    - `intern`: 디코딩 후 값이 반복되는 문자열 필드(`INTERN_FIELDS`)를 크기가
+      제한된 테이블로 인턴해 같은 값이 하나의 `str` 객체를 공유하게 합니다.
+    - `compact`: 목록 항목을 GC가 추적하지 않는(`gc=False`) 하위 구조체로
+      디코딩합니다. 항목은 문자열·숫자 필드만 가지므로 순환 참조가 생기지 않고,
+      대량의 항목을 보관할 때 GC 순회 비용과 객체당 GC 헤더가 줄어듭니다.
+    - `frozen`: 목록 항목을 변경할 수 없고 해시 가능한 하위 구조체로 디코딩해
+      `dict` 키나 `set` 원소로 쓸 수 있게 합니다.
+
+    `compact`/`frozen` 항목은 원래 모델의 하위 클래스이므로 `isinstance` 검사와
+    타입 힌트는 그대로 유효합니다 (`fields`와 함께 쓰면 선택한 필드만 가진 구조체).
+
+    목록이 없는 응답(`get_company` 등)에는 적용되지 않습니다.
+    """
+
+    raw: bool = False
+    fields: frozenset[str] | None = None
+    intern: bool = False
+    compact: bool = False
+    frozen: bool = False
+
+    def __post_init__(self) -> None:
+        if self.fields is not None and not isinstance(self.fields, frozenset):
+            object.__setattr__(self, "fields", frozenset(self.fields))
+
+    def require(self, *names: str) -> Self:
+        """필드 선택 시 `names`를 함께 디코딩하고 raw 모드를 해제한 옵션."""
+        fields = self.fields | frozenset(names) if self.fields is not None else None
+        return replace(self, raw=False, fields=fields)
+
+
+DEFAULT_OPTIONS = DecodeOptions()
+
+
+def _field_spec(field: FieldInfo, type_: Any) -> tuple[str, Any, Any]:
+    if field.default is not msgspec.NODEFAULT:
+        default = msgspec.field(default=field.default, name=field.encode_name)
+    elif field.default_factory is not msgspec.NODEFAULT:
+        default = msgspec.field(
+            default_factory=field.default_factory, name=field.encode_name
+        )
+    else:
+        default = msgspec.field(name=field.encode_name)
+    return field.name, type_, default
+
+
+def _rebuild(
+    struct_type: type[msgspec.Struct],
+    suffix: str,
+    fields: list[tuple[str, Any, Any]],
+    **config: Any,
+) -> type[msgspec.Struct]:
+    return msgspec.defstruct(
+        f"{struct_type.__name__}{suffix}",
+        fields,
+        kw_only=True,
+        module=struct_type.__module__,
+        **config,
+    )
+
+
+@cache
+def _item_variant(
+    item_type: type[msgspec.Struct],
+    fields: frozenset[str] | None,
+    compact: bool,
+    frozen: bool,
+) -> type[msgspec.Struct]:
+    """옵션을 반영한 항목 구조체.
+
+    필드 선택 시 선택한 필드만 가진 새 구조체를, 그 외에는 원래 모델의 하위
+    클래스를 만듭니다.
+    """
+    config = {}
+    suffix = ""
+    if compact:
+        config["gc"] = False
+        suffix += "Compact"
+    if frozen:
+        config["frozen"] = True
+        suffix += "Frozen"
+    if fields is None:
+        return type(
+            f"{item_type.__name__}{suffix}",
+            (item_type,),
+            {"__module__": item_type.__module__},
+            **config,
+        )
+    return _rebuild(
+        item_type,
+        f"Projection{suffix}",
+        [
+            _field_spec(field, field.type)
+            for field in msgspec.structs.fields(item_type)
+            if field.name in fields
+        ],
+        **config,
+    )
+
+
+@cache
+def decode_type(
+    response_type: type[msgspec.Struct], options: DecodeOptions
+) -> type[msgspec.Struct]:
+    """옵션을 반영한 디코딩 대상 타입 (타입·옵션별로 한 번만 생성)."""
+    if not (
+        options.raw or options.fields is not None or options.compact or options.frozen
+    ):
+        return response_type
+    fields = msgspec.structs.fields(response_type)
+    items = next((field for field in fields if field.name == ITEMS_FIELD), None)
+    if items is None:
+        return response_type
+
+    if options.raw:
+        suffix = "Raw"
+        items_spec = (
+            items.name,
+            msgspec.Raw,
+            msgspec.field(default=_EMPTY_LIST, name=items.encode_name),
+        )
+    else:
+        (item_type,) = get_args(items.type)
+        variant = _item_variant(
+            item_type, options.fields, options.compact, options.frozen
+        )
+        suffix = variant.__name__.removeprefix(item_type.__name__)
+        items_spec = _field_spec(items, list[variant])  # type: ignore[valid-type]
+
+    return _rebuild(
+        response_type,
+        suffix,
+        [
+            items_spec if field is items else _field_spec(field, field.type)
+            for field in fields
+        ],
+    )
+
+
+@cache
+def decoder_for(
+    response_type: type[msgspec.Struct], options: DecodeOptions = DEFAULT_OPTIONS
+) -> msgspec.json.Decoder:
+    """응답 타입·옵션별로 한 번만 만들어 재사용하는 JSON 디코더.
+
+    `msgspec.json.decode(..., type=...)`는 호출마다 타입 정보를 해석하므로
+    요청마다 디코딩하는 경로에서는 미리 만든 디코더를 사용합니다.
+    """
+    return msgspec.json.Decoder(decode_type(response_type, options))
+
+
+class InternTable:
+    """크기가 제한된 문자열 인턴 테이블.
+
+    `sys.intern`과 달리 테이블 크기를 제한하므로 값의 종류가 많은 필드가
+    섞여도 메모리가 무한히 늘지 않습니다.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_INTERN_SIZE) -> None:
+        """테이블 초기화.
+
+        Args:
+            max_size: 최대 문자열 수
+        """
+        self.max_size = max_size
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __call__(self, value: str) -> str:
+        """테이블에 있는 같은 문자열 반환 (없으면 여유가 있을 때 추가)."""
+        interned = self._strings.get(value)
+        if interned is not None:
+            return interned
+        if len(self._strings) < self.max_size:
+            self._strings[value] = value
+        return value
+
+    def clear(self) -> None:
+        """테이블 비우기."""
+        self._strings.clear()
+
+
+_default_table = InternTable()
+
+
+@cache
+def _intern_names(item_type: type[msgspec.Struct]) -> tuple[str, ...]:
+    return tuple(
+        field.name
+        for field in msgspec.structs.fields(item_type)
+        if field.name in INTERN_FIELDS
+    )
+
+
+def intern_items(items: list[msgspec.Struct], table: InternTable | None = None) -> None:
+    """목록 항목의 반복 문자열 필드를 제자리에서 인턴."""
+    if not items:
+        return
+    table = table or _default_table
+    names = _intern_names(type(items[0]))
+    setattr_ = msgspec.structs.force_setattr
+    for item in items:
+        for name in names:
+            value = getattr(item, name)
+            if type(value) is str:
+                setattr_(item, name, table(value))
@@ -12,6 +12,27 @@ class OpenDartError(Exception):
         super().__init__(message)
 
 
+class DownloadTooLargeError(OpenDartError):
+    """다운로드 크기 제한 초과."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"Download exceeds max_size ({max_size} bytes)")
+
+
+class NoAvailableKeyError(OpenDartError):
+    """사용 가능한 API 키 없음 (모든 키가 인증 오류 또는 한도 초과)."""
+
+
+class QuotaExceededError(OpenDartError):
+    """로컬 할당량 관리자의 한도 또는 예약분 도달."""
+
+    def __init__(self, message: str, *, exhausted: bool = True):
+        # False면 낮은 우선순위 요청이 예약분에만 닿은 경우 (키 한도는 남음)
+        self.exhausted = exhausted
+        super().__init__(message)
+
+
 class APIError(OpenDartError):
     """API 응답 오류."""
 
@@ -0,0 +1,175 @@
+"""여러 API 키의 사용량 추적 및 순환."""
+
+import asyncio
+import time
+from collections.abc import Collection, Iterable
+from datetime import date, datetime, timedelta
+
+from opendart_fss.constants import KST, StatusCode
+from opendart_fss.exceptions import (
+    AuthenticationError,
+    NoAvailableKeyError,
+    QuotaExceededError,
+    RateLimitError,
+)
+
+
+def _today() -> date:
+    return datetime.now(KST).date()
+
+
+def _next_month(day: date) -> date:
+    return (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+
+class _KeyState:
+    __slots__ = ("blocked_until", "cooldown_until", "dead", "key", "requests")
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.requests = 0  # 오늘(KST) 요청 수
+        self.dead = False  # 인증 오류로 사용 불가
+        # 일간/월간 한도 초과 시 이 날짜(KST)부터 재사용
+        self.blocked_until: date | None = None
+        self.cooldown_until = 0.0  # 013 일시 제한 해제 시각 (monotonic)
+
+
+class APIKeyPool:
+    """여러 API 키의 사용량 추적 및 순환.
+
+    요청마다 사용 가능한 키 중 오늘(KST) 요청 수가 가장 적은 키를 고릅니다.
+    `RateLimitError`를 받은 키는 013이면 `cooldown`초, 014/015는 다음 날,
+    016은 다음 달까지 제외하고, `AuthenticationError`를 받은 키는 더 이상
+    사용하지 않습니다. 클라이언트 할당량 관리자(`QuotaManager`)의 한도에
+    도달한 키는 다음 날까지 제외합니다.
+
+    Example:
+        ```python
+        client = OpenDartClient(api_key=["KEY_1", "KEY_2", "KEY_3"])
+
+        # 또는 직접 구성
+        pool = APIKeyPool(["KEY_1", "KEY_2"], daily_limit=20000)
+        client = OpenDartClient(api_key=pool)
+        print(pool.usage())
+        ```
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        *,
+        daily_limit: int | None = None,
+        cooldown: float = 60.0,
+    ) -> None:
+        """키 풀 초기화.
+
+        Args:
+            keys: API 키 목록
+            daily_limit: 키별 일일 최대 요청 수 (도달하면 다음 날까지 제외)
+            cooldown: 013 일시 제한을 받은 키를 제외할 시간 (초)
+
+        Raises:
+            ValueError: 키가 하나도 없는 경우
+        """
+        self._states = {key: _KeyState(key) for key in keys}
+        if not self._states:
+            raise ValueError("APIKeyPool requires at least one API key.")
+        self.daily_limit = daily_limit
+        self.cooldown = cooldown
+        self._day = _today()
+
+    @property
+    def keys(self) -> list[str]:
+        """등록된 키 목록."""
+        return list(self._states)
+
+    def usage(self) -> dict[str, int]:
+        """키별 오늘(KST) 요청 수."""
+        self._roll_day()
+        return {key: state.requests for key, state in self._states.items()}
+
+    def available_keys(self) -> list[str]:
+        """지금 바로 사용할 수 있는 키 목록."""
+        self._roll_day()
+        now = time.monotonic()
+        return [
+            state.key
+            for state in self._states.values()
+            if self._is_available(state, now)
+        ]
+
+    async def acquire(self, exclude: Collection[str] = ()) -> str:
+        """다음 요청에 사용할 키를 골라 사용량을 1 증가.
+
+        모든 키가 013 일시 제한 중이면 가장 빨리 풀리는 키를 기다립니다.
+
+        Args:
+            exclude: 이번 요청에 사용하지 않을 키
+
+        Raises:
+            NoAvailableKeyError: 모든 키가 인증 오류 또는 한도 초과 상태인 경우
+        """
+        while True:
+            self._roll_day()
+            now = time.monotonic()
+            candidates = [
+                state
+                for state in self._states.values()
+                if state.key not in exclude and self._is_usable_today(state)
+            ]
+            if not candidates:
+                raise NoAvailableKeyError("No API key is currently usable.")
+
+            ready = [state for state in candidates if state.cooldown_until <= now]
+            if ready:
+                state = min(ready, key=lambda s: s.requests)
+                state.requests += 1
+                return state.key
+
+            await asyncio.sleep(min(s.cooldown_until for s in candidates) - now)
+
+    def report_error(self, key: str, exc: BaseException) -> bool:
+        """키로 보낸 요청의 오류 반영.
+
+        Returns:
+            키가 순환 대상에서 제외되었으면 True
+        """
+        state = self._states.get(key)
+        if state is None:
+            return False
+
+        if isinstance(exc, AuthenticationError):
+            state.dead = True
+            return True
+        if isinstance(exc, QuotaExceededError):
+            # 할당량 관리자가 전송 전에 거절했으므로 사용량에서 제외
+            state.requests -= 1
+            if exc.exhausted:
+                state.blocked_until = _today() + timedelta(days=1)
+            return exc.exhausted
+        if isinstance(exc, RateLimitError):
+            if exc.status == StatusCode.USAGE_LIMIT_EXCEEDED:
+                state.cooldown_until = time.monotonic() + self.cooldown
+            elif exc.status == StatusCode.MONTHLY_LIMIT_EXCEEDED:
+                state.blocked_until = _next_month(_today())
+            else:
+                state.blocked_until = _today() + timedelta(days=1)
+            return True
+        return False
+
+    def _is_usable_today(self, state: _KeyState) -> bool:
+        if state.dead:
+            return False
+        if state.blocked_until is not None and _today() < state.blocked_until:
+            return False
+        return self.daily_limit is None or state.requests < self.daily_limit
+
+    def _is_available(self, state: _KeyState, now: float) -> bool:
+        return self._is_usable_today(state) and state.cooldown_until <= now
+
+    def _roll_day(self) -> None:
+        today = _today()
+        if today != self._day:
+            self._day = today
+            for state in self._states.values():
+                state.requests = 0
@@ -1,67 +1,135 @@
-"""OpenDART API 모델."""
+"""OpenDART API 모델.
+
+모델 모듈은 약 150개의 구조체를 정의하므로 처음 사용할 때 지연 로드합니다.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from opendart_fss.models.base import BaseResponse
-from opendart_fss.models.disclosure import (
-    Company,
-    CompanyResponse,
-    CorpCode,
-    Disclosure,
-    DisclosureListResponse,
-)
-from opendart_fss.models.financial import (
-    FinancialAccount,
-    FinancialAccountListResponse,
-    FinancialIndicator,
-    FinancialIndicatorListResponse,
-    XbrlTaxonomy,
-    XbrlTaxonomyListResponse,
-)
-from opendart_fss.models.major_event import (
-    BonusIssue,
-    BonusIssueListResponse,
-    CapitalChange,
-    CapitalChangeListResponse,
-    ConvertibleBond,
-    ConvertibleBondListResponse,
-    MergerDecision,
-    MergerDecisionListResponse,
-    SplitDecision,
-    SplitDecisionListResponse,
-)
-from opendart_fss.models.registration import (
-    DebtSecurities,
-    DebtSecuritiesListResponse,
-    EquitySecurities,
-    EquitySecuritiesListResponse,
-    MergerRegistration,
-    MergerRegistrationListResponse,
-    SplitRegistration,
-    SplitRegistrationListResponse,
-)
-from opendart_fss.models.report import (
-    DirectorCompensation,
-    DirectorCompensationListResponse,
-    DividendInfo,
-    DividendInfoListResponse,
-    Employee,
-    EmployeeListResponse,
-    Executive,
-    ExecutiveListResponse,
-    IndividualCompensation,
-    IndividualCompensationListResponse,
-    LargestShareholder,
-    LargestShareholderListResponse,
-    StockChange,
-    StockChangeListResponse,
-    TreasuryStock,
-    TreasuryStockListResponse,
-)
-from opendart_fss.models.shareholder import (
-    ExecutiveStock,
-    ExecutiveStockListResponse,
-    MajorStock,
-    MajorStockListResponse,
-)
+
+if TYPE_CHECKING:
+    from opendart_fss.models.disclosure import (
+        Company,
+        CompanyResponse,
+        CorpCode,
+        Disclosure,
+        DisclosureListResponse,
+    )
+    from opendart_fss.models.financial import (
+        FinancialAccount,
+        FinancialAccountListResponse,
+        FinancialIndicator,
+        FinancialIndicatorListResponse,
+        XbrlTaxonomy,
+        XbrlTaxonomyListResponse,
+    )
+    from opendart_fss.models.major_event import (
+        BonusIssue,
+        BonusIssueListResponse,
+        CapitalChange,
+        CapitalChangeListResponse,
+        ConvertibleBond,
+        ConvertibleBondListResponse,
+        MergerDecision,
+        MergerDecisionListResponse,
+        SplitDecision,
+        SplitDecisionListResponse,
+    )
+    from opendart_fss.models.registration import (
+        DebtSecurities,
+        DebtSecuritiesListResponse,
+        EquitySecurities,
+        EquitySecuritiesListResponse,
+        MergerRegistration,
+        MergerRegistrationListResponse,
+        SplitRegistration,
+        SplitRegistrationListResponse,
+    )
+    from opendart_fss.models.report import (
+        DirectorCompensation,
+        DirectorCompensationListResponse,
+        DividendInfo,
+        DividendInfoListResponse,
+        Employee,
+        EmployeeListResponse,
+        Executive,
+        ExecutiveListResponse,
+        IndividualCompensation,
+        IndividualCompensationListResponse,
+        LargestShareholder,
+        LargestShareholderListResponse,
+        StockChange,
+        StockChangeListResponse,
+        TreasuryStock,
+        TreasuryStockListResponse,
+    )
+    from opendart_fss.models.shareholder import (
+        ExecutiveStock,
+        ExecutiveStockListResponse,
+        MajorStock,
+        MajorStockListResponse,
+    )
+
+_MODULES = {
+    "Company": "disclosure",
+    "CompanyResponse": "disclosure",
+    "CorpCode": "disclosure",
+    "Disclosure": "disclosure",
+    "DisclosureListResponse": "disclosure",
+    "FinancialAccount": "financial",
+    "FinancialAccountListResponse": "financial",
+    "FinancialIndicator": "financial",
+    "FinancialIndicatorListResponse": "financial",
+    "XbrlTaxonomy": "financial",
+    "XbrlTaxonomyListResponse": "financial",
+    "BonusIssue": "major_event",
+    "BonusIssueListResponse": "major_event",
+    "CapitalChange": "major_event",
+    "CapitalChangeListResponse": "major_event",
+    "ConvertibleBond": "major_event",
+    "ConvertibleBondListResponse": "major_event",
+    "MergerDecision": "major_event",
+    "MergerDecisionListResponse": "major_event",
+    "SplitDecision": "major_event",
+    "SplitDecisionListResponse": "major_event",
+    "DebtSecurities": "registration",
+    "DebtSecuritiesListResponse": "registration",
+    "EquitySecurities": "registration",
+    "EquitySecuritiesListResponse": "registration",
+    "MergerRegistration": "registration",
+    "MergerRegistrationListResponse": "registration",
+    "SplitRegistration": "registration",
+    "SplitRegistrationListResponse": "registration",
+    "DirectorCompensation": "report",
+    "DirectorCompensationListResponse": "report",
+    "DividendInfo": "report",
+    "DividendInfoListResponse": "report",
+    "Employee": "report",
+    "EmployeeListResponse": "report",
+    "Executive": "report",
+    "ExecutiveListResponse": "report",
+    "IndividualCompensation": "report",
+    "IndividualCompensationListResponse": "report",
+    "LargestShareholder": "report",
+    "LargestShareholderListResponse": "report",
+    "StockChange": "report",
+    "StockChangeListResponse": "report",
+    "TreasuryStock": "report",
+    "TreasuryStockListResponse": "report",
+    "ExecutiveStock": "shareholder",
+    "ExecutiveStockListResponse": "shareholder",
+    "MajorStock": "shareholder",
+    "MajorStockListResponse": "shareholder",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
 
 __all__ = [
     # Base
@@ -0,0 +1,230 @@
+"""일간/월간 요청 할당량 관리."""
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, time, timedelta
+from enum import IntEnum
+from typing import Literal
+
+from opendart_fss.constants import KST
+from opendart_fss.exceptions import QuotaExceededError
+
+# OpenDART 개인 키 일일 요청 한도
+DEFAULT_DAILY_LIMIT = 20000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    key TEXT NOT NULL,
+    day TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (key, day)
+)
+"""
+
+
+class Priority(IntEnum):
+    """요청 우선순위."""
+
+    LOW = 0  # 배치 작업 등 (예약분을 사용하지 못함)
+    NORMAL = 1  # 기본값
+
+
+_priority: ContextVar[Priority] = ContextVar(
+    "opendart_priority", default=Priority.NORMAL
+)
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """블록 안에서 보내는 요청의 우선순위 지정.
+
+    contextvars 기반이므로 블록 안에서 생성한 태스크에도 적용됩니다.
+
+    Example:
+        ```python
+        with priority(Priority.LOW):
+            await nightly_batch(client)
+        ```
+    """
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """현재 컨텍스트의 요청 우선순위."""
+    return _priority.get()
+
+
+def _key_id(api_key: str) -> str:
+    """저장용 키 식별자 (원본 키는 파일에 남기지 않음)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _today() -> str:
+    return datetime.now(KST).strftime("%Y%m%d")
+
+
+class QuotaManager:
+    """일간/월간 요청 할당량 관리.
+
+    `BaseAPI`가 보내는 모든 HTTP 요청을 키별·일별(KST)로 집계해 SQLite에
+    저장하므로 재시작해도 유지되며, 같은 파일을 쓰는 여러 프로세스가 하나의
+    예산을 공유합니다. 일일 한도 확인과 집계는 하나의 SQL 문으로, 월간 한도가
+    있으면 월간 합계 확인까지 하나의 쓰기 트랜잭션으로 원자적으로 처리합니다.
+
+    `Priority.LOW` 요청은 `reserve`건을 남겨두고 거절(`"raise"`)하거나 다음
+    날까지 대기(`"wait"`)하므로 배치 작업이 대화형 요청의 할당량을 소진하지
+    않습니다. 한도에 도달하면 우선순위와 관계없이 `QuotaExceededError`가
+    발생합니다.
+
+    Example:
+        ```python
+        quota = QuotaManager("~/.cache/opendart_quota.db", reserve=2000)
+        client = OpenDartClient(quota=quota)
+
+        with client.priority(Priority.LOW):
+            await run_batch(client)
+
+        print(quota.remaining(client.api_key))
+        ```
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        daily_limit: int = DEFAULT_DAILY_LIMIT,
+        monthly_limit: int | None = None,
+        reserve: int = 0,
+        low_priority: Literal["raise", "wait"] = "raise",
+    ) -> None:
+        """할당량 관리자 초기화.
+
+        Args:
+            path: 사용량을 저장할 SQLite 파일 경로 (None이면 메모리에만 저장)
+            daily_limit: 키별 일일 한도
+            monthly_limit: 키별 월간 한도 (선택)
+            reserve: 낮은 우선순위 요청이 사용할 수 없는 예약분
+            low_priority: 예약분에 닿은 낮은 우선순위 요청 처리 ("raise"/"wait")
+        """
+        self.path = ":memory:" if path is None else os.path.expanduser(os.fspath(path))
+        self.daily_limit = daily_limit
+        self.monthly_limit = monthly_limit
+        self.reserve = reserve
+        self.low_priority = low_priority
+
+        # sqlite3는 할당량 관리자를 쓸 때만 로드 (패키지 import 시간 단축)
+        import sqlite3
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        if path is not None:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+
+    def used(self, api_key: str) -> int:
+        """키의 오늘(KST) 사용량."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT count FROM usage WHERE key = ? AND day = ?",
+                (_key_id(api_key), _today()),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def used_this_month(self, api_key: str) -> int:
+        """키의 이번 달(KST) 사용량."""
+        with self._lock:
+            return self._month_count(_key_id(api_key), _today())
+
+    def _month_count(self, key_id: str, day: str) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM usage WHERE key = ? AND day LIKE ?",
+            (key_id, f"{day[:6]}%"),
+        ).fetchone()
+        return row[0]
+
+    def remaining(self, api_key: str) -> int:
+        """키의 오늘 남은 요청 수 (월간 한도 반영)."""
+        remaining = self.daily_limit - self.used(api_key)
+        if self.monthly_limit is not None:
+            remaining = min(
+                remaining, self.monthly_limit - self.used_this_month(api_key)
+            )
+        return max(0, remaining)
+
+    async def acquire(
+        self,
+        api_key: str,
+        level: Priority | None = None,
+    ) -> None:
+        """요청 1건을 할당량에 기록.
+
+        Args:
+            api_key: 요청에 사용할 API 키
+            level: 우선순위 (생략 시 현재 컨텍스트의 우선순위)
+
+        Raises:
+            QuotaExceededError: 한도 또는 예약분에 도달한 경우
+        """
+        level = current_priority() if level is None else level
+        limit = self.daily_limit
+        if level < Priority.NORMAL:
+            limit -= self.reserve
+
+        while not await asyncio.to_thread(self._try_consume, api_key, limit):
+            if level >= Priority.NORMAL or self.low_priority == "raise":
+                raise QuotaExceededError(
+                    f"Quota exhausted for {level.name} priority requests "
+                    f"(daily_limit={self.daily_limit}, reserve={self.reserve})",
+                    exhausted=level >= Priority.NORMAL,
+                )
+            await asyncio.sleep(_seconds_until_tomorrow())
+
+    def close(self) -> None:
+        """데이터베이스 연결 종료."""
+        with self._lock:
+            self._conn.close()
+
+    def _try_consume(self, api_key: str, limit: int) -> bool:
+        if limit <= 0:
+            return False
+        key_id, day = _key_id(api_key), _today()
+        with self._lock:
+            if self.monthly_limit is None:
+                return self._increment(key_id, day, limit)
+            # 월간 합계 확인과 증가 사이에 다른 프로세스가 쓰지 못하도록 잠금
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                under_monthly = self._month_count(key_id, day) < self.monthly_limit
+                consumed = under_monthly and self._increment(key_id, day, limit)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return consumed
+
+    def _increment(self, key_id: str, day: str, limit: int) -> bool:
+        """오늘 사용량이 `limit` 미만이면 1 증가 (단일 SQL 문)."""
+        row = self._conn.execute(
+            "INSERT INTO usage (key, day, count) VALUES (?, ?, 1) "
+            "ON CONFLICT (key, day) DO UPDATE SET count = count + 1 "
+            "WHERE count < ? RETURNING count",
+            (key_id, day, limit),
+        ).fetchone()
+        return row is not None
+
+
+def _seconds_until_tomorrow() -> float:
+    now = datetime.now(KST)
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), time(), tzinfo=KST)
+    return (tomorrow - now).total_seconds()
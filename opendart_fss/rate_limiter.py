@@ -0,0 +1,98 @@
+"""클라이언트 공용 Rate Limiter."""
+
+import asyncio
+import time
+from collections import deque
+
+# OpenDART 권장 최대 호출 빈도 (분당)
+DEFAULT_PER_MINUTE = 1000
+
+
+class _Window:
+    """슬라이딩 윈도우 (기간 내 요청 시각 기록)."""
+
+    __slots__ = ("limit", "period", "timestamps")
+
+    def __init__(self, limit: int, period: float) -> None:
+        self.limit = limit
+        self.period = period
+        self.timestamps: deque[float] = deque()
+
+    def delay(self, now: float) -> float:
+        """다음 요청까지 필요한 대기 시간 (초)."""
+        threshold = now - self.period
+        while self.timestamps and self.timestamps[0] <= threshold:
+            self.timestamps.popleft()
+        if len(self.timestamps) < self.limit:
+            return 0.0
+        return self.timestamps[0] + self.period - now
+
+
+class RateLimiter:
+    """슬라이딩 윈도우 기반 Rate Limiter.
+
+    `OpenDartClient`가 소유하며 모든 API 요청은 전송 전에 `acquire()`를
+    거칩니다. 내부 잠금으로 대기자를 FIFO 순서로 직렬화하므로 수백 개의
+    코루틴이 동시에 호출해도 설정한 한도를 넘지 않습니다.
+
+    Example:
+        ```python
+        limiter = RateLimiter(per_minute=600, per_day=20000)
+        client = OpenDartClient(rate_limiter=limiter)
+
+        # 한도 안에서 최대 속도로 실행
+        results = await asyncio.gather(
+            *(client.disclosure.get_company(code) for code in corp_codes)
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        per_minute: int | None = DEFAULT_PER_MINUTE,
+        per_day: int | None = None,
+    ) -> None:
+        """Rate Limiter 초기화.
+
+        Args:
+            per_minute: 60초 동안 허용할 최대 요청 수 (None이면 제한 없음)
+            per_day: 24시간 동안 허용할 최대 요청 수 (None이면 제한 없음)
+        """
+        self.per_minute = per_minute
+        self.per_day = per_day
+
+        self._windows: list[_Window] = []
+        if per_minute is not None:
+            self._windows.append(_Window(per_minute, 60.0))
+        if per_day is not None:
+            self._windows.append(_Window(per_day, 86400.0))
+        self._lock = asyncio.Lock()
+        self._total_wait = 0.0
+
+    @property
+    def total_wait(self) -> float:
+        """한도 때문에 대기한 누적 시간 (초)."""
+        return self._total_wait
+
+    async def acquire(self) -> None:
+        """요청 1건을 보낼 수 있을 때까지 대기."""
+        if not self._windows:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                delay = max(window.delay(now) for window in self._windows)
+                if delay <= 0:
+                    break
+                self._total_wait += delay
+                await asyncio.sleep(delay)
+
+            for window in self._windows:
+                window.timestamps.append(now)
+
+    def reset(self) -> None:
+        """기록된 요청 이력 초기화."""
+        for window in self._windows:
+            window.timestamps.clear()
+        self._total_wait = 0.0
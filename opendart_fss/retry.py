@@ -0,0 +1,83 @@
+"""일시적 오류 재시도 정책."""
+
+import random
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import httpx
+
+from opendart_fss.constants import StatusCode
+from opendart_fss.exceptions import APIError, ServerError
+
+type RetryRuleKey = type[BaseException] | str
+
+
+def _default_rules() -> dict[RetryRuleKey, int | None]:
+    return {
+        ServerError: None,  # 800, 900
+        StatusCode.USAGE_LIMIT_EXCEEDED: None,  # 013 일시적 사용 제한
+        httpx.TransportError: None,  # ConnectError, ReadTimeout 등
+    }
+
+
+@dataclass
+class RetryPolicy:
+    """지수 백오프 + 지터 재시도 정책.
+
+    `retry_on`은 예외 클래스 또는 상태 코드별 최대 시도 횟수를 지정합니다.
+    값이 None이면 `max_attempts`를 사용하고, 규칙에 없는 예외는 재시도하지
+    않습니다. 상태 코드 규칙이 클래스 규칙보다 우선하며, 클래스 규칙은 가장
+    구체적인 클래스부터 찾습니다.
+
+    Example:
+        ```python
+        policy = RetryPolicy(
+            max_attempts=5,
+            retry_on={
+                ServerError: None,
+                StatusCode.USAGE_LIMIT_EXCEEDED: 8,
+                httpx.ConnectError: 3,
+            },
+        )
+        client = OpenDartClient(retry_policy=policy)
+        ```
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 16.0
+    backoff_factor: float = 2.0
+    jitter: float = 0.5
+    retry_on: Mapping[RetryRuleKey, int | None] = field(default_factory=_default_rules)
+
+    def attempts_for(self, exc: BaseException) -> int:
+        """예외에 적용할 최대 시도 횟수 (재시도 대상이 아니면 1)."""
+        if (
+            isinstance(exc, APIError)
+            and exc.status is not None
+            and exc.status in self.retry_on
+        ):
+            limit = self.retry_on[exc.status]
+            return self.max_attempts if limit is None else limit
+
+        for cls in type(exc).__mro__:
+            if cls in self.retry_on:
+                limit = self.retry_on[cls]
+                return self.max_attempts if limit is None else limit
+        return 1
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """`attempt`번째 시도가 `exc`로 실패했을 때 재시도 여부."""
+        return attempt < self.attempts_for(exc)
+
+    def compute_delay(self, attempt: int) -> float:
+        """`attempt`번째 실패 후 대기 시간 (초).
+
+        `base_delay * backoff_factor ** (attempt - 1)`을 `max_delay`로 제한한 뒤
+        `jitter` 비율만큼 무작위로 줄입니다.
+        """
+        delay = min(
+            self.max_delay,
+            self.base_delay * self.backoff_factor ** (attempt - 1),
+        )
+        return delay * (1 - self.jitter * random.random())
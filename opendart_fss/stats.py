@@ -0,0 +1,47 @@
+"""클라이언트 요청 통계."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ClientStats:
+    """클라이언트 요청 통계.
+
+    `requests`는 실제 HTTP 전송 시도 횟수이며 재시도를 포함합니다.
+    `coalesced`는 진행 중인 동일 요청에 합류해 전송을 생략한 횟수입니다.
+    `cache_hits`/`cache_misses`는 응답 캐시가 설정된 경우에만 집계됩니다.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    retry_wait: float = 0.0  # 재시도 대기 누적 시간 (초)
+    coalesced: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    retries_by_error: Counter[str] = field(default_factory=Counter)
+
+    def record_retry(self, exc: BaseException, delay: float) -> None:
+        """재시도 1회 기록."""
+        self.retries += 1
+        self.retry_wait += delay
+        self.retries_by_error[_error_key(exc)] += 1
+
+    def reset(self) -> None:
+        """통계 초기화."""
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.retry_wait = 0.0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.retries_by_error.clear()
+
+
+def _error_key(exc: BaseException) -> str:
+    status = getattr(exc, "status", None)
+    if isinstance(status, str):
+        return f"{type(exc).__name__}({status})"
+    return type(exc).__name__
@@ -49,6 +49,7 @@ class AdaptiveRateLimiter:
         self._current_delay = min_delay
         self._last_request_time: float = 0.0
         self._rate_limit_count = 0
+        self._lock = asyncio.Lock()
 
     @property
     def current_delay(self) -> float:
@@ -62,13 +63,14 @@ class AdaptiveRateLimiter:
 
     async def wait(self) -> None:
         """다음 요청 전 필요한 시간만큼 대기."""
-        now = time.monotonic()
-        elapsed = now - self._last_request_time
+        async with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_request_time
 
-        if elapsed < self._current_delay:
-            await asyncio.sleep(self._current_delay - elapsed)
+            if elapsed < self._current_delay:
+                await asyncio.sleep(self._current_delay - elapsed)
 
-        self._last_request_time = time.monotonic()
+            self._last_request_time = time.monotonic()
 
     def on_success(self) -> None:
         """요청 성공 시 호출. 대기 시간 점진적 감소."""
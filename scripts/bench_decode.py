@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""응답 디코딩 마이크로벤치마크.
+
+`msgspec.json.decode(..., type=...)`와 캐시된 `msgspec.json.Decoder`의 호출당
+디코딩 시간을 작은 응답(company.json)과 큰 응답(fnlttSinglAcntAll.json 형태)에
+대해 비교하고, 필드 선택(`DecodeOptions(fields=...)`)의 효과를 측정합니다.
+
+사용 예시:
+    uv run python scripts/bench_decode.py
+    uv run python scripts/bench_decode.py --rows 5000 --repeat 7
+"""
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+import msgspec
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from opendart_fss.decoding import DecodeOptions, decoder_for
+from opendart_fss.models.disclosure import CompanyResponse
+from opendart_fss.models.financial import FinancialAccountListResponse
+
+
+def company_payload() -> bytes:
+    """기업개황 응답 (작은 응답)."""
+    return msgspec.json.encode(
+        {
+            "status": "000",
+            "message": "정상",
+            "corp_code": "00126380",
+            "corp_name": "삼성전자(주)",
+            "corp_name_eng": "SAMSUNG ELECTRONICS CO,.LTD",
+            "stock_name": "삼성전자",
+            "stock_code": "005930",
+            "ceo_nm": "한종희, 경계현",
+            "corp_cls": "Y",
+            "jurir_no": "1301110006246",
+            "bizr_no": "1248100998",
+            "adres": "경기도 수원시 영통구  삼성로 129 (매탄동)",
+            "hm_url": "www.samsung.com/sec",
+            "ir_url": "",
+            "phn_no": "02-2255-0114",
+            "fax_no": "031-200-7538",
+            "induty_code": "264",
+            "est_dt": "19690113",
+            "acc_mt": "12",
+        }
+    )
+
+
+def full_statements_payload(rows: int) -> bytes:
+    """전체 재무제표 응답 (큰 응답)."""
+    items = [
+        {
+            "rcept_no": "20240312000736",
+            "reprt_code": "11011",
+            "bsns_year": "2023",
+            "corp_code": "00126380",
+            "sj_div": "BS",
+            "sj_nm": "재무상태표",
+            "account_id": f"ifrs-full_Account{i}",
+            "account_nm": f"계정{i}",
+            "account_detail": "-",
+            "thstrm_nm": "제 55 기",
+            "thstrm_amount": str(1_000_000 * i),
+            "frmtrm_nm": "제 54 기",
+            "frmtrm_amount": str(900_000 * i),
+            "bfefrmtrm_nm": "제 53 기",
+            "bfefrmtrm_amount": str(800_000 * i),
+            "ord": str(i),
+            "currency": "KRW",
+        }
+        for i in range(rows)
+    ]
+    return msgspec.json.encode({"status": "000", "message": "정상", "list": items})
+
+
+def compare(
+    name: str,
+    payload: bytes,
+    before: Callable[[bytes], object],
+    after: Callable[[bytes], object],
+    repeat: int,
+) -> None:
+    """두 디코딩 방식의 호출당 시간 출력."""
+    number = max(1, 200_000 // max(1, len(payload) // 100))
+
+    def per_call(decode: Callable[[bytes], object]) -> float:
+        timings = timeit.repeat(lambda: decode(payload), number=number, repeat=repeat)
+        return min(timings) / number
+
+    t_before, t_after = per_call(before), per_call(after)
+    print(
+        f"{name:<28} {len(payload):>10,} B "
+        f"{t_before * 1e6:>12.2f} us {t_after * 1e6:>12.2f} us "
+        f"{(t_before - t_after) * 1e6:>+10.2f} us {t_before / t_after:>7.2f}x"
+    )
+
+
+def header(before: str, after: str) -> None:
+    """결과 표 머리글 출력."""
+    print(
+        f"\n{'payload':<28} {'size':>12} {before:>15} "
+        f"{after:>15} {'saved':>13} {'speedup':>8}"
+    )
+
+
+def main() -> None:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="응답 디코딩 마이크로벤치마크")
+    parser.add_argument("--rows", type=int, default=2000, help="큰 응답의 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    args = parser.parse_args()
+
+    company = company_payload()
+    statements = full_statements_payload(args.rows)
+    large = f"fnlttSinglAcntAll x{args.rows}"
+
+    header("decode(type=)", "Decoder")
+    for name, payload, response_type in (
+        ("company.json", company, CompanyResponse),
+        (large, statements, FinancialAccountListResponse),
+    ):
+        compare(
+            name,
+            payload,
+            lambda p, t=response_type: msgspec.json.decode(p, type=t),
+            decoder_for(response_type).decode,
+            args.repeat,
+        )
+
+    header("all fields", "3 fields")
+    projection = DecodeOptions(fields={"account_nm", "thstrm_amount", "sj_div"})
+    compare(
+        large,
+        statements,
+        decoder_for(FinancialAccountListResponse).decode,
+        decoder_for(FinancialAccountListResponse, projection).decode,
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""패키지 import 시간 벤치마크.
+
+새 인터프리터에서 `python -X importtime`으로 `import opendart_fss`와 클라이언트
+생성, API 모듈 첫 접근까지의 import 시간을 측정합니다. 측정마다 새 프로세스를
+띄우므로 콜드 스타트(CLI, 서버리스 핸들러) 비용에 해당합니다. 모듈별 내역은
+`python -X importtime -c "import opendart_fss"`로 확인할 수 있습니다.
+
+사용 예시:
+    uv run python scripts/bench_import.py
+    uv run python scripts/bench_import.py --repeat 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+SCENARIOS = {
+    "import opendart_fss": "import opendart_fss",
+    "+ OpenDartClient()": (
+        "import opendart_fss; opendart_fss.OpenDartClient(api_key='x')"
+    ),
+    "+ client.disclosure": (
+        "import opendart_fss; opendart_fss.OpenDartClient(api_key='x').disclosure"
+    ),
+    "+ all API modules": (
+        "import opendart_fss; c = opendart_fss.OpenDartClient(api_key='x'); "
+        "c.disclosure, c.report, c.financial, c.shareholder, c.major_event, "
+        "c.registration"
+    ),
+}
+
+
+def importtime(code: str, exclude: frozenset[str] = frozenset()) -> dict[str, int]:
+    """새 프로세스에서 코드를 실행하고 최상위 import별 누적 시간(us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        # 들여쓰기가 없는 모듈이 최상위 import (하위 import 시간 포함)
+        if not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return {name: us for name, us in times.items() if name not in exclude}
+
+
+def main() -> None:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="패키지 import 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    args = parser.parse_args()
+
+    # 인터프리터 시작 시 불러오는 모듈(site 등)은 제외
+    startup = frozenset(importtime("pass"))
+
+    print(f"{'scenario':<24} {'median':>10} {'min':>10}")
+    for name, code in SCENARIOS.items():
+        totals = [sum(importtime(code, startup).values()) for _ in range(args.repeat)]
+        print(
+            f"{name:<24} {statistics.median(totals) / 1e3:>7.1f} ms "
+            f"{min(totals) / 1e3:>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""대량 재무 데이터 디코딩 메모리 벤치마크.
+
+여러 회사의 전체 재무제표 응답(fnlttSinglAcntAll.json 형태)을 디코딩해 모두
+보관할 때의 메모리 사용량을 디코딩 옵션별로 비교합니다. 회사마다 응답이
+따로 오므로 계정명 등 반복 문자열은 응답마다 별도 객체로 만들어집니다.
+디코딩 결과를 보관한 상태에서 전체 GC(`gc.collect()`) 한 번에 걸리는 시간도
+함께 측정합니다 (`compact` 옵션은 항목을 GC 추적 대상에서 제외).
+
+사용 예시:
+    uv run python scripts/bench_memory.py
+    uv run python scripts/bench_memory.py --companies 500 --accounts 200
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import msgspec
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from opendart_fss.decoding import DecodeOptions, decoder_for, intern_items
+from opendart_fss.models.financial import FinancialAccountListResponse
+
+
+def company_payload(corp_no: int, accounts: int) -> bytes:
+    """한 회사의 전체 재무제표 응답."""
+    sj = [("BS", "재무상태표"), ("IS", "손익계산서"), ("CF", "현금흐름표")]
+    items = [
+        {
+            "rcept_no": f"20240312{corp_no:06d}",
+            "reprt_code": "11011",
+            "bsns_year": "2023",
+            "corp_code": f"{corp_no:08d}",
+            "sj_div": sj[i % 3][0],
+            "sj_nm": sj[i % 3][1],
+            "account_id": f"ifrs-full_Account{i}",
+            "account_nm": f"계정{i}",
+            "account_detail": "-",
+            "thstrm_nm": "제 55 기",
+            "thstrm_amount": str(1_000_003 * (corp_no + 1) * (i + 1)),
+            "frmtrm_nm": "제 54 기",
+            "frmtrm_amount": str(900_001 * (corp_no + 1) * (i + 1)),
+            "bfefrmtrm_nm": "제 53 기",
+            "bfefrmtrm_amount": str(800_011 * (corp_no + 1) * (i + 1)),
+            "ord": str(i),
+            "currency": "KRW",
+        }
+        for i in range(accounts)
+    ]
+    return msgspec.json.encode({"status": "000", "message": "정상", "list": items})
+
+
+def decode_all(payloads: list[bytes], options: DecodeOptions) -> list:
+    """모든 응답을 디코딩한 행 목록."""
+    decoder = decoder_for(FinancialAccountListResponse, options)
+    rows = []
+    for payload in payloads:
+        items = decoder.decode(payload).items
+        if options.intern:
+            intern_items(items)
+        rows.extend(items)
+    return rows
+
+
+def measure(
+    payloads: list[bytes], options: DecodeOptions
+) -> tuple[int, float, float, int]:
+    """디코딩 결과를 보관했을 때의 메모리, 디코딩 시간, GC 시간, 행 수."""
+    gc.collect()
+    start = time.perf_counter()
+    rows = decode_all(payloads, options)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    gc.collect()
+    collect = time.perf_counter() - start
+    del rows
+
+    gc.collect()
+    tracemalloc.start()
+    rows = decode_all(payloads, options)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, collect, len(rows)
+
+
+def main() -> None:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="대량 디코딩 메모리 벤치마크")
+    parser.add_argument("--companies", type=int, default=200, help="회사 수")
+    parser.add_argument("--accounts", type=int, default=150, help="회사당 계정 수")
+    args = parser.parse_args()
+
+    payloads = [company_payload(i, args.accounts) for i in range(args.companies)]
+    variants = {
+        "default": DecodeOptions(),
+        "intern": DecodeOptions(intern=True),
+        "compact": DecodeOptions(compact=True),
+        "compact+intern": DecodeOptions(compact=True, intern=True),
+        "compact+frozen+intern": DecodeOptions(compact=True, frozen=True, intern=True),
+    }
+
+    baseline = None
+    print(
+        f"{'options':<24} {'rows':>10} {'memory':>12} {'ratio':>7} "
+        f"{'time':>10} {'gc':>10}"
+    )
+    for name, options in variants.items():
+        size, elapsed, collect, rows = measure(payloads, options)
+        baseline = baseline or size
+        print(
+            f"{name:<24} {rows:>10,} {size / 2**20:>9.1f} MiB "
+            f"{size / baseline:>6.2f}x {elapsed * 1e3:>7.1f} ms "
+            f"{collect * 1e3:>7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
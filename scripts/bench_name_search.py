@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""회사명 검색 벤치마크.
+
+CORPCODE.xml 규모(약 10만 건)의 가상 회사명으로 `NameSearchIndex`를 만들고
+접두어·초성·오타 허용 검색의 질의당 지연 시간을 측정합니다. 회사명은 자주
+쓰이는 음절과 업종 접미어를 섞어 만들므로 실제 이름처럼 바이그램 빈도가
+치우쳐 있습니다.
+
+사용 예시:
+    uv run python scripts/bench_name_search.py
+    uv run python scripts/bench_name_search.py --names 200000 --repeat 1000
+"""
+
+import argparse
+import random
+import sys
+import time
+import timeit
+from pathlib import Path
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from opendart_fss.corp_codes import NameSearchIndex
+from opendart_fss.models.disclosure import CorpCode
+
+COMMON = "한국대성산업동아신화진흥우리하나미래세진일성삼성현대금강태평양광명서울부산"
+SUFFIXES = [
+    "전자", "건설", "화학", "바이오", "제약", "테크", "에너지", "홀딩스", "산업",
+    "물산", "중공업", "증권", "보험", "반도체", "소재", "통신", "식품", "유통",
+    "기계", "정밀", "엔지니어링", "인베스트먼트", "파트너스", "시스템", "개발",
+]  # fmt: skip
+
+QUERIES = {
+    "exact": "삼성전자",
+    "prefix": "삼성전",
+    "prefix (1 char)": "삼",
+    "chosung": "ㅅㅅㅈㅈ",
+    "chosung (1 char)": "ㅅ",
+    "mixed chosung": "삼성ㅈ",
+    "typo": "삼성젼자",
+    "typo (long)": "에스케이하닉스",
+    "no match": "zzzz",
+}
+
+
+def company_names(count: int) -> list[CorpCode]:
+    """가상 고유번호 목록 (약 3%는 상장사)."""
+    rng = random.Random(0)
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(60)]
+    syllables += list(COMMON) * 3
+    corps = [
+        CorpCode(corp_code="00126380", corp_name="삼성전자", stock_code="005930"),
+        CorpCode(
+            corp_code="00164779", corp_name="에스케이하이닉스", stock_code="000660"
+        ),
+    ]
+    for i in range(count - len(corps)):
+        name = "".join(rng.choices(syllables, k=rng.randint(2, 4)))
+        if rng.random() < 0.5:
+            name += rng.choice(SUFFIXES)
+        if rng.random() < 0.1:
+            name = "(주)" + name
+        corps.append(
+            CorpCode(
+                corp_code=f"{i:08d}",
+                corp_name=name,
+                stock_code=f"{i:06d}" if i % 30 == 0 else None,
+            )
+        )
+    return corps
+
+
+def main() -> None:
+    """메인 함수."""
+    parser = argparse.ArgumentParser(description="회사명 검색 벤치마크")
+    parser.add_argument("--names", type=int, default=100_000, help="회사 수")
+    parser.add_argument("--repeat", type=int, default=300, help="질의당 반복 횟수")
+    args = parser.parse_args()
+
+    corps = company_names(args.names)
+    start = time.perf_counter()
+    names = NameSearchIndex(corps)
+    print(f"build: {time.perf_counter() - start:.2f} s ({len(names):,} names)\n")
+
+    print(f"{'query':<18} {'text':<10} {'latency':>10}  top result")
+    for label, query in QUERIES.items():
+        elapsed = timeit.timeit(lambda q=query: names.search(q), number=args.repeat)
+        top = names.search(query, limit=1)
+        print(
+            f"{label:<18} {query:<10} {elapsed / args.repeat * 1e3:>7.3f} ms  "
+            f"{top[0].corp_name if top else '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 """pytest 설정."""
 
 import os
+from collections.abc import Callable
+from typing import Any
 
+import httpx
 import pytest
 
+from opendart_fss import OpenDartClient, RateLimiter, RetryPolicy
+
 
 @pytest.fixture
 def api_key() -> str:
@@ -15,3 +20,22 @@ def api_key() -> str:
 def sample_corp_code() -> str:
     """삼성전자 고유번호."""
     return "00126380"
+
+
+@pytest.fixture
+def make_client(api_key: str) -> Callable[..., OpenDartClient]:
+    """MockTransport 기반 테스트 클라이언트 생성 함수."""
+
+    def factory(
+        handler: Callable[[httpx.Request], httpx.Response],
+        **kwargs: Any,
+    ) -> OpenDartClient:
+        kwargs.setdefault("rate_limiter", RateLimiter(per_minute=None))
+        kwargs.setdefault("retry_policy", RetryPolicy(base_delay=0.0))
+        kwargs.setdefault("api_key", api_key)
+        return OpenDartClient(
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            **kwargs,
+        )
+
+    return factory
@@ -3,6 +3,7 @@
 import os
 
 import pytest
+from dotenv import load_dotenv
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -17,8 +18,9 @@ def pytest_configure(config: pytest.Config) -> None:
 def api_key() -> str:
     """실제 API 키.
 
-    환경변수 OPENDART_API_KEY가 설정되어 있어야 합니다.
+    환경변수 OPENDART_API_KEY가 설정되어 있어야 합니다 (.env 파일 사용 가능).
     """
+    load_dotenv()
     key = os.environ.get("OPENDART_API_KEY")
     if not key:
         pytest.skip("OPENDART_API_KEY environment variable not set")
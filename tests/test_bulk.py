@@ -0,0 +1,111 @@
+"""동시 실행기 테스트."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from opendart_fss import NotFoundError, OpenDartClient
+
+
+def _mock_handler(request: httpx.Request) -> httpx.Response:
+    corp_code = request.url.params["corp_code"]
+    if corp_code == "missing":
+        return httpx.Response(200, json={"status": "100", "message": "no data"})
+    return httpx.Response(
+        200,
+        json={
+            "status": "000",
+            "message": "정상",
+            "list": [{"rcept_no": "1", "corp_code": corp_code}],
+        },
+    )
+
+
+class TestBulkMap:
+    """client.bulk.map 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_runs_all_params(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """모든 인자를 실행하고 실패는 예외 객체로 반환."""
+        client = make_client(_mock_handler)
+        params = [{"corp_code": "00000001"}, {"corp_code": "00000002"}]
+
+        results = [
+            item
+            async for item in client.bulk.map(
+                client.shareholder.get_major_stock, params, concurrency=2
+            )
+        ]
+
+        assert sorted(p["corp_code"] for p, _ in results) == ["00000001", "00000002"]
+        for p, result in results:
+            assert result[0].corp_code == p["corp_code"]
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_returned(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """실패한 호출은 예외를 결과로 반환하고 나머지는 계속 실행."""
+        client = make_client(_mock_handler)
+        results = dict(
+            [
+                item
+                async for item in client.bulk.map(
+                    client.shareholder.get_major_stock, ["missing", "00000001"]
+                )
+            ]
+        )
+        assert isinstance(results["missing"], NotFoundError)
+        assert results["00000001"][0].corp_code == "00000001"
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """동시 실행 수 제한."""
+        client = make_client(_mock_handler)
+        running = peak = 0
+
+        async def method(value: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value * 2
+
+        results = [
+            item async for item in client.bulk.map(method, range(20), concurrency=3)
+        ]
+        assert peak == 3
+        assert sorted(results) == [(i, i * 2) for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_break_cancels_in_flight(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """반복을 중단하면 진행 중인 호출 취소."""
+        client = make_client(_mock_handler)
+        cancelled = 0
+
+        async def method(value: int) -> int:
+            nonlocal cancelled
+            if value == 0:
+                return value
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return value
+
+        stream = client.bulk.map(method, range(4), concurrency=4)
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert cancelled == 3
@@ -0,0 +1,184 @@
+"""응답 캐시 테스트."""
+
+from collections.abc import Callable
+
+import httpx
+import msgspec
+import pytest
+
+from opendart_fss import MemoryCache, OpenDartClient
+from opendart_fss.cache import ResponseCache, bsns_year_older_than, cache_key
+from opendart_fss.exceptions import NotFoundError
+from opendart_fss.models.financial import (
+    FinancialAccountListResponse,
+    XbrlTaxonomyListResponse,
+)
+
+
+def _response() -> FinancialAccountListResponse:
+    return FinancialAccountListResponse(status="000", message="", items=[])
+
+
+class TestCacheKey:
+    """캐시 키 테스트."""
+
+    def test_excludes_api_key_and_sorts(self) -> None:
+        """인증키 제외, 파라미터 순서 무관."""
+        a = cache_key("/api/x.json", {"crtfc_key": "k1", "b": 2, "a": "1"})
+        b = cache_key("/api/x.json", {"a": 1, "b": "2", "crtfc_key": "k2"})
+        assert a == b == "/api/x.json?a=1&b=2"
+
+    def test_variant(self) -> None:
+        """디코딩 변형별로 다른 키."""
+        base = cache_key("/api/x.json", {"a": 1})
+        assert cache_key("/api/x.json", {"a": 1}, "ListRaw") != base
+        assert cache_key("/api/x.json", {"a": 1}, None) == base
+
+
+class TestResponseCache:
+    """캐시 기본 클래스 테스트."""
+
+    def test_incomplete_backend(self) -> None:
+        """메서드를 모두 구현하지 않은 하위 클래스는 생성할 수 없음."""
+
+        class GetOnly(ResponseCache):
+            async def get(self, key, response_type):  # type: ignore[override]
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnly()  # type: ignore[abstract]
+
+
+class TestMemoryCache:
+    """MemoryCache 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entries(self) -> None:
+        """항목 수 초과 시 가장 오래 사용하지 않은 항목 제거."""
+        cache = MemoryCache(max_entries=2)
+        for key in ("a", "b"):
+            await cache.set(key, _response(), b"x", None)
+        assert await cache.get("a", FinancialAccountListResponse) is not None
+        await cache.set("c", _response(), b"x", None)
+
+        assert await cache.get("b", FinancialAccountListResponse) is None
+        assert await cache.get("a", FinancialAccountListResponse) is not None
+        assert len(cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_bytes(self) -> None:
+        """메모리 예산 초과 시 제거."""
+        cache = MemoryCache(max_bytes=10)
+        await cache.set("a", _response(), b"123456", None)
+        await cache.set("b", _response(), b"123456", None)
+        assert len(cache) == 1
+        assert cache.total_bytes == 6
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self) -> None:
+        """TTL 만료 항목은 조회되지 않음."""
+        cache = MemoryCache()
+        await cache.set("a", _response(), b"x", -1)
+        assert await cache.get("a", FinancialAccountListResponse) is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_type_mismatch_is_miss(self) -> None:
+        """다른 응답 타입으로 조회하면 미스."""
+        cache = MemoryCache()
+        await cache.set("a", _response(), b"x", None)
+        assert await cache.get("a", XbrlTaxonomyListResponse) is None
+
+    def test_endpoint_ttls(self) -> None:
+        """엔드포인트별 TTL."""
+        cache = MemoryCache(ttl=60, endpoint_ttls={"/api/company.json": 0})
+        assert cache.ttl_for("/api/list.json", {}) == 60
+        assert cache.ttl_for("/api/company.json", {}) == 0
+        assert cache.ttl_for("/api/xbrlTaxonomy.json", {}) is None
+
+
+class TestClientCache:
+    """클라이언트 캐시 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_lookup_served_from_cache(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """두 번째 조회는 HTTP 요청 없이 캐시에서 반환."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                json={"status": "000", "message": "", "list": [{"sj_div": "BS"}]},
+            )
+
+        client = make_client(handler, cache=MemoryCache())
+        first = await client.financial.get_xbrl_taxonomy("BS")
+        second = await client.financial.get_xbrl_taxonomy("BS")
+
+        assert calls == 1
+        assert first is second
+        assert client.stats.cache_hits == 1
+        assert client.stats.cache_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_raw_and_decoded_cached_separately(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """raw 응답과 디코딩 응답은 서로 덮어쓰지 않음."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(
+                200,
+                json={"status": "000", "message": "", "list": [{"sj_div": "BS"}]},
+            )
+
+        client = make_client(handler, cache=MemoryCache())
+        for _ in range(2):
+            items = await client.financial.get_xbrl_taxonomy("BS")
+            raw = await client.raw.financial.get_xbrl_taxonomy("BS")
+
+        assert calls == 2
+        assert items[0].sj_div == "BS"
+        assert isinstance(raw, msgspec.Raw)
+        assert client.stats.cache_hits == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """오류 응답은 캐시하지 않음."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": "100", "message": ""})
+
+        cache = MemoryCache()
+        client = make_client(handler, cache=cache)
+        with pytest.raises(NotFoundError):
+            await client.financial.get_xbrl_taxonomy("BS")
+        assert len(cache) == 0
+
+
+class TestImmutableRules:
+    """불변 규칙 테스트."""
+
+    def test_bsns_year_older_than(self) -> None:
+        """오래된 사업연도는 만료 없음."""
+        cache = MemoryCache(ttl=60, immutable=[bsns_year_older_than(2)])
+        assert cache.ttl_for("/api/alotMatter.json", {"bsns_year": "2015"}) is None
+        assert cache.ttl_for("/api/alotMatter.json", {"bsns_year": "2099"}) == 60
+        assert cache.ttl_for("/api/list.json", {}) == 60
+
+    def test_disabled_endpoint_stays_disabled(self) -> None:
+        """TTL 0 엔드포인트는 불변 규칙과 무관하게 캐시하지 않음."""
+        cache = MemoryCache(
+            endpoint_ttls={"/api/alotMatter.json": 0},
+            immutable=[bsns_year_older_than(2)],
+        )
+        assert cache.ttl_for("/api/alotMatter.json", {"bsns_year": "2015"}) == 0
@@ -1,7 +1,12 @@
 """클라이언트 테스트."""
 
+import asyncio
+import subprocess
+import sys
+from collections.abc import Callable
 from contextlib import aclosing
 
+import httpx
 import pytest
 
 from opendart_fss import OpenDartClient
@@ -11,6 +16,7 @@ from opendart_fss.api.major_event import MajorEventAPI
 from opendart_fss.api.registration import RegistrationAPI
 from opendart_fss.api.report import ReportAPI
 from opendart_fss.api.shareholder import ShareholderAPI
+from opendart_fss.exceptions import NotFoundError
 
 
 class TestOpenDartClient:
@@ -46,3 +52,131 @@ class TestOpenDartClient:
 
         await client.close()
         assert client._http.is_closed
+
+    def test_api_modules_are_loaded_lazily(self) -> None:
+        """API 모듈과 모델, dotenv, sqlite3는 필요할 때 로드."""
+        code = (
+            "import sys\n"
+            "from opendart_fss import OpenDartClient\n"
+            "client = OpenDartClient(api_key='x')\n"
+            "lazy = ['dotenv', 'sqlite3', 'opendart_fss.api.report']\n"
+            "lazy.append('opendart_fss.models.report')\n"
+            "assert not any(name in sys.modules for name in lazy), lazy\n"
+            "client.report\n"
+            "assert 'opendart_fss.models.report' in sys.modules\n"
+            "assert 'opendart_fss.models.major_event' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_view_creates_own_api_modules(self, api_key: str) -> None:
+        """with_options() 뷰는 뷰를 참조하는 API 모듈을 새로 생성."""
+        client = OpenDartClient(api_key=api_key)
+        disclosure = client.disclosure
+        view = client.with_options(raw=True)
+
+        assert client.disclosure is disclosure
+        assert view.disclosure is not disclosure
+        assert view.disclosure._client is view
+        assert view.bulk._client is view
+
+
+class TestRequestCoalescing:
+    """동일 요청 병합 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_call(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """동시에 진행 중인 동일 요청은 HTTP 호출 1회만 수행."""
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(
+                200,
+                json={"status": "000", "message": "", "list": [{"rcept_no": "1"}]},
+            )
+
+        client = make_client(handler)
+        results = await asyncio.gather(
+            *(client.shareholder.get_major_stock("00126380") for _ in range(10)),
+            client.shareholder.get_major_stock("00164779"),
+        )
+
+        assert calls == 2
+        assert client.stats.coalesced == 9
+        assert all(r is results[0] for r in results[:10])
+        assert not client._inflight
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """병합된 호출자 모두 같은 예외를 받음."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"status": "100", "message": ""})
+
+        client = make_client(handler)
+        results = await asyncio.gather(
+            *(client.shareholder.get_major_stock("00126380") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, NotFoundError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """한 호출자가 취소되어도 다른 호출자는 결과를 받음."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"status": "000", "message": ""})
+
+        client = make_client(handler)
+        first = asyncio.create_task(client.shareholder.get_major_stock("00126380"))
+        second = asyncio.create_task(client.shareholder.get_major_stock("00126380"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == []
+
+    @pytest.mark.asyncio
+    async def test_last_caller_cancel_cancels_request(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """마지막 대기자가 취소되면 진행 중인 요청도 취소."""
+        cancelled = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return httpx.Response(200, json={"status": "000", "message": ""})
+
+        client = make_client(handler)
+        caller = asyncio.create_task(client.shareholder.get_major_stock("00126380"))
+        await asyncio.sleep(0.01)
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, make_client: Callable[..., OpenDartClient]) -> None:
+        """coalesce_requests=False이면 매번 요청."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json={"status": "000", "message": ""})
+
+        client = make_client(handler, coalesce_requests=False)
+        await asyncio.gather(
+            *(client.shareholder.get_major_stock("00126380") for _ in range(3))
+        )
+        assert calls == 3
@@ -0,0 +1,508 @@
+"""고유번호 파싱 및 인덱스 테스트."""
+
+import asyncio
+import io
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from opendart_fss import MemoryCache, MicroBatcher, OpenDartClient
+from opendart_fss.corp_codes import (
+    CorpCodeIndex,
+    MappedCorpCodeIndex,
+    NameSearchIndex,
+    chosung,
+    diff_corp_codes,
+    iter_corp_codes,
+    normalize,
+    write_index,
+)
+from opendart_fss.models.disclosure import CorpCode
+
+ENTRIES = [
+    ("00126380", "삼성전자", "005930", "20240102"),
+    ("00434003", "다코", " ", "20170630"),
+    ("00164779", "에스케이하이닉스", "000660", "20231215"),
+]
+
+
+def corp_code_zip(entries: list[tuple[str, str, str, str]] = ENTRIES) -> bytes:
+    """CORPCODE.xml을 담은 ZIP (corpCode.xml 응답 형태)."""
+    rows = "".join(
+        f"<list><corp_code>{code}</corp_code><corp_name>{name}</corp_name>"
+        f"<corp_eng_name>-</corp_eng_name><stock_code>{stock}</stock_code>"
+        f"<modify_date>{date}</modify_date></list>"
+        for code, name, stock, date in entries
+    )
+    xml = f'<?xml version="1.0" encoding="UTF-8"?>\n<result>{rows}</result>'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("CORPCODE.xml", xml.encode())
+    return buffer.getvalue()
+
+
+class TestParser:
+    """CORPCODE.xml 파서 테스트."""
+
+    def test_parses_entries(self) -> None:
+        """항목을 순서대로 읽고 비상장사 종목코드는 None."""
+        corps = list(iter_corp_codes(corp_code_zip()))
+
+        assert [c.corp_code for c in corps] == ["00126380", "00434003", "00164779"]
+        assert corps[0].corp_name == "삼성전자"
+        assert corps[0].stock_code == "005930"
+        assert corps[1].stock_code is None
+        assert corps[1].modify_date == "20170630"
+
+    def test_missing_xml(self) -> None:
+        """ZIP 안에 XML이 없으면 ValueError."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("readme.txt", "")
+        with pytest.raises(ValueError):
+            list(iter_corp_codes(buffer.getvalue()))
+
+
+class TestCorpCodeIndex:
+    """고유번호 인덱스 테스트."""
+
+    def test_lookups(self) -> None:
+        """고유번호·종목코드 조회."""
+        index = CorpCodeIndex.from_zip(corp_code_zip())
+
+        assert len(index) == 3
+        assert "00126380" in index
+        assert index.get("00164779").corp_name == "에스케이하이닉스"
+        assert index.get_by_stock_code("005930").corp_code == "00126380"
+        assert index.get("99999999") is None
+        assert index.get_by_stock_code("") is None
+
+    def test_sorted_by_modify_date(self) -> None:
+        """최종변경일 순 정렬과 기간 조회."""
+        index = CorpCodeIndex.from_zip(corp_code_zip())
+
+        assert [c.corp_code for c in index.sorted_by_modify_date()] == [
+            "00434003",
+            "00164779",
+            "00126380",
+        ]
+        assert [c.corp_code for c in index.modified_since("20231215")] == [
+            "00164779",
+            "00126380",
+        ]
+        assert index.modified_since("20250101") == []
+
+    @pytest.mark.asyncio
+    async def test_load_corp_codes(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """고유번호 ZIP을 다운로드해 인덱스 생성."""
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, content=corp_code_zip())
+
+        client = make_client(handler)
+        index = await client.disclosure.load_corp_codes()
+
+        assert paths == ["/api/corpCode.xml"]
+        assert index.get_by_stock_code("000660").corp_code == "00164779"
+
+
+class TestMappedIndex:
+    """메모리 매핑 인덱스 파일 테스트."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """저장한 파일을 열어 메모리 인덱스와 같은 결과로 조회."""
+        memory = CorpCodeIndex.from_zip(corp_code_zip())
+        path = tmp_path / "corp_codes.idx"
+        assert memory.save(path) == path.stat().st_size
+
+        with MappedCorpCodeIndex(path) as mapped:
+            assert len(mapped) == 3
+            assert "00126380" in mapped
+            assert "0012638" not in mapped
+            assert list(mapped) == sorted(memory, key=lambda c: c.corp_code)
+            assert mapped.get("00126380") == memory.get("00126380")
+            assert mapped.get("00434003").stock_code is None
+            assert mapped.get("99999999") is None
+            assert mapped.get_by_stock_code("000660").corp_name == "에스케이하이닉스"
+            assert mapped.get_by_stock_code("999999") is None
+            assert mapped.get_by_stock_code(" ") is None
+            assert mapped.sorted_by_modify_date() == memory.sorted_by_modify_date()
+            assert mapped.modified_since("20231215") == memory.modified_since(
+                "20231215"
+            )
+
+    def test_atomic_swap(self, tmp_path: Path) -> None:
+        """교체 후에도 열린 인덱스는 이전 내용을 읽고, reopen()으로 새 파일 매핑."""
+        path = tmp_path / "corp_codes.idx"
+        write_index(iter_corp_codes(corp_code_zip()), path)
+        mapped = MappedCorpCodeIndex(path)
+
+        new = corp_code_zip([("00000001", "신규", "123456", "20250101")])
+        write_index(iter_corp_codes(new), path)
+
+        assert mapped.get("00126380").corp_name == "삼성전자"
+        assert mapped.reopen()
+        assert not mapped.reopen()
+        assert [c.corp_code for c in mapped] == ["00000001"]
+        assert [p.name for p in tmp_path.iterdir()] == ["corp_codes.idx"]
+        mapped.close()
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """인덱스 형식이 아닌 파일은 ValueError."""
+        path = tmp_path / "corp_codes.idx"
+        path.write_bytes(corp_code_zip())
+        with pytest.raises(ValueError):
+            MappedCorpCodeIndex(path)
+
+    def test_non_ascii_code(self, tmp_path: Path) -> None:
+        """ASCII가 아닌 코드는 ValueError."""
+        corp = CorpCode(corp_code="삼성전자", corp_name="삼성전자")
+        with pytest.raises(ValueError, match="corp_code must be ASCII"):
+            write_index([corp], tmp_path / "corp_codes.idx")
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_load_corp_codes_reuses_file(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """인덱스 파일이 있으면 다운로드하지 않고, max_age가 지나면 다시 받음."""
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, content=corp_code_zip())
+
+        client = make_client(handler)
+        path = tmp_path / "corp_codes.idx"
+
+        first = await client.disclosure.load_corp_codes(path)
+        second = await client.disclosure.load_corp_codes(path, max_age=3600)
+        assert isinstance(second, MappedCorpCodeIndex)
+        assert second.get_by_stock_code("005930").corp_code == "00126380"
+        assert len(paths) == 1
+
+        await client.disclosure.load_corp_codes(path, max_age=0)
+        assert len(paths) == 2
+        first.close()
+        second.close()
+
+
+UPDATED = [
+    ("00126380", "삼성전자", "005930", "20250105"),  # 변경
+    ("00434003", "다코", " ", "20170630"),
+    ("00000001", "신규상장", "123456", "20250105"),  # 추가
+    # 00164779 삭제
+]
+
+
+class TestIncrementalRefresh:
+    """증분 갱신 테스트."""
+
+    def test_diff_and_apply(self) -> None:
+        """추가·변경·삭제를 계산하고 메모리 인덱스에 반영."""
+        index = CorpCodeIndex.from_zip(corp_code_zip())
+        latest = list(iter_corp_codes(corp_code_zip(UPDATED)))
+
+        diff = diff_corp_codes(index, latest)
+
+        assert [c.corp_code for c in diff.added] == ["00000001"]
+        assert diff.changed_codes == ["00126380"]
+        assert [c.corp_code for c in diff.removed] == ["00164779"]
+        assert diff.stale_codes == ["00126380", "00164779"]
+        assert not diff_corp_codes(latest, latest)
+
+        index.modified_since("20000101")
+        index.apply(diff)
+        assert sorted(c.corp_code for c in index) == sorted(c.corp_code for c in latest)
+        assert index.get_by_stock_code("000660") is None
+        assert index.get("00126380").modify_date == "20250105"
+        assert sorted(c.corp_code for c in index.modified_since("20250101")) == [
+            "00000001",
+            "00126380",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_refresh_corp_codes(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """인덱스 파일을 갱신하고 변경·삭제된 회사의 기업개황 캐시 삭제."""
+        responses = [corp_code_zip(), corp_code_zip(UPDATED), corp_code_zip(UPDATED)]
+        company_calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/company.json":
+                corp_code = request.url.params["corp_code"]
+                company_calls.append(corp_code)
+                return httpx.Response(
+                    200,
+                    json={
+                        "status": "000",
+                        "message": "",
+                        "corp_code": corp_code,
+                        "corp_name": "",
+                    },
+                )
+            return httpx.Response(200, content=responses.pop(0))
+
+        client = make_client(handler, cache=MemoryCache())
+        path = tmp_path / "corp_codes.idx"
+
+        diff = await client.disclosure.refresh_corp_codes(path)
+        assert len(diff.added) == 3
+
+        for corp_code in ("00126380", "00434003"):
+            await client.disclosure.get_company(corp_code)
+        diff = await client.disclosure.refresh_corp_codes(path)
+        assert diff.changed_codes == ["00126380"]
+        for corp_code in ("00126380", "00434003"):
+            await client.disclosure.get_company(corp_code)
+        assert company_calls == ["00126380", "00434003", "00126380"]
+
+        with MappedCorpCodeIndex(path) as mapped:
+            assert mapped.get("00000001").corp_name == "신규상장"
+            assert "00164779" not in mapped
+
+        assert not await client.disclosure.refresh_corp_codes(path)
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_client_corp_codes(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """같은 파일을 쓰는 client.corp_codes도 갱신된 인덱스로 조회·검색."""
+        responses = [corp_code_zip(), corp_code_zip(UPDATED)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=responses.pop(0))
+
+        path = tmp_path / "corp_codes.idx"
+        client = make_client(handler, corp_code_index=str(path))
+        await client.corp_codes.load()
+        assert client.corp_codes.get("00000001") is None
+        assert client.corp_codes.search("신규") == []
+
+        await client.disclosure.refresh_corp_codes(path)
+
+        assert client.corp_codes.get("00000001").corp_name == "신규상장"
+        assert client.corp_codes.get("00164779") is None
+        assert [c.corp_code for c in client.corp_codes.search("신규")] == ["00000001"]
+
+
+NAMES = [
+    ("00126380", "삼성전자", "005930", "20240102"),
+    ("00126371", "삼성전기", "009150", "20240102"),
+    ("00258999", "삼성전자서비스", " ", "20240102"),
+    ("00149655", "(주)삼성물산", "028260", "20240102"),
+    ("00900001", "삼성", " ", "20240102"),
+    ("00164779", "에스케이하이닉스", "000660", "20231215"),
+]
+
+
+class TestNameSearch:
+    """회사명 검색 테스트."""
+
+    @pytest.fixture
+    def names(self) -> NameSearchIndex:
+        return NameSearchIndex(iter_corp_codes(corp_code_zip(NAMES)))
+
+    @staticmethod
+    def codes(corps: list) -> list[str]:
+        return [corp.corp_code for corp in corps]
+
+    def test_normalize(self) -> None:
+        """법인 형태 표기·공백·기호 제거와 초성 변환."""
+        assert normalize("주식회사 삼성물산") == "삼성물산"
+        assert normalize("(주)삼성 물산") == "삼성물산"
+        assert normalize("SK Hynix") == "skhynix"
+        assert chosung("삼성전자 SK") == "ㅅㅅㅈㅈ SK"
+
+    def test_prefix(self, names: NameSearchIndex) -> None:
+        """접두어 일치는 완전 일치, 상장사, 짧은 이름 순."""
+        assert self.codes(names.search("삼성전")) == [
+            "00126371",
+            "00126380",
+            "00258999",
+        ]
+        assert self.codes(names.search("삼성", limit=2)) == ["00900001", "00149655"]
+        assert self.codes(names.search("주식회사 삼성물산")) == ["00149655"]
+
+    def test_chosung(self, names: NameSearchIndex) -> None:
+        """초성만 또는 음절과 초성을 섞어 검색."""
+        assert self.codes(names.search("ㅅㅅㅈㅈ")) == ["00126380", "00258999"]
+        assert self.codes(names.search("삼성ㅈㄱ")) == ["00126371"]
+        assert self.codes(names.search("ㅅ성ㅁ")) == ["00149655"]
+
+    def test_ranks_whole_range(self) -> None:
+        """이름순으로 뒤에 있는 상장사도 접두어·초성 검색 결과에 포함."""
+        corps = [
+            CorpCode(corp_code=f"{i:08d}", corp_name=f"가나{i:04d}")
+            for i in range(1500)
+        ]
+        corps.append(
+            CorpCode(corp_code="99999999", corp_name="가나후", stock_code="999999")
+        )
+        names = NameSearchIndex(corps)
+        assert self.codes(names.search("가나", limit=1)) == ["99999999"]
+        assert self.codes(names.search("가나ㅎ")) == ["99999999"]
+
+    def test_fuzzy(self, names: NameSearchIndex) -> None:
+        """접두어·초성 일치가 없으면 오타를 허용해 검색."""
+        assert self.codes(names.search("삼성젼자"))[0] == "00126380"
+        assert self.codes(names.search("에스케이하닉스")) == ["00164779"]
+        assert names.search("현대자동차") == []
+
+    def test_add_name(self, names: NameSearchIndex) -> None:
+        """다른 이름으로도 검색되고 결과에는 회사가 한 번만 나옴."""
+        hynix = names.search("에스케이하이닉스")[0]
+        names.add(hynix, "SK하이닉스")
+
+        assert self.codes(names.search("sk하이")) == ["00164779"]
+        assert self.codes(names.search("ㅎㅇㄴ")) == []
+        assert self.codes(names.search("에스케이")) == ["00164779"]
+
+    @pytest.mark.asyncio
+    async def test_client_corp_codes(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """인덱스 파일로 네트워크 없이 검색하고 기업개황 종목명도 색인."""
+        paths: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path == "/api/company.json":
+                return httpx.Response(
+                    200,
+                    json={
+                        "status": "000",
+                        "message": "",
+                        "corp_code": "00164779",
+                        "corp_name": "에스케이하이닉스",
+                        "stock_name": "SK하이닉스",
+                    },
+                )
+            return httpx.Response(200, content=corp_code_zip(NAMES))
+
+        path = tmp_path / "corp_codes.idx"
+        client = make_client(handler, corp_code_index=path)
+        with pytest.raises(ValueError):
+            client.corp_codes.search("삼성")
+
+        await client.corp_codes.load()
+        assert paths == ["/api/corpCode.xml"]
+        assert self.codes(client.corp_codes.search("ㅅㅅㅈㄱ")) == ["00126371"]
+        assert client.corp_codes.get_by_stock_code("000660").corp_code == "00164779"
+
+        await client.disclosure.get_company("00164779")
+        assert self.codes(client.with_options(raw=True).corp_codes.search("SK")) == [
+            "00164779"
+        ]
+
+        # 다른 클라이언트는 인덱스 파일만으로 검색
+        offline = make_client(handler, corp_code_index=path)
+        assert self.codes(offline.corp_codes.search("삼성전자", limit=1)) == [
+            "00126380"
+        ]
+        assert len(paths) == 2
+
+
+class TestCorpCodeResolver:
+    """종목코드·회사명 → 고유번호 변환 테스트."""
+
+    @staticmethod
+    def handler(requested: list[str]) -> Callable[[httpx.Request], httpx.Response]:
+        """고유번호 ZIP과 요청한 고유번호마다 한 건씩 반환하는 핸들러."""
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/corpCode.xml":
+                requested.append("corpCode.xml")
+                return httpx.Response(200, content=corp_code_zip(NAMES))
+            codes = request.url.params["corp_code"]
+            requested.append(codes)
+            items = [{"rcept_no": "1", "corp_code": c} for c in codes.split(",")]
+            return httpx.Response(
+                200, json={"status": "000", "message": "", "list": items}
+            )
+
+        return handle
+
+    @pytest.mark.asyncio
+    async def test_resolves_stock_code_and_name(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """인덱스 파일로 종목코드·정확한 회사명을 변환 (추가 요청 없음)."""
+        path = tmp_path / "corp_codes.idx"
+        write_index(iter_corp_codes(corp_code_zip(NAMES)), path)
+        requested: list[str] = []
+        client = make_client(
+            self.handler(requested), corp_code_index=path, resolve_corp_codes=True
+        )
+
+        await client.financial.get_single_account("005930", "2024", "11011")
+        await client.report.get_dividends("주식회사 삼성전기", "2024", "11011")
+        await client.financial.get_multi_account(
+            ["005930", "00126380", "에스케이하이닉스"], "2024", "11011"
+        )
+        assert requested == ["00126380", "00126371", "00126380,00164779"]
+
+        # 같은 이름이 여럿이어도 상장사가 하나면 그 회사
+        assert await client.corp_codes.resolve("삼성") == "00900001"
+        with pytest.raises(ValueError):
+            await client.financial.get_single_account("999999", "2024", "11011")
+        assert len(requested) == 3
+
+    @pytest.mark.asyncio
+    async def test_loads_index_once(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """인덱스가 없으면 처음 필요할 때 한 번만 다운로드."""
+        requested: list[str] = []
+        client = make_client(self.handler(requested), resolve_corp_codes=True)
+
+        await asyncio.gather(
+            client.financial.get_single_account("005930", "2024", "11011"),
+            client.financial.get_single_account("000660", "2024", "11011"),
+        )
+        await client.financial.get_single_account("00126371", "2024", "11011")
+
+        assert requested.count("corpCode.xml") == 1
+        assert sorted(requested[1:]) == ["00126371", "00126380", "00164779"]
+
+    @pytest.mark.asyncio
+    async def test_batched(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """묶음 처리기는 변환한 고유번호로 묶고 결과를 나눔."""
+        path = tmp_path / "corp_codes.idx"
+        write_index(iter_corp_codes(corp_code_zip(NAMES)), path)
+        requested: list[str] = []
+        client = make_client(
+            self.handler(requested),
+            corp_code_index=path,
+            resolve_corp_codes=True,
+            batcher=MicroBatcher(),
+        )
+
+        samsung, hynix = await asyncio.gather(
+            client.financial.get_single_account("005930", "2024", "11011"),
+            client.financial.get_single_account("000660", "2024", "11011"),
+        )
+
+        assert requested == ["00126380,00164779"]
+        assert [item.corp_code for item in samsung] == ["00126380"]
+        assert [item.corp_code for item in hynix] == ["00164779"]
+
+    @pytest.mark.asyncio
+    async def test_opt_in(self, make_client: Callable[..., OpenDartClient]) -> None:
+        """기본값에서는 corp_code를 그대로 전송."""
+        requested: list[str] = []
+        client = make_client(self.handler(requested))
+
+        await client.financial.get_single_account("005930", "2024", "11011")
+
+        assert requested == ["005930"]
@@ -0,0 +1,219 @@
+"""응답 디코딩 옵션 테스트."""
+
+from collections.abc import Callable
+
+import httpx
+import msgspec
+import pytest
+
+from opendart_fss import DecodeOptions, NotFoundError, OpenDartClient
+from opendart_fss.decoding import INTERN_FIELDS, InternTable, decoder_for
+from opendart_fss.models.disclosure import Company, DisclosureListResponse
+from opendart_fss.models.shareholder import MajorStock
+
+ITEMS = [{"rcept_no": "1", "corp_code": "00126380", "corp_name": "삼성전자"}]
+
+
+def _list_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.params.get("corp_code") == "missing":
+        return httpx.Response(200, json={"status": "100", "message": ""})
+    if request.url.path == "/api/company.json":
+        return httpx.Response(
+            200,
+            json={
+                "status": "000",
+                "message": "",
+                "corp_code": "00126380",
+                "corp_name": "삼성전자",
+            },
+        )
+    return httpx.Response(
+        200, json={"status": "000", "message": "", "total_page": 1, "list": ITEMS}
+    )
+
+
+class TestDecoderCache:
+    """디코더 캐시 테스트."""
+
+    def test_decoder_is_reused(self) -> None:
+        """응답 타입·옵션별로 같은 디코더 재사용."""
+        decoder = decoder_for(DisclosureListResponse)
+        assert decoder_for(DisclosureListResponse) is decoder
+        assert decoder.type is DisclosureListResponse
+
+        raw = decoder_for(DisclosureListResponse, DecodeOptions(raw=True))
+        assert raw is not decoder
+        assert raw is decoder_for(DisclosureListResponse, DecodeOptions(raw=True))
+
+
+class TestRawMode:
+    """raw 모드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_returns_raw_list(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """목록을 디코딩하지 않고 원본 JSON 조각으로 반환."""
+        client = make_client(_list_handler)
+
+        items = await client.raw.shareholder.get_major_stock("00126380")
+
+        assert isinstance(items, msgspec.Raw)
+        assert msgspec.json.decode(items) == ITEMS
+
+    @pytest.mark.asyncio
+    async def test_status_is_checked(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """상태 코드는 그대로 검사."""
+        client = make_client(_list_handler)
+        with pytest.raises(NotFoundError):
+            await client.raw.shareholder.get_major_stock("missing")
+
+    @pytest.mark.asyncio
+    async def test_view_shares_state(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """뷰는 원래 클라이언트의 상태를 공유하고 디코딩 결과는 섞이지 않음."""
+        client = make_client(_list_handler)
+        raw = client.raw
+
+        decoded = await client.shareholder.get_major_stock("00126380")
+        items = await raw.shareholder.get_major_stock("00126380")
+
+        assert decoded[0].rcept_no == "1"
+        assert isinstance(items, msgspec.Raw)
+        assert raw.stats is client.stats
+        assert client.stats.requests == 2
+        assert not client.decode_options.raw
+
+    @pytest.mark.asyncio
+    async def test_non_list_and_paged_methods(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """목록이 없는 응답과 여러 페이지를 합치는 메서드는 디코딩."""
+        client = make_client(_list_handler).raw
+
+        assert isinstance(await client.disclosure.get_company("00126380"), Company)
+        items = [d async for d in client.disclosure.iter_search()]
+        assert [d.corp_name for d in items] == ["삼성전자"]
+
+
+class TestFieldProjection:
+    """필드 선택 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_selected_fields_only(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """선택한 필드만 가진 구조체로 디코딩."""
+        client = make_client(_list_handler)
+        view = client.with_options(fields=["corp_code", "unknown"])
+
+        items = await view.shareholder.get_major_stock("00126380")
+
+        assert msgspec.structs.fields(items[0])[0].name == "corp_code"
+        assert msgspec.structs.asdict(items[0]) == {"corp_code": "00126380"}
+
+    @pytest.mark.asyncio
+    async def test_merging_methods_keep_required_fields(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """결과를 합치는 메서드는 필요한 필드를 함께 디코딩."""
+        client = make_client(_list_handler).with_options(fields=["corp_name"])
+
+        items = await client.disclosure.search_range("20240101", "20240131")
+
+        assert [(d.corp_name, d.rcept_no) for d in items] == [("삼성전자", "1")]
+
+
+def _copy(value: str) -> str:
+    """리터럴과 다른 객체인 같은 문자열."""
+    return value.encode().decode()
+
+
+class TestInterning:
+    """문자열 인턴 테스트."""
+
+    def test_table_is_bounded(self) -> None:
+        """테이블이 가득 차면 새 문자열은 그대로 반환."""
+        table = InternTable(max_size=1)
+        first = table(_copy("ab"))
+        assert table(_copy("ab")) is first
+        other = _copy("cd")
+        assert table(other) is other
+        assert len(table) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_values_share_objects(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """반복되는 필드 값이 같은 객체를 공유."""
+        rows = [
+            {"rcept_no": str(i), "sj_nm": "재무상태표", "thstrm_amount": "1"}
+            for i in range(3)
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"status": "000", "message": "", "list": rows}
+            )
+
+        client = make_client(handler)
+        plain = await client.financial.get_full_statements("1", "2024", "11011")
+        interned = await client.with_options(intern=True).financial.get_full_statements(
+            "2", "2024", "11011"
+        )
+
+        assert plain[0].sj_nm is not plain[1].sj_nm
+        assert interned[0].sj_nm is interned[1].sj_nm is interned[2].sj_nm
+        # 반복되지 않는 필드는 인턴하지 않음
+        assert interned[0].thstrm_amount is not interned[1].thstrm_amount
+
+    def test_high_cardinality_fields_are_excluded(self) -> None:
+        """값의 종류가 많은 필드는 인턴 대상이 아님."""
+        for name in ("rcept_no", "rcept_dt", "corp_name", "rm", "report_nm"):
+            assert name not in INTERN_FIELDS
+
+
+class TestCompactMode:
+    """compact/frozen 모드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_compact_items_are_model_subclasses(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """원래 모델의 하위 클래스이며 GC가 추적하지 않는 구조체로 디코딩."""
+        client = make_client(_list_handler).with_options(compact=True)
+
+        items = await client.shareholder.get_major_stock("00126380")
+
+        assert isinstance(items[0], MajorStock)
+        assert type(items[0]).__struct_config__.gc is False
+        assert items[0].corp_name == "삼성전자"
+
+    @pytest.mark.asyncio
+    async def test_frozen_items_are_hashable(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """frozen 항목은 변경할 수 없고 dict 키로 사용 가능."""
+        client = make_client(_list_handler).with_options(compact=True, frozen=True)
+
+        items = await client.shareholder.get_major_stock("00126380")
+        again = await client.shareholder.get_major_stock("00126380")
+
+        assert {items[0]: 1}[again[0]] == 1
+        with pytest.raises(AttributeError):
+            items[0].corp_name = "변경"  # type: ignore[misc]
+
+    def test_projection_variant(self) -> None:
+        """필드 선택과 함께 쓰면 선택한 필드만 가진 compact 구조체."""
+        options = DecodeOptions(fields={"corp_code"}, compact=True, frozen=True)
+        response = decoder_for(DisclosureListResponse, options).decode(
+            msgspec.json.encode({"status": "000", "message": "", "list": ITEMS})
+        )
+
+        config = type(response.items[0]).__struct_config__
+        assert msgspec.structs.asdict(response.items[0]) == {"corp_code": "00126380"}
+        assert config.gc is False
+        assert config.frozen is True
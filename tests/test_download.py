@@ -0,0 +1,99 @@
+"""파일 다운로드 테스트."""
+
+import asyncio
+import io
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from opendart_fss import DownloadTooLargeError, NotFoundError, OpenDartClient
+
+ZIP_BYTES = b"PK\x03\x04" + b"x" * 200_000
+
+
+def _zip_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=ZIP_BYTES)
+
+
+class TestStreamingDownload:
+    """스트리밍 다운로드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_stream_document_in_chunks(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """청크 단위로 전체 내용을 전달."""
+        client = make_client(_zip_handler)
+        chunks = [c async for c in client.disclosure.stream_document("1")]
+        assert b"".join(chunks) == ZIP_BYTES
+
+    @pytest.mark.asyncio
+    async def test_save_to_path_and_file_object(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """경로와 파일 객체 모두에 저장."""
+        client = make_client(_zip_handler)
+        path = tmp_path / "doc.zip"
+        assert await client.disclosure.save_document("1", path) == len(ZIP_BYTES)
+        assert path.read_bytes() == ZIP_BYTES
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.zip"]
+
+        buffer = io.BytesIO()
+        await client.financial.save_xbrl("1", "11011", buffer)
+        assert buffer.getvalue() == ZIP_BYTES
+
+    @pytest.mark.asyncio
+    async def test_concurrent_saves_to_same_path(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """같은 경로에 동시에 저장해도 임시 파일이 겹치지 않음."""
+        client = make_client(_zip_handler)
+        path = tmp_path / "doc.zip"
+
+        sizes = await asyncio.gather(
+            *(client.disclosure.save_document(str(i), path) for i in range(4))
+        )
+
+        assert sizes == [len(ZIP_BYTES)] * 4
+        assert path.read_bytes() == ZIP_BYTES
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.zip"]
+
+    @pytest.mark.asyncio
+    async def test_max_size(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """크기 제한 초과 시 예외, 불완전한 파일은 남기지 않음."""
+        client = make_client(_zip_handler, max_download_size=1000)
+        path = tmp_path / "corp.zip"
+        with pytest.raises(DownloadTooLargeError):
+            await client.disclosure.save_corp_codes(path)
+        assert list(tmp_path.iterdir()) == []
+
+        with pytest.raises(DownloadTooLargeError):
+            await client.disclosure.download_document("1")
+
+        stream = client.disclosure.stream_document("1", max_size=len(ZIP_BYTES))
+        chunks = [c async for c in stream]
+        assert b"".join(chunks) == ZIP_BYTES
+
+    @pytest.mark.asyncio
+    async def test_error_body_raises(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """ZIP 대신 오류 XML이 오면 상태 코드 예외."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=(
+                    b'<?xml version="1.0" encoding="UTF-8"?>'
+                    b"<result><status>101</status><message>no file</message></result>"
+                ),
+            )
+
+        client = make_client(handler)
+        with pytest.raises(NotFoundError) as exc_info:
+            await client.disclosure.download_document("1")
+        assert exc_info.value.message == "no file"
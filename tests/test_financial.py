@@ -0,0 +1,172 @@
+"""재무정보 API 테스트."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from opendart_fss import MicroBatcher, NotFoundError, OpenDartClient
+
+
+def _multi_handler(
+    requested: list[list[str]], missing: frozenset[str] = frozenset()
+) -> Callable[[httpx.Request], httpx.Response]:
+    """요청한 고유번호마다 한 건씩 반환하는 핸들러 (`missing`은 데이터 없음)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        codes = request.url.params["corp_code"].split(",")
+        requested.append(codes)
+        found = [code for code in codes if code not in missing]
+        if not found:
+            return httpx.Response(200, json={"status": "100", "message": ""})
+        return httpx.Response(
+            200,
+            json={
+                "status": "000",
+                "message": "",
+                "list": [{"rcept_no": "1", "corp_code": code} for code in found],
+            },
+        )
+
+    return handler
+
+
+class TestMultiCompanyChunking:
+    """다중회사 API 고유번호 분할 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_by_100(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """100개 단위로 나눠 요청하고 순서대로 합침."""
+        requested: list[list[str]] = []
+        client = make_client(_multi_handler(requested))
+        codes = [f"{i:08d}" for i in range(250)]
+
+        items = await client.financial.get_multi_account(codes, "2024", "11011")
+
+        assert sorted(len(chunk) for chunk in requested) == [50, 100, 100]
+        assert [item.corp_code for item in items] == codes
+
+    @pytest.mark.asyncio
+    async def test_comma_separated_string(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """쉼표로 구분한 문자열도 허용."""
+        requested: list[list[str]] = []
+        client = make_client(_multi_handler(requested))
+
+        items = await client.financial.get_indicators(
+            "00000001, 00000002", "2024", "11011"
+        )
+
+        assert requested == [["00000001", "00000002"]]
+        assert [item.corp_code for item in items] == ["00000001", "00000002"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("corp_code", [[], " , ,"])
+    async def test_empty_corp_codes(
+        self, make_client: Callable[..., OpenDartClient], corp_code: list[str] | str
+    ) -> None:
+        """고유번호가 없으면 요청 없이 ValueError."""
+        requested: list[list[str]] = []
+        client = make_client(_multi_handler(requested))
+
+        with pytest.raises(ValueError):
+            await client.financial.get_multi_account(corp_code, "2024", "11011")
+
+        assert requested == []
+
+    @pytest.mark.asyncio
+    async def test_missing_chunk_is_skipped(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """데이터가 없는 묶음은 건너뛰고, 모두 없으면 NotFoundError."""
+        codes = [f"{i:08d}" for i in range(150)]
+        client = make_client(_multi_handler([], frozenset(codes[:100])))
+        items = await client.financial.get_indicators(codes, "2024", "11011")
+        assert [item.corp_code for item in items] == codes[100:]
+
+        client = make_client(_multi_handler([], frozenset(codes)))
+        with pytest.raises(NotFoundError):
+            await client.financial.get_indicators(codes, "2024", "11011")
+
+
+class TestMicroBatching:
+    """단일회사 요청 묶음 처리 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_single_calls_are_batched(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """동시에 들어온 단일회사 호출을 다중회사 요청 하나로 전송."""
+        requested: list[list[str]] = []
+        paths: list[str] = []
+        handler = _multi_handler(requested, frozenset({"missing"}))
+
+        def recording_handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return handler(request)
+
+        client = make_client(recording_handler, batcher=MicroBatcher(window=0.01))
+        codes = ["00000001", "00000002", "00000003"]
+
+        results = await asyncio.gather(
+            *(
+                client.financial.get_single_account(code, "2024", "11011")
+                for code in [*codes, "missing"]
+            ),
+            return_exceptions=True,
+        )
+
+        assert paths == ["/api/fnlttMultiAcnt.json"]
+        assert sorted(requested[0]) == sorted([*codes, "missing"])
+        for code, result in zip(codes, results, strict=False):
+            assert [item.corp_code for item in result] == [code]
+        assert isinstance(results[-1], NotFoundError)
+
+    @pytest.mark.asyncio
+    async def test_decode_options_are_not_mixed(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """디코딩 옵션이 다른 뷰의 호출은 같은 묶음에 들어가지 않음."""
+        requested: list[list[str]] = []
+        client = make_client(
+            _multi_handler(requested), batcher=MicroBatcher(window=0.01)
+        )
+        projected = client.with_options(fields={"account_nm"})
+
+        plain, selected = await asyncio.gather(
+            client.financial.get_single_account("00000001", "2024", "11011"),
+            projected.financial.get_single_account("00000002", "2024", "11011"),
+        )
+
+        assert sorted(requested) == [["00000001"], ["00000002"]]
+        assert plain[0].thstrm_amount is None
+        assert not hasattr(selected[0], "thstrm_amount")
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_max_size(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """묶음이 max_size에 도달하면 바로 전송."""
+        requested: list[list[str]] = []
+        client = make_client(
+            _multi_handler(requested), batcher=MicroBatcher(window=10, max_size=2)
+        )
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    client.financial.get_single_indicators(
+                        code, "2024", "11011", "M210000"
+                    )
+                    for code in ("00000001", "00000002")
+                )
+            ),
+            1,
+        )
+
+        assert requested == [["00000001", "00000002"]]
+        assert [r[0].corp_code for r in results] == ["00000001", "00000002"]
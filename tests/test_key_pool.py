@@ -0,0 +1,127 @@
+"""API 키 풀 테스트."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from opendart_fss import (
+    APIKeyPool,
+    AuthenticationError,
+    NoAvailableKeyError,
+    OpenDartClient,
+    QuotaExceededError,
+    QuotaManager,
+    RateLimitError,
+)
+from opendart_fss.constants import StatusCode
+
+
+class TestAPIKeyPool:
+    """APIKeyPool 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_balances_usage(self) -> None:
+        """사용량이 가장 적은 키를 선택해 고르게 분산."""
+        pool = APIKeyPool(["a", "b", "c"])
+        for _ in range(9):
+            await pool.acquire()
+        assert pool.usage() == {"a": 3, "b": 3, "c": 3}
+
+    @pytest.mark.asyncio
+    async def test_rotates_away_from_failed_keys(self) -> None:
+        """인증 오류 키는 영구 제외, 일일 한도 초과 키는 오늘 제외."""
+        pool = APIKeyPool(["a", "b", "c"])
+        assert pool.report_error("a", AuthenticationError(StatusCode.INVALID_KEY))
+        assert pool.report_error(
+            "b", RateLimitError(StatusCode.DAILY_LIMIT_EXCEEDED_REQUESTS)
+        )
+        assert not pool.report_error("c", ValueError())
+        assert pool.available_keys() == ["c"]
+        assert {await pool.acquire() for _ in range(3)} == {"c"}
+
+        pool.report_error("c", RateLimitError(StatusCode.MONTHLY_LIMIT_EXCEEDED))
+        with pytest.raises(NoAvailableKeyError):
+            await pool.acquire()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_cooldown(self) -> None:
+        """모든 키가 013 일시 제한이면 해제될 때까지 대기."""
+        pool = APIKeyPool(["a"], cooldown=0.05)
+        pool.report_error("a", RateLimitError(StatusCode.USAGE_LIMIT_EXCEEDED))
+        assert pool.available_keys() == []
+        assert await asyncio.wait_for(pool.acquire(), 1) == "a"
+
+    @pytest.mark.asyncio
+    async def test_daily_limit(self) -> None:
+        """일일 한도에 도달한 키는 제외."""
+        pool = APIKeyPool(["a", "b"], daily_limit=1)
+        await pool.acquire()
+        await pool.acquire()
+        with pytest.raises(NoAvailableKeyError):
+            await pool.acquire()
+
+
+class TestClientKeyPool:
+    """클라이언트 키 풀 연동 테스트."""
+
+    def test_multiple_keys(self) -> None:
+        """여러 키를 주면 키 풀 생성."""
+        client = OpenDartClient(api_key=["k1", "k2"])
+        assert client.key_pool is not None
+        assert client.key_pool.keys == ["k1", "k2"]
+        assert client.api_key == "k1"
+
+    def test_env_comma_separated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """환경변수의 쉼표 구분 키."""
+        monkeypatch.setenv("OPENDART_API_KEY", "k1, k2")
+        client = OpenDartClient()
+        assert client.key_pool is not None
+        assert client.key_pool.keys == ["k1", "k2"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_key_is_rotated(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """한도 초과 키 대신 다른 키로 바로 재전송."""
+        used: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            key = request.url.params["crtfc_key"]
+            used.append(key)
+            status = "015" if key == "k1" else "000"
+            return httpx.Response(200, json={"status": status, "message": ""})
+
+        client = make_client(handler, api_key=["k1", "k2"])
+        for code in ("1", "2", "3"):
+            await client.shareholder.get_major_stock(code)
+
+        assert used.count("k1") == 1
+        assert used.count("k2") == 3
+        assert client.stats.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_quota_exhausted_key_is_rotated(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """할당량 관리자가 거절한 키 대신 다른 키를 사용하고 모두 소진되면 예외."""
+        used: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            used.append(request.url.params["crtfc_key"])
+            return httpx.Response(200, json={"status": "000", "message": ""})
+
+        quota = QuotaManager(daily_limit=1)
+        await quota.acquire("k1")
+        client = make_client(handler, api_key=["k1", "k2"], quota=quota)
+        assert client.key_pool is not None
+
+        await client.shareholder.get_major_stock("1")
+        assert used == ["k2"]
+        assert client.key_pool.available_keys() == ["k2"]
+        assert client.key_pool.usage() == {"k1": 0, "k2": 1}
+
+        with pytest.raises(QuotaExceededError):
+            await client.shareholder.get_major_stock("2")
+        assert used == ["k2"]
@@ -0,0 +1,128 @@
+"""요청 할당량 관리 테스트."""
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from opendart_fss import OpenDartClient, Priority, QuotaExceededError, QuotaManager
+from opendart_fss.quota import current_priority, priority
+
+
+class TestQuotaManager:
+    """QuotaManager 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_counts_and_persists(self, tmp_path: Path) -> None:
+        """사용량을 키별로 집계하고 재시작 후에도 유지."""
+        path = tmp_path / "quota.db"
+        quota = QuotaManager(path, daily_limit=10)
+        for _ in range(3):
+            await quota.acquire("a")
+        await quota.acquire("b")
+        quota.close()
+
+        quota = QuotaManager(path, daily_limit=10)
+        assert quota.used("a") == 3
+        assert quota.used("b") == 1
+        assert quota.remaining("a") == 7
+        quota.close()
+
+    @pytest.mark.asyncio
+    async def test_does_not_store_raw_key(self, tmp_path: Path) -> None:
+        """원본 키는 파일에 저장하지 않음."""
+        path = tmp_path / "quota.db"
+        quota = QuotaManager(path)
+        await quota.acquire("SECRET_KEY")
+        quota.close()
+        assert b"SECRET_KEY" not in path.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_hard_limit(self) -> None:
+        """한도에 도달하면 우선순위와 관계없이 거절."""
+        quota = QuotaManager(daily_limit=2)
+        await quota.acquire("a")
+        await quota.acquire("a")
+        with pytest.raises(QuotaExceededError):
+            await quota.acquire("a")
+        assert quota.used("a") == 2
+        assert quota.remaining("a") == 0
+
+    @pytest.mark.asyncio
+    async def test_reserve_refuses_low_priority(self) -> None:
+        """낮은 우선순위 요청은 예약분을 사용하지 못함."""
+        quota = QuotaManager(daily_limit=3, reserve=2)
+        with priority(Priority.LOW):
+            assert current_priority() is Priority.LOW
+            await quota.acquire("a")
+            with pytest.raises(QuotaExceededError):
+                await quota.acquire("a")
+        assert current_priority() is Priority.NORMAL
+        await quota.acquire("a")
+        await quota.acquire("a")
+        assert quota.remaining("a") == 0
+
+    @pytest.mark.asyncio
+    async def test_monthly_limit(self) -> None:
+        """월간 한도 반영."""
+        quota = QuotaManager(daily_limit=10, monthly_limit=1)
+        await quota.acquire("a")
+        assert quota.remaining("a") == 0
+        with pytest.raises(QuotaExceededError):
+            await quota.acquire("a")
+
+    @pytest.mark.asyncio
+    async def test_monthly_limit_is_atomic(self, tmp_path: Path) -> None:
+        """같은 파일을 쓰는 여러 관리자가 동시에 요청해도 월간 한도를 넘지 않음."""
+        path = tmp_path / "quota.db"
+        managers = [
+            QuotaManager(path, daily_limit=1000, monthly_limit=20) for _ in range(4)
+        ]
+
+        async def consume(quota: QuotaManager) -> int:
+            granted = 0
+            for _ in range(10):
+                try:
+                    await quota.acquire("a")
+                except QuotaExceededError:
+                    continue
+                granted += 1
+            return granted
+
+        granted = await asyncio.gather(*(consume(quota) for quota in managers))
+
+        assert sum(granted) == 20
+        assert managers[0].used_this_month("a") == 20
+        for quota in managers:
+            quota.close()
+
+
+class TestClientQuota:
+    """클라이언트 할당량 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_client_counts_requests(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """요청마다 집계하고 낮은 우선순위 요청은 예약분 앞에서 중단."""
+        sent = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal sent
+            sent += 1
+            return httpx.Response(200, json={"status": "000", "message": ""})
+
+        quota = QuotaManager(daily_limit=3, reserve=1)
+        client = make_client(handler, quota=quota)
+
+        with client.priority(Priority.LOW):
+            await client.shareholder.get_major_stock("1")
+            await client.shareholder.get_major_stock("2")
+            with pytest.raises(QuotaExceededError):
+                await client.shareholder.get_major_stock("3")
+
+        await client.shareholder.get_major_stock("3")
+        assert sent == 3
+        assert quota.used(client.api_key) == 3
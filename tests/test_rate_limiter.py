@@ -0,0 +1,65 @@
+"""Rate Limiter 테스트."""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from opendart_fss import OpenDartClient, RateLimiter
+from opendart_fss.rate_limiter import _Window
+
+
+def _short_limiter(limit: int, period: float) -> RateLimiter:
+    """테스트용 짧은 윈도우 Rate Limiter."""
+    limiter = RateLimiter(per_minute=None)
+    limiter._windows = [_Window(limit, period)]
+    return limiter
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_respects_limit(self) -> None:
+        """동시 호출 시에도 윈도우 한도를 넘지 않아야 함."""
+        limiter = _short_limiter(5, 0.2)
+        stamps: list[float] = []
+
+        async def worker() -> None:
+            await limiter.acquire()
+            stamps.append(time.monotonic())
+
+        start = time.monotonic()
+        await asyncio.gather(*(worker() for _ in range(20)))
+
+        assert len(stamps) == 20
+        assert time.monotonic() - start >= 0.6
+        stamps.sort()
+        for i in range(len(stamps) - 5):
+            assert stamps[i + 5] - stamps[i] >= 0.2 - 1e-3
+        assert limiter.total_wait > 0
+
+    @pytest.mark.asyncio
+    async def test_unlimited(self) -> None:
+        """제한이 없으면 즉시 반환."""
+        limiter = RateLimiter(per_minute=None, per_day=None)
+        await asyncio.gather(*(limiter.acquire() for _ in range(100)))
+        assert limiter.total_wait == 0
+
+    @pytest.mark.asyncio
+    async def test_client_requests_go_through_limiter(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """클라이언트 요청이 공용 Rate Limiter를 거쳐야 함."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": "000", "message": "정상"})
+
+        limiter = RateLimiter(per_minute=10)
+        client = make_client(handler, rate_limiter=limiter)
+        await asyncio.gather(
+            *(client.shareholder.get_major_stock(f"0000000{i}") for i in range(3))
+        )
+        assert len(limiter._windows[0].timestamps) == 3
@@ -0,0 +1,104 @@
+"""재시도 정책 테스트."""
+
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from opendart_fss import OpenDartClient, RetryPolicy
+from opendart_fss.constants import StatusCode
+from opendart_fss.exceptions import (
+    AuthenticationError,
+    RateLimitError,
+    ServerError,
+)
+
+
+class TestRetryPolicy:
+    """RetryPolicy 테스트."""
+
+    def test_default_rules(self) -> None:
+        """기본 규칙은 일시적 오류만 재시도."""
+        policy = RetryPolicy()
+        assert policy.should_retry(ServerError(StatusCode.SYSTEM_ERROR), 1)
+        assert policy.should_retry(RateLimitError(StatusCode.USAGE_LIMIT_EXCEEDED), 1)
+        assert policy.should_retry(httpx.ReadTimeout("timeout"), 2)
+        assert not policy.should_retry(ServerError(StatusCode.MAINTENANCE), 3)
+        assert not policy.should_retry(
+            RateLimitError(StatusCode.DAILY_LIMIT_EXCEEDED_REQUESTS), 1
+        )
+        assert not policy.should_retry(AuthenticationError(StatusCode.INVALID_KEY), 1)
+
+    def test_most_specific_rule_wins(self) -> None:
+        """가장 구체적인 클래스 규칙 적용."""
+        policy = RetryPolicy(
+            retry_on={httpx.TransportError: 5, httpx.ConnectError: 2},
+        )
+        assert policy.attempts_for(httpx.ConnectError("x")) == 2
+        assert policy.attempts_for(httpx.ReadTimeout("x")) == 5
+        assert policy.attempts_for(ValueError()) == 1
+
+    def test_compute_delay(self) -> None:
+        """지수 백오프와 지터 범위."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0, jitter=0.5)
+        for attempt, full in ((1, 1.0), (2, 2.0), (3, 4.0), (10, 4.0)):
+            delay = policy.compute_delay(attempt)
+            assert full * 0.5 <= delay <= full
+
+
+class TestClientRetry:
+    """클라이언트 재시도 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_status(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """800 응답 후 성공하면 결과 반환 및 통계 기록."""
+        statuses = iter(["800", "013", "000"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, json={"status": next(statuses), "message": "", "list": []}
+            )
+
+        client = make_client(handler, retry_policy=RetryPolicy(base_delay=0.0))
+        assert await client.shareholder.get_major_stock("00126380") == []
+        assert client.stats.requests == 3
+        assert client.stats.retries == 2
+        assert client.stats.failures == 0
+        assert client.stats.retries_by_error["ServerError(800)"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_transport_error(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """연결 오류 재시도."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"status": "000", "message": ""})
+
+        client = make_client(handler)
+        await client.shareholder.get_major_stock("00126380")
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """최대 시도 횟수 초과 시 마지막 예외 전파."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": "900", "message": ""})
+
+        client = make_client(
+            handler, retry_policy=RetryPolicy(max_attempts=2, base_delay=0.0)
+        )
+        with pytest.raises(ServerError):
+            await client.shareholder.get_major_stock("00126380")
+        assert client.stats.requests == 2
+        assert client.stats.failures == 1
@@ -0,0 +1,202 @@
+"""공시검색 페이지 조회 테스트."""
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from opendart_fss import OpenDartClient
+from opendart_fss.api.disclosure import _date_windows
+
+
+def _paged_handler(
+    total: int, pages: list[int] | None = None
+) -> Callable[[httpx.Request], httpx.Response]:
+    """`total`건을 페이지로 나눠 반환하는 핸들러 (요청한 페이지 번호 기록)."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        page_no = int(params.get("page_no", "1"))
+        page_count = int(params.get("page_count", "10"))
+        if pages is not None:
+            pages.append(page_no)
+        if total == 0:
+            return httpx.Response(200, json={"status": "100", "message": "no data"})
+
+        start = (page_no - 1) * page_count
+        items = [
+            {"corp_code": "00126380", "corp_name": "삼성전자", "rcept_no": str(i)}
+            for i in range(start, min(start + page_count, total))
+        ]
+        return httpx.Response(
+            200,
+            json={
+                "status": "000",
+                "message": "정상",
+                "page_no": page_no,
+                "page_count": page_count,
+                "total_count": total,
+                "total_page": -(-total // page_count),
+                "list": items,
+            },
+        )
+
+    return handler
+
+
+class TestIterSearch:
+    """disclosure.iter_search 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_iterates_all_pages(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """total_page까지 순서대로 조회."""
+        pages: list[int] = []
+        client = make_client(_paged_handler(250, pages))
+
+        items = [d async for d in client.disclosure.iter_search(bgn_de="20240101")]
+
+        assert [d.rcept_no for d in items] == [str(i) for i in range(250)]
+        assert pages == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_no_results(self, make_client: Callable[..., OpenDartClient]) -> None:
+        """검색 결과가 없으면 빈 반복."""
+        client = make_client(_paged_handler(0))
+        assert [d async for d in client.disclosure.iter_search()] == []
+
+
+class TestSearchAll:
+    """disclosure.search_all 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_pages_concurrently_in_order(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """나머지 페이지를 동시에 요청하고 원래 순서로 반환."""
+        sync_handler = _paged_handler(1000)
+        running = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # 뒤 페이지가 먼저 도착하도록 지연
+            await asyncio.sleep(0.02 / int(request.url.params["page_no"]))
+            running -= 1
+            return sync_handler(request)
+
+        client = make_client(handler)
+        items = await client.disclosure.search_all(bgn_de="20240101", concurrency=4)
+
+        assert [d.rcept_no for d in items] == [str(i) for i in range(1000)]
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_break_cancels_prefetched_pages(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """반복을 중단하면 미리 요청한 페이지 취소."""
+        sync_handler = _paged_handler(1000)
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["page_no"] not in ("1", "2"):
+                await asyncio.sleep(10)
+            return sync_handler(request)
+
+        client = make_client(handler)
+        stream = client.disclosure.iter_search(concurrency=3)
+        async for item in stream:
+            if item.rcept_no == "100":  # 둘째 페이지 첫 항목
+                break
+        await stream.aclose()
+
+        pending = asyncio.all_tasks() - {asyncio.current_task()}
+        assert pending
+        await asyncio.wait(pending, timeout=1)
+        assert all(task.cancelled() for task in pending)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [0, -1])
+    async def test_invalid_concurrency(
+        self, concurrency: int, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """동시 요청 수가 1보다 작으면 요청 없이 ValueError."""
+        requests: list[httpx.Request] = []
+        client = make_client(lambda request: requests.append(request))
+
+        with pytest.raises(ValueError):
+            [d async for d in client.disclosure.iter_search(concurrency=concurrency)]
+        assert requests == []
+
+
+class TestSearchRange:
+    """disclosure.search_range 테스트."""
+
+    def test_date_windows(self) -> None:
+        """3개월 이하 구간으로 분할."""
+        assert _date_windows("20240101", "20241231", 3) == [
+            ("20240101", "20240331"),
+            ("20240401", "20240630"),
+            ("20240701", "20240930"),
+            ("20241001", "20241231"),
+        ]
+        assert _date_windows("20231130", "20240301", 3) == [
+            ("20231130", "20240228"),
+            ("20240229", "20240301"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_splits_and_merges(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """구간별로 페이지를 조회해 최신 구간부터 합치고 중복 제거."""
+        requests: list[tuple[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params = request.url.params
+            bgn_de, page_no = params["bgn_de"], int(params["page_no"])
+            requests.append((bgn_de, params["page_no"]))
+            if bgn_de == "20240401":
+                return httpx.Response(200, json={"status": "100", "message": ""})
+            # 구간마다 150건, 페이지 경계에서 한 건 중복
+            rcept_nos = [f"{bgn_de}{i:03d}" for i in range(150)]
+            start = (page_no - 1) * 100 - (1 if page_no > 1 else 0)
+            items = [
+                {"corp_code": "1", "corp_name": "테스트", "rcept_no": no}
+                for no in rcept_nos[start : start + 100]
+            ]
+            return httpx.Response(
+                200,
+                json={"status": "000", "message": "", "total_page": 2, "list": items},
+            )
+
+        client = make_client(handler)
+        items = await client.disclosure.search_range("20240101", "20240930")
+
+        rcept_nos = [d.rcept_no for d in items]
+        assert len(rcept_nos) == len(set(rcept_nos)) == 300
+        assert rcept_nos[0] == "20240701000"
+        assert rcept_nos[-1] == "20240101149"
+        assert sorted(requests) == [
+            ("20240101", "1"),
+            ("20240101", "2"),
+            ("20240401", "1"),
+            ("20240701", "1"),
+            ("20240701", "2"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_corp_code_is_not_split(
+        self, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """고유번호를 지정하면 기간을 나누지 않음."""
+        pages: list[int] = []
+        client = make_client(_paged_handler(10, pages))
+        items = await client.disclosure.search_range(
+            "20150101", "20241231", corp_code="00126380"
+        )
+        assert len(items) == 10
+        assert pages == [1]
@@ -0,0 +1,73 @@
+"""SQLite 응답 캐시 테스트."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from opendart_fss import OpenDartClient
+from opendart_fss.models.financial import FinancialAccountListResponse
+
+pytest.importorskip("compression.zstd")
+
+from opendart_fss.cache import SQLiteCache, bsns_year_older_than
+
+BODY = (
+    b'{"status": "000", "message": "", '
+    b'"list": [{"rcept_no": "20240315000123", "account_nm": "\\uc790\\uc0b0"}]}'
+)
+
+
+class TestSQLiteCache:
+    """SQLiteCache 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_across_instances(self, tmp_path: Path) -> None:
+        """다른 인스턴스(프로세스)에서도 저장된 응답을 읽음."""
+        path = tmp_path / "cache.db"
+        writer = SQLiteCache(path)
+        value = FinancialAccountListResponse(status="000", message="")
+        await writer.set("k", value, BODY, None)
+
+        reader = SQLiteCache(path)
+        cached = await reader.get("k", FinancialAccountListResponse)
+        assert cached is not None
+        assert cached.items[0].account_nm == "자산"
+        writer.close()
+        reader.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self, tmp_path: Path) -> None:
+        """만료된 항목은 조회되지 않고 purge로 삭제."""
+        cache = SQLiteCache(tmp_path / "cache.db")
+        value = FinancialAccountListResponse(status="000", message="")
+        await cache.set("k", value, BODY, -1)
+        assert await cache.get("k", FinancialAccountListResponse) is None
+        await cache.purge_expired()
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_client_immutable_past_year(
+        self, tmp_path: Path, make_client: Callable[..., OpenDartClient]
+    ) -> None:
+        """오래된 사업연도 응답은 TTL 0이 아니면 만료 없이 재사용."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, content=BODY)
+
+        cache = SQLiteCache(
+            tmp_path / "cache.db", ttl=-1, immutable=[bsns_year_older_than(2)]
+        )
+        client = make_client(handler, cache=cache)
+        for _ in range(2):
+            await client.financial.get_single_account("00126380", "2015", "11011")
+        assert calls == 1
+
+        for _ in range(2):
+            await client.financial.get_single_account("00126380", "2099", "11011")
+        assert calls == 3
+        cache.close()